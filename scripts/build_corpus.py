@@ -0,0 +1,86 @@
+r"""
+Remplit un corpus de labyrinthes (.amzc) en générant les specs (algo, n, seed)
+sur un pool de processus. Les workers renvoient des blocs déjà compressés ;
+seul le processus principal écrit dans le fichier. Les specs déjà présentes
+sont ignorées : relancer la commande complète un corpus interrompu.
+
+Exemples :
+  python scripts/build_corpus.py --out data/outputs/mazes/corpus.amzc --algos kruskal eller --sizes 50 100 --seeds 1 200 --jobs 4
+  python scripts/internal_bench.py --sizes 50 100 --repeats 5 --corpus data/outputs/mazes/corpus.amzc
+"""
+import sys
+from pathlib import Path
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+import argparse
+import time
+
+from config import MAZES_DIR
+from corpus import MazeCorpus, CODECS, build_block
+from features.gen_many import GENERATORS
+
+# flush de l'index tous les FLUSH_EVERY blocs au moins, et au plus une fois par
+# quart de corpus ajouté : un arrêt brutal ne perd que les blocs non indexés, et
+# les index remplacés (laissés dans le fichier) restent ~160 octets par labyrinthe
+FLUSH_EVERY = 256
+
+
+def fill_corpus(path, specs, codec: str = "zlib", jobs: int = 1, verbose: bool = False) -> int:
+    """Ajoute au corpus les specs absentes ; renvoie le nombre de labyrinthes ajoutés."""
+    with MazeCorpus(path, "a", codec=codec) as corpus:
+        todo = [s for s in specs if s not in corpus]
+        if jobs > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            pool = ProcessPoolExecutor(max_workers=jobs)
+            blocks = pool.map(build_block, *zip(*todo), [corpus.codec] * len(todo),
+                              chunksize=max(1, len(todo) // (4 * jobs))) if todo else []
+        else:
+            pool = None
+            blocks = (build_block(*s, codec=corpus.codec) for s in todo)
+        try:
+            pending = 0
+            for k, (key, block) in enumerate(blocks, 1):
+                corpus.add_block(key, block)
+                pending += 1
+                if pending >= max(FLUSH_EVERY, len(corpus) // 4):
+                    corpus.flush()
+                    pending = 0
+                    if verbose:
+                        print(f"  {k}/{len(todo)}")
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return len(todo)
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Fill a .amzc maze corpus with (algo, n, seed) specs")
+    p.add_argument("--out", type=str, default=str(MAZES_DIR / "corpus.amzc"), help="Corpus path")
+    p.add_argument("--algos", nargs="+", choices=list(GENERATORS), default=list(GENERATORS),
+                   help="Generators (default: all)")
+    p.add_argument("--sizes", nargs="+", type=int, required=True, help="Sizes n (n x n)")
+    p.add_argument("--seeds", nargs=2, type=int, metavar=("FIRST", "LAST"), default=(1, 10),
+                   help="Inclusive seed range (default 1 10)")
+    p.add_argument("--codec", choices=list(CODECS), default="zlib",
+                   help="Block compression for a new corpus (default zlib)")
+    p.add_argument("--jobs", type=int, default=1, help="Worker processes (default 1)")
+    p.add_argument("--verbose", action="store_true", help="Print progress")
+    return p.parse_args()
+
+def main():
+    args = parse_args()
+    first, last = args.seeds
+    specs = [(algo, n, seed) for algo in args.algos for n in args.sizes
+             for seed in range(first, last + 1)]
+    t0 = time.perf_counter()
+    added = fill_corpus(args.out, specs, codec=args.codec, jobs=args.jobs, verbose=args.verbose)
+    dt = time.perf_counter() - t0
+    with MazeCorpus(args.out) as corpus:
+        total = len(corpus)
+    size = Path(args.out).stat().st_size
+    print(f"{added} labyrinthes ajoutés en {dt:.2f}s ({total} au total, {size / 1e6:.2f} Mo): {args.out}")
+
+if __name__ == "__main__":
+    main()
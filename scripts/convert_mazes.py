@@ -0,0 +1,32 @@
+r"""
+Conversion des labyrinthes entre le format texte (.txt) et le format binaire (.maze).
+
+Exemples :
+  python scripts/convert_mazes.py --to maze data/outputs/mazes/*.txt
+  python scripts/convert_mazes.py --to txt data/outputs/mazes/maze_30.maze
+"""
+import sys
+from pathlib import Path
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+import argparse
+
+from utils import txt_to_bin, bin_to_txt
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Convert mazes between .txt and binary .maze")
+    p.add_argument("--to", choices=["maze", "txt"], required=True, help="Target format")
+    p.add_argument("files", nargs="+", help="Source files (.txt for --to maze, .maze for --to txt)")
+    return p.parse_args()
+
+def main():
+    args = parse_args()
+    convert = txt_to_bin if args.to == "maze" else bin_to_txt
+    for src in args.files:
+        print(f"{src} -> {convert(src)}")
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,18 @@
 r"""
-Benchmark interne des ALGO EXISTANTS (aucun nouveau fichier d'algo) :
-- Générateurs : Backtracking, Kruskal
-- Solveurs    : Backtracking (récursif si ton fichier l'est), A*
+Benchmark interne de la matrice générateurs x solveurs :
+- Générateurs (--generators, clés de GENERATORS) : backtrack, backtrack_fast,
+  kruskal, eller, binary_tree, sidewinder (ces trois derniers vectorisés NumPy)
+  -> lignes role=generator
+- Solveurs : Backtracking (DFS), AStar, Bidirectional, chacun lancé sur le maze
+  de chaque générateur -> lignes role=solver, colonne gen_source = générateur
 - Mesures : temps (ns), mémoire (tracemalloc + optionnel psutil RSS)
 - Résilience : capture RecursionError / autres exceptions -> pas de crash
-- Paramètres : --min/--max (ou --sizes), --repeats, --reclimit, --verbose
+- Paramètres : --min/--max (ou --sizes), --repeats, --reclimit, --jobs, --verbose
+- Parallèle : --jobs N répartit les unités (size, seed, générateur) sur N processus
+- Corpus : --corpus FICHIER.amzc lit les mazes dans un corpus (role=corpus) au lieu de les générer
+- Cache : --cache [DOSSIER] mémoïse mazes et solutions (memo_cache) : un balayage répété
+  devient une suite de lectures de cache (statistiques hits/misses en fin de run) ;
+  lignes role=cache / cache_solver, jamais comparées à des mesures sans cache
 
 Exemples (PowerShell) :
   .venv\Scripts\activate
@@ -22,6 +30,9 @@ import csv
 import statistics
 import argparse
 import gc
+import json
+import platform
+from functools import partial
 
 try:
     import psutil
@@ -30,12 +41,20 @@ except Exception:
 
 from features.gen_backtrack import BacktrackingGenerator
 from features.gen_kruskal import KruskalGenerator
+from features.gen_eller import EllerGenerator
+from features.gen_binary_tree import BinaryTreeGenerator
+from features.gen_sidewinder import SidewinderGenerator
 from features.solve_backtrack import BacktrackingSolver
 from features.solve_astar import AStarSolver
+from features.solve_bidir import BidirectionalSolver
 from utils import Maze
+from corpus import MazeCorpus
+from memo_cache import MemoCache
+from config import CACHE_DIR
 
 OUT_CSV = Path("data/outputs/internal_bench.csv")
-OUT_CSV.parent.mkdir(parents=True, exist_ok=True)
+BASELINES_DIR = ROOT / "data" / "outputs" / "baselines"
+DEFAULT_THRESHOLD_PCT = 10.0
 
 # -----------------------
 # Mesures
@@ -83,16 +102,10 @@ def extract_maze_metrics(maze: Maze | None):
             "path_length": 0, "explored_count": 0,
             "visited_count": 0, "other_count": 0,
         }
-    grid = maze.grid
-    h = len(grid)
-    w = len(grid[0]) if h else 0
-    counts = {"#": 0, ".": 0, "o": 0, "*": 0, "other": 0}
-    for row in grid:
-        for ch in row:
-            if ch in counts:
-                counts[ch] += 1
-            else:
-                counts["other"] += 1
+    h, w = maze.ascii_height, maze.ascii_width
+    hist = maze.counts()
+    counts = {ch: hist.get(ch, 0) for ch in ("#", ".", "o", "*")}
+    counts["other"] = h * w - sum(counts.values())
     corridor_count = counts["."] + counts["o"] + counts["*"]
     return {
         "ascii_h": h,
@@ -112,103 +125,343 @@ def extract_maze_metrics(maze: Maze | None):
 def gen_backtrack_run(n: int, seed: int | None = None) -> Maze:
     return BacktrackingGenerator(n, seed=seed).generate()
 
+def gen_backtrack_fast_run(n: int, seed: int | None = None) -> Maze:
+    return BacktrackingGenerator(n, seed=seed, fast=True).generate()
+
 def gen_kruskal_run(n: int, seed: int | None = None) -> Maze:
     return KruskalGenerator(n, seed=seed).generate()
 
+def gen_eller_run(n: int, seed: int | None = None) -> Maze:
+    return EllerGenerator(n, seed=seed).generate()
+
+def gen_binary_tree_run(n: int, seed: int | None = None) -> Maze:
+    return BinaryTreeGenerator(n, seed=seed).generate()
+
+def gen_sidewinder_run(n: int, seed: int | None = None) -> Maze:
+    return SidewinderGenerator(n, seed=seed).generate()
+
 def solve_backtrack_run(maze: Maze) -> Maze:
     return BacktrackingSolver().solve(maze)
 
 def solve_astar_run(maze: Maze) -> Maze:
     return AStarSolver().solve(maze)
 
+def solve_bidir_run(maze: Maze) -> Maze:
+    return BidirectionalSolver().solve(maze)
+
 
 # -----------------------
 # Orchestration
 # -----------------------
-def run_one(size: int, seed: int, repeats: int, verbose: bool = False):
+GENERATORS = [
+    ("backtrack", "Backtracking", gen_backtrack_run),
+    ("kruskal",   "Kruskal",     gen_kruskal_run),
+    ("eller",     "Eller",       gen_eller_run),
+    ("binary_tree", "BinaryTree", gen_binary_tree_run),
+    ("sidewinder",  "Sidewinder", gen_sidewinder_run),
+    ("backtrack_fast", "BacktrackingFast", gen_backtrack_fast_run),
+]
+
+SOLVERS = [
+    ("Backtracking",  solve_backtrack_run),
+    ("AStar",         solve_astar_run),
+    ("Bidirectional", solve_bidir_run),
+]
+
+# classes derrière les wrappers (clés du cache : classe + VERSION)
+GENERATOR_CLASSES = {
+    "backtrack": BacktrackingGenerator,
+    "kruskal":   KruskalGenerator,
+    "eller":     EllerGenerator,
+    "binary_tree": BinaryTreeGenerator,
+    "sidewinder":  SidewinderGenerator,
+    "backtrack_fast": partial(BacktrackingGenerator, fast=True),
+}
+SOLVER_CLASSES = {
+    "Backtracking":  BacktrackingSolver,
+    "AStar":         AStarSolver,
+    "Bidirectional": BidirectionalSolver,
+}
+
+
+def _failed_measure(error: str) -> dict:
+    return {"ok": 0, "error": error, "time_ns": 0,
+            "tracemalloc_peak_bytes": 0, "rss_delta_bytes": None, "result": None}
+
+
+_CORPORA: dict[str, MazeCorpus] = {}
+_MEMOS: dict[str, MemoCache] = {}
+
+
+def _open_corpus(path: str) -> MazeCorpus:
+    """Corpus ouvert une seule fois par processus (index chargé une fois)."""
+    corpus = _CORPORA.get(path)
+    if corpus is None:
+        corpus = _CORPORA[path] = MazeCorpus(path)
+    return corpus
+
+
+def _memo(cache_dir: str) -> MemoCache:
+    """Cache mémoïsé par processus (niveau disque partagé entre les workers)."""
+    memo = _MEMOS.get(cache_dir)
+    if memo is None:
+        memo = _MEMOS[cache_dir] = MemoCache(disk_dir=cache_dir)
+    return memo
+
+
+def run_unit(size: int, seed: int, repeat: int, gen_key: str, verbose: bool = False,
+             corpus: str | None = None, cache: str | None = None):
     """
-    Pour une taille donnée :
-      - Génère 'repeats' mazes via Backtracking ET 'repeats' mazes via Kruskal
-      - Résout chaque maze généré (de chaque source) avec BacktrackingSolver & A*
-    Renvoie une liste de lignes (dict) pour CSV.
+    Unité de travail indépendante (exécutable dans un worker) :
+    génère UN maze (size, seed, générateur) puis le résout avec chaque solveur.
+    Avec `corpus`, le maze (gen_key, size, seed) est lu dans le corpus au lieu
+    d'être généré : la ligne mesure alors la lecture (role=corpus).
+    Avec `cache` (dossier), génération et résolutions passent par MemoCache :
+    les lignes (role=cache / cache_solver) mesurent alors des lectures de cache.
+    Chaque mesure (temps + tracemalloc) est faite dans le processus qui exécute l'unité.
+    Renvoie (ligne générateur, [lignes solveur] ou None si la génération a échoué).
     """
-    rows = []
+    _, gen_name, gen_fn = next(g for g in GENERATORS if g[0] == gen_key)
+    if corpus:
+        if verbose:
+            print(f"  [n={size} r={repeat}] Lecture corpus {gen_name} ...")
+        store = _open_corpus(corpus)
+        m = measure_fn(lambda: store.get(gen_key, size, seed))
+    else:
+        if verbose:
+            print(f"  [n={size} r={repeat}] Génération {gen_name} ...")
+        if cache:
+            memo, gen_cls = _memo(cache), GENERATOR_CLASSES[gen_key]
+            m = measure_fn(lambda: memo.maze(gen_cls(size, seed=seed)))
+        else:
+            m = measure_fn(lambda: gen_fn(size, seed))
+    maze = m["result"] if m["ok"] else None
+    gen_row = {
+        "size": size, "seed": seed, "role": "corpus" if corpus else "cache" if cache else "generator",
+        "algo": gen_name,
+        "repeat": repeat, "ok": m["ok"], "error": m["error"],
+        "time_ns": m["time_ns"],
+        "tracemalloc_peak_bytes": m["tracemalloc_peak_bytes"],
+        "rss_delta_bytes": m["rss_delta_bytes"],
+        # Pour les lignes générateurs, on peut renseigner gen_source=algo pour cohérence/filtrage
+        "gen_source": gen_name,
+        **extract_maze_metrics(maze),
+    }
+    if maze is None:
+        return gen_row, None
+
+    solver_rows = []
+    for solver_name, solver_fn in SOLVERS:
+        if verbose:
+            print(f"  [n={size} r={repeat}] Résolution {solver_name} sur gen_source={gen_name} ...")
+        # important: .copy() pour ne pas réutiliser une grille déjà marquée
+        if cache:
+            memo, solver_cls = _memo(cache), SOLVER_CLASSES[solver_name]
+            sm = measure_fn(lambda: memo.solve(solver_cls(), maze.copy()))
+        else:
+            sm = measure_fn(lambda: solver_fn(maze.copy()))
+        solver_rows.append(_solver_row(size, seed, repeat, solver_name, gen_name, sm,
+                                       sm["result"] if sm["ok"] else None,
+                                       role="cache_solver" if cache else "solver"))
+    return gen_row, solver_rows
 
-    # ----- Génération : on collecte TOUTES les instances pour chaque générateur -----
-    gen_sets = {
-        "Backtracking": [],  # liste de Maze (ou None si fail)
-        "Kruskal": []
+
+def _solver_row(size, seed, repeat, solver_name, gen_name, m, solved, role="solver"):
+    return {
+        "size": size, "seed": seed, "role": role, "algo": solver_name,
+        "repeat": repeat, "ok": m["ok"], "error": m["error"],
+        "time_ns": m["time_ns"],
+        "tracemalloc_peak_bytes": m["tracemalloc_peak_bytes"],
+        "rss_delta_bytes": m["rss_delta_bytes"],
+        "gen_source": gen_name,   # <- NOUVELLE COLONNE CLEF
+        **extract_maze_metrics(solved),
     }
 
-    for gen_key, gen_name, gen_fn in [
-        ("backtrack", "Backtracking", gen_backtrack_run),
-        ("kruskal",   "Kruskal",     gen_kruskal_run),
-    ]:
-        for r in range(repeats):
-            if verbose:
-                print(f"  [n={size} r={r+1}] Génération {gen_name} ...")
-            m = measure_fn(lambda: gen_fn(size, seed + r))
-            maze = m["result"] if m["ok"] else None
-            metrics = extract_maze_metrics(maze)
-
-            # Ligne "generator"
-            rows.append({
-                "size": size, "seed": seed + r, "role": "generator", "algo": gen_name,
-                "repeat": r + 1, "ok": m["ok"], "error": m["error"],
-                "time_ns": m["time_ns"],
-                "tracemalloc_peak_bytes": m["tracemalloc_peak_bytes"],
-                "rss_delta_bytes": m["rss_delta_bytes"],
-                # Pour les lignes générateurs, on peut renseigner gen_source=algo pour cohérence/filtrage
-                "gen_source": gen_name,
-                **metrics,
-            })
-
-            gen_sets[gen_name].append(maze if m["ok"] else None)
-
-    # ----- Résolution : pour chaque source de génération, chaque solveur, chaque run -----
-    for gen_source_name, maze_list in gen_sets.items():
-        # S'il n'y a aucune instance OK dans cette source, on passe (rien à résoudre)
-        any_ok = any(mz is not None for mz in maze_list)
-        if not any_ok:
-            if verbose:
-                print(f"  [n={size}] Pas de maze valide pour gen_source={gen_source_name} -> skip solveurs.")
-            continue
 
-        for solver_name, solver_fn in [("Backtracking", solve_backtrack_run), ("AStar", solve_astar_run)]:
-            for r in range(repeats):
-                if verbose:
-                    print(f"  [n={size} r={r+1}] Résolution {solver_name} sur gen_source={gen_source_name} ...")
+def _units(size: int, seed: int, repeats: int, generators: list[str] | None = None):
+    """Unités (size, seed, repeat, gen_key) d'une taille, dans l'ordre canonique."""
+    return [(size, seed + r, r + 1, key)
+            for key, _, _ in GENERATORS if generators is None or key in generators
+            for r in range(repeats)]
+
 
-                base_maze = maze_list[r] if r < len(maze_list) else None
-                if base_maze is None:
+def assemble_rows(units, results):
+    """
+    Fusionne les résultats d'unités (dans l'ordre de `units`) en lignes CSV,
+    dans l'ordre historique : générateurs (par algo, par repeat), puis pour chaque
+    source de génération, chaque solveur, chaque repeat.
+    """
+    rows = [gen_row for gen_row, _ in results]
+    by_source: dict[str, list] = {}
+    for (size, seed, repeat, gen_key), (gen_row, solver_rows) in zip(units, results):
+        by_source.setdefault(gen_row["algo"], []).append((size, seed, repeat, solver_rows))
+
+    for gen_name, entries in by_source.items():
+        # S'il n'y a aucune instance OK dans cette source, on passe (rien à résoudre)
+        if all(solver_rows is None for *_, solver_rows in entries):
+            continue
+        for k, (solver_name, _) in enumerate(SOLVERS):
+            for size, seed, repeat, solver_rows in entries:
+                if solver_rows is None:
                     # run de génération a échoué → ligne solver en échec explicite
-                    m = {"ok": 0, "error": "NoMazeToSolve", "time_ns": 0,
-                         "tracemalloc_peak_bytes": 0, "rss_delta_bytes": None, "result": None}
-                    metrics = extract_maze_metrics(None)
+                    rows.append(_solver_row(size, seed, repeat, solver_name, gen_name,
+                                            _failed_measure("NoMazeToSolve"), None))
                 else:
-                    # important: .copy() pour ne pas réutiliser une grille déjà marquée
-                    m = measure_fn(lambda: solver_fn(base_maze.copy()))
-                    metrics = extract_maze_metrics(m["result"] if m["ok"] else None)
-
-                rows.append({
-                    "size": size, "seed": seed + r, "role": "solver", "algo": solver_name,
-                    "repeat": r + 1, "ok": m["ok"], "error": m["error"],
-                    "time_ns": m["time_ns"],
-                    "tracemalloc_peak_bytes": m["tracemalloc_peak_bytes"],
-                    "rss_delta_bytes": m["rss_delta_bytes"],
-                    "gen_source": gen_source_name,   # <- NOUVELLE COLONNE CLEF
-                    **metrics,
-                })
+                    rows.append(solver_rows[k])
+    return rows
 
+
+def run_one(size: int, seed: int, repeats: int, verbose: bool = False,
+            generators: list[str] | None = None, corpus: str | None = None,
+            cache: str | None = None):
+    """
+    Pour une taille donnée :
+      - Génère 'repeats' mazes via chaque générateur sélectionné (Backtracking, Kruskal, Eller, ...)
+      - Résout chaque maze généré (de chaque source) avec chaque solveur de SOLVERS
+    Renvoie une liste de lignes (dict) pour CSV.
+    """
+    units = _units(size, seed, repeats, generators)
+    return assemble_rows(units, [run_unit(*u, verbose=verbose, corpus=corpus, cache=cache)
+                                 for u in units])
+
+
+def _init_worker(reclimit: int) -> None:
+    sys.setrecursionlimit(reclimit)
+
+
+def run_parallel(sizes: list[int], seed: int, repeats: int, jobs: int,
+                 generators: list[str] | None = None, reclimit: int = 1000,
+                 verbose: bool = False, corpus: str | None = None, cache: str | None = None):
+    """
+    Répartit les unités (size, seed, generator) de toutes les tailles sur un pool
+    de `jobs` processus. Les graines ne dépendent que de l'unité (seed + repeat) ;
+    les résultats sont remis dans l'ordre canonique : même CSV qu'en séquentiel,
+    seuls les temps changent.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    per_size = [_units(n, seed, repeats, generators) for n in sizes]
+    flat = [u for units in per_size for u in units]
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(reclimit,)) as pool:
+        futures = [pool.submit(run_unit, *u, corpus=corpus, cache=cache) for u in flat]
+        results = []
+        for u, fut in zip(flat, futures):
+            results.append(fut.result())
+            if verbose:
+                print(f"  [n={u[0]} r={u[2]}] {u[3]} terminé")
+
+    rows, pos = [], 0
+    for units in per_size:
+        rows.extend(assemble_rows(units, results[pos:pos + len(units)]))
+        pos += len(units)
     return rows
 
 
 
+# -----------------------
+# Baselines & régressions
+# -----------------------
+def stat_key(row: dict) -> str:
+    return f"{row['size']}|{row['role']}|{row['algo']}|{row['gen_source']}"
+
+
+def summarize(rows) -> dict:
+    """
+    Statistiques de temps par (size, role, algo, gen_source) : médiane, IQR
+    (Q3 - Q1) et nombre d'échantillons des runs OK, en ns, plus le nombre de
+    runs en échec. Un groupe sans aucun run OK est gardé (médiane None) pour
+    que la comparaison voie un algo qui échoue.
+    """
+    groups: dict[str, list[int]] = {}
+    fails: dict[str, int] = {}
+    for r in rows:
+        key = stat_key(r)
+        groups.setdefault(key, [])
+        fails[key] = fails.get(key, 0) + (r["ok"] != 1)
+        if r["ok"] == 1:
+            groups[key].append(r["time_ns"])
+    stats = {}
+    for key, times in groups.items():
+        if not times:
+            stats[key] = {"median_ns": None, "iqr_ns": 0, "n": 0, "fail": fails[key]}
+            continue
+        if len(times) > 1:
+            q1, _, q3 = statistics.quantiles(times, n=4, method="inclusive")
+        else:
+            q1 = q3 = times[0]
+        stats[key] = {"median_ns": int(statistics.median(times)),
+                      "iqr_ns": int(q3 - q1), "n": len(times), "fail": fails[key]}
+    return stats
+
+
+def baseline_path(name: str) -> Path:
+    """Nom simple -> data/outputs/baselines/<name>.json ; chemin explicite sinon."""
+    p = Path(name)
+    if p.suffix == ".json" or p.parent != Path("."):
+        return p
+    return BASELINES_DIR / f"{name}.json"
+
+
+def save_baseline(name: str, stats: dict, params: dict) -> Path:
+    path = baseline_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    doc = {
+        "name": path.stem,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "params": params,
+        "stats": stats,
+    }
+    path.write_text(json.dumps(doc, indent=2, sort_keys=True), encoding="utf-8")
+    return path
+
+
+def load_baseline(name: str) -> dict:
+    path = baseline_path(name)
+    if not path.exists():
+        raise FileNotFoundError(f"Baseline introuvable: {path}")
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def compare_stats(current: dict, baseline: dict, threshold_pct: float = DEFAULT_THRESHOLD_PCT):
+    """
+    Compare deux jeux de statistiques, groupe par groupe de la baseline.
+    Régression (champ "reason") :
+    - "missing" : groupe de la baseline absent du run courant
+    - "failing" : groupe du run courant avec des runs en échec
+    - "slower"  : médiane en hausse de plus de `threshold_pct` % ET écart au-delà
+      du bruit mesuré (la plus grande des deux IQR)
+    Renvoie la liste des régressions (dict clé / raison / médianes / variation %).
+    """
+    regressions = []
+    for key in sorted(baseline):
+        base = baseline[key]
+        if key not in current:
+            regressions.append({"key": key, "reason": "missing", "baseline_ns": base["median_ns"]})
+            continue
+        cur = current[key]
+        if cur.get("fail", 0):
+            regressions.append({"key": key, "reason": "failing", "fail": cur["fail"],
+                                "baseline_ns": base["median_ns"], "current_ns": cur["median_ns"]})
+            continue
+        if not base["median_ns"]:
+            continue  # rien de mesuré dans la baseline : pas de référence de temps
+        delta = cur["median_ns"] - base["median_ns"]
+        pct = 100.0 * delta / base["median_ns"]
+        noise = max(cur["iqr_ns"], base["iqr_ns"])
+        if pct > threshold_pct and delta > noise:
+            regressions.append({"key": key, "reason": "slower", "baseline_ns": base["median_ns"],
+                                "current_ns": cur["median_ns"], "pct": round(pct, 1)})
+    return regressions
+
+
 # -----------------------
 # CLI & driver
 # -----------------------
-def parse_args():
-    p = argparse.ArgumentParser(description="Internal benchmark for amazing-mazes (existing algos only)")
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description="Internal benchmark for amazing-mazes (generator x solver matrix)")
     # soit --sizes explicites...
     p.add_argument("--sizes", nargs="+", type=int,
                    help="Explicit sizes n to test (n x n). If omitted, uses --min..--max.")
@@ -218,13 +471,27 @@ def parse_args():
 
     p.add_argument("--repeats", type=int, default=5, help="Repeats per test (default 5)")
     p.add_argument("--seed", type=int, default=1, help="Seed for RNG (base, increment per repeat)")
+    p.add_argument("--generators", nargs="+", choices=[g[0] for g in GENERATORS],
+                   help="Generators to run (default: all)")
+    p.add_argument("--jobs", type=int, default=1,
+                   help="Worker processes (default 1 = sequential in-process run)")
+    p.add_argument("--corpus", metavar="FILE",
+                   help="Read mazes (algo, n, seed) from a .amzc corpus instead of generating them")
+    p.add_argument("--cache", nargs="?", const=str(CACHE_DIR), metavar="DIR",
+                   help=f"Memoize mazes and solutions (memory LRU + disk store, default {CACHE_DIR})")
     p.add_argument("--reclimit", type=int, default=1000, help="sys.setrecursionlimit value")
     p.add_argument("--out", type=str, default=str(OUT_CSV), help="Output CSV path")
     p.add_argument("--verbose", action="store_true", help="Print detailed progress")
-    return p.parse_args()
-
-def main():
-    args = parse_args()
+    p.add_argument("--save-baseline", metavar="NAME",
+                   help="Record median/IQR per size/role/algo/gen_source as a named JSON baseline")
+    p.add_argument("--compare", metavar="NAME",
+                   help="Compare against a saved baseline; exit code 1 on regressions, missing or failing groups")
+    p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD_PCT,
+                   help=f"Regression threshold in %% of the baseline median (default {DEFAULT_THRESHOLD_PCT})")
+    return p.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
     # Fixe la limite de récursion pour les ALGO récursifs existants (ex: BacktrackingSolver)
     sys.setrecursionlimit(args.reclimit)
 
@@ -232,11 +499,19 @@ def main():
     sizes = args.sizes if args.sizes else list(range(args.min, args.max + 1))
 
     all_rows = []
-    for n in sizes:
+    if args.jobs > 1:
         if args.verbose:
-            print(f"Running size={n} (repeats={args.repeats}) ...")
-        rows = run_one(n, args.seed, args.repeats, verbose=args.verbose)
-        all_rows.extend(rows)
+            print(f"Running sizes={sizes[0]}..{sizes[-1]} (repeats={args.repeats}, jobs={args.jobs}) ...")
+        all_rows = run_parallel(sizes, args.seed, args.repeats, args.jobs,
+                                generators=args.generators, reclimit=args.reclimit,
+                                verbose=args.verbose, corpus=args.corpus, cache=args.cache)
+    else:
+        for n in sizes:
+            if args.verbose:
+                print(f"Running size={n} (repeats={args.repeats}) ...")
+            rows = run_one(n, args.seed, args.repeats, verbose=args.verbose,
+                           generators=args.generators, corpus=args.corpus, cache=args.cache)
+            all_rows.extend(rows)
 
     # write CSV
     fieldnames = [
@@ -275,6 +550,40 @@ def main():
         else:
             print(f" size={size:3d} role={role:9s} algo={algo:12s} OK=0 FAIL={len(fails):2d} (no timing)")
     print(f"\nCSV saved to {outp}")
+    if args.cache and args.cache in _MEMOS:  # en parallèle, les stats restent dans les workers
+        print(f"Cache: {_MEMOS[args.cache].stats()}")
+
+    stats = summarize(all_rows)
+    if args.save_baseline:
+        params = {"sizes": sizes, "repeats": args.repeats, "seed": args.seed,
+                  "generators": args.generators, "jobs": args.jobs, "corpus": args.corpus,
+                  "cache": args.cache}
+        print(f"Baseline saved to {save_baseline(args.save_baseline, stats, params)}")
+    if args.compare:
+        baseline = load_baseline(args.compare)
+        base_cached = bool(baseline.get("params", {}).get("cache"))
+        if base_cached != bool(args.cache):  # lectures de cache vs vrai travail : pas comparables
+            print(f"\nCompare refused: baseline '{baseline['name']}' was recorded "
+                  f"{'with' if base_cached else 'without'} --cache, this run {'with' if args.cache else 'without'} it.")
+            return 2
+        regressions = compare_stats(stats, baseline["stats"], args.threshold)
+        common = len(stats.keys() & baseline["stats"].keys())
+        print(f"\nCompare vs baseline '{baseline['name']}' ({common} groups, threshold {args.threshold}%):")
+        for reg in regressions:
+            if reg["reason"] == "missing":
+                print(f" REGRESSION {reg['key']}: missing from this run")
+            elif reg["reason"] == "failing":
+                print(f" REGRESSION {reg['key']}: {reg['fail']} failed run(s)")
+            else:
+                print(f" REGRESSION {reg['key']}: {reg['baseline_ns'] / 1e6:.3f}ms -> "
+                      f"{reg['current_ns'] / 1e6:.3f}ms (+{reg['pct']}%)")
+        if common == 0:
+            print(" FAIL, no group in common with the baseline: nothing was compared")
+            return 1
+        if regressions:
+            return 1
+        print(" OK, no regression")
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,177 @@
+r"""
+Test de charge du service local (src/service.py) : `clients` connexions
+concurrentes envoient au total `requests` requêtes tirées dans un mélange
+d'opérations, une à la fois par connexion (boucle fermée). Un 429 n'est pas
+une requête traitée : elle est renvoyée après une attente exponentielle avec
+gigue (--retries fois au plus), puis comptée comme abandonnée. Affiche la
+charge offerte (tentatives) et admise (tentatives hors 429) séparément, le
+débit des réponses 200, leurs latences p50 / p95 / p99 de bout en bout
+(attentes comprises) et le nombre de 408 / abandons.
+
+Sans --port / --unix, le service est lancé dans le processus (port libre).
+
+Exemples :
+  python scripts/load_test.py --clients 16 --requests 400 --workers 4 --queue 8
+  python src/service.py --port 8765 &  python scripts/load_test.py --port 8765 --mix generate=1 solve=3
+"""
+import sys
+from pathlib import Path
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter
+from typing import Dict, List
+
+from service import MazeService, connect, request
+
+OPS = ("generate", "solve", "export")
+
+
+def make_request(op: str, rng: random.Random, algos: List[str], sizes: List[int], seeds: int) -> dict:
+    """Requête aléatoire ; seeds limite le nombre de labyrinthes distincts."""
+    spec = [rng.choice(algos), rng.choice(sizes), rng.randrange(seeds)]
+    if op == "generate":
+        return {"op": op, "algo": spec[0], "n": spec[1], "seed": spec[2]}
+    if op == "solve":
+        return {"op": op, "solver": "astar", "spec": spec}
+    return {"op": op, "spec": spec, "cell_size": 2}
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Percentile (rang le plus proche) d'une liste triée ; 0.0 si vide."""
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, round(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+async def run_load(host: str, port: int, unix_path: str | None, clients: int, total: int,
+                   mix: Dict[str, int], algos: List[str], sizes: List[int], seeds: int,
+                   seed: int = 0, retries: int = 5, backoff: float = 0.05) -> dict:
+    """
+    Lance la charge et renvoie le résumé : tentatives offertes / admises,
+    débit, percentiles en ms, statut final par requête (429 = abandonnée).
+    """
+    rng = random.Random(seed)
+    jitter = random.Random(seed + 1)
+    ops = rng.choices(list(mix), weights=list(mix.values()), k=total)
+    plan = [make_request(op, rng, algos, sizes, seeds) for op in ops]
+    queue: asyncio.Queue = asyncio.Queue()
+    for i, req in enumerate(plan):
+        queue.put_nowait({"id": i, **req})
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    attempts = Counter()
+
+    async def client() -> None:
+        reader, writer = await connect(host, port, unix_path)
+        try:
+            while not queue.empty():
+                req = queue.get_nowait()
+                t0 = time.perf_counter()
+                for attempt in range(retries + 1):
+                    head, _ = await request(reader, writer, req)
+                    attempts["offered"] += 1
+                    if head["status"] != 429:
+                        attempts["admitted"] += 1
+                        break
+                    if attempt < retries:
+                        attempts["retried"] += 1
+                        await asyncio.sleep(backoff * 2 ** attempt * jitter.uniform(0.5, 1.5))
+                statuses[head["status"]] += 1
+                if head["status"] == 200:
+                    latencies.append((time.perf_counter() - t0) * 1000)
+        finally:
+            writer.close()
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    elapsed = time.perf_counter() - t0
+    latencies.sort()
+    return {
+        "requests": total, "elapsed_s": elapsed, "throughput": statuses[200] / elapsed,
+        "offered": attempts["offered"], "admitted": attempts["admitted"], "retried": attempts["retried"],
+        "offered_rate": attempts["offered"] / elapsed, "admitted_rate": attempts["admitted"] / elapsed,
+        "p50_ms": percentile(latencies, 50), "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99), "statuses": dict(statuses),
+    }
+
+
+async def run_local(args, mix: Dict[str, int]) -> dict:
+    """Service lancé dans le processus le temps de la mesure."""
+    service = MazeService(port=0, workers=args.workers, queue_size=args.queue, timeout=args.timeout)
+    await service.start()
+    try:
+        return await run_load("127.0.0.1", service.port, None, args.clients, args.requests, mix,
+                              args.algos, args.sizes, args.seeds, args.seed, args.retries, args.backoff)
+    finally:
+        await service.close()
+
+
+def parse_mix(items: List[str]) -> Dict[str, int]:
+    mix = {}
+    for item in items:
+        op, _, weight = item.partition("=")
+        if op not in OPS or not weight.isdigit():
+            raise argparse.ArgumentTypeError(f"--mix attend op=poids avec op parmi {', '.join(OPS)}: {item!r}")
+        mix[op] = int(weight)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("--mix : au moins un poids > 0")
+    return mix
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Load test for the local maze service")
+    p.add_argument("--host", default="127.0.0.1", help="Service host (with --port)")
+    p.add_argument("--port", type=int, help="Connect to a running service instead of starting one")
+    p.add_argument("--unix", metavar="PATH", help="Connect to a running service on a Unix socket")
+    p.add_argument("--clients", type=int, default=8, help="Concurrent connections")
+    p.add_argument("--requests", type=int, default=200, help="Total requests")
+    p.add_argument("--mix", nargs="+", default=["generate=2", "solve=2", "export=1"],
+                   help="Op weights, e.g. generate=2 solve=2 export=1")
+    p.add_argument("--algos", nargs="+", default=["kruskal", "backtrack_fast"], help="Generators used")
+    p.add_argument("--sizes", nargs="+", type=int, default=[50, 100], help="Maze sizes used")
+    p.add_argument("--seeds", type=int, default=1000, help="Distinct seeds per (algo, size)")
+    p.add_argument("--seed", type=int, default=0, help="Seed of the request plan")
+    p.add_argument("--retries", type=int, default=5, help="Retries of a request answered 429 (default 5)")
+    p.add_argument("--backoff", type=float, default=0.05,
+                   help="First retry delay in seconds, doubled each retry with jitter (default 0.05)")
+    # service lancé en local (sans --port / --unix)
+    p.add_argument("--workers", type=int, default=2, help="Local service: worker processes")
+    p.add_argument("--queue", type=int, default=16, help="Local service: queue size before 429")
+    p.add_argument("--timeout", type=float, default=30.0, help="Local service: per-request timeout (s)")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    try:
+        mix = parse_mix(args.mix)
+    except argparse.ArgumentTypeError as e:
+        sys.exit(str(e))
+    if args.port is None and args.unix is None:
+        print(f"Service local : {args.workers} workers, file {args.queue}, délai {args.timeout}s")
+        summary = asyncio.run(run_local(args, mix))
+    else:
+        summary = asyncio.run(run_load(args.host, args.port, args.unix, args.clients, args.requests, mix,
+                                       args.algos, args.sizes, args.seeds, args.seed,
+                                       args.retries, args.backoff))
+    st = summary["statuses"]
+    print(f"{summary['requests']} requêtes, {args.clients} clients, {summary['elapsed_s']:.2f}s "
+          f"-> {summary['throughput']:.1f} req/s (réussies)")
+    print(f"charge offerte {summary['offered']} tentatives ({summary['offered_rate']:.1f}/s), "
+          f"admise {summary['admitted']} ({summary['admitted_rate']:.1f}/s), "
+          f"{summary['offered'] - summary['admitted']} refus 429, {summary['retried']} renvois")
+    print(f"latence p50={summary['p50_ms']:.1f}ms p95={summary['p95_ms']:.1f}ms p99={summary['p99_ms']:.1f}ms "
+          f"(bout en bout, attentes comprises)")
+    print(f"statut final : 200={st.get(200, 0)} 408={st.get(408, 0)} abandonnées (429)={st.get(429, 0)} "
+          f"autres={sum(v for k, v in st.items() if k not in (200, 429, 408))}")
+
+
+if __name__ == "__main__":
+    main()
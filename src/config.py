@@ -11,7 +11,6 @@ DATA_DIR = ROOT / "data"
 MAZES_DIR = DATA_DIR / "outputs" / "mazes"
 SOLUTIONS_DIR = DATA_DIR / "outputs" / "solutions"
 IMAGES_DIR = DATA_DIR / "outputs" / "images"
+CACHE_DIR = DATA_DIR / "outputs" / "cache"
 
-# s'assurer que les dossiers existent
-for p in (MAZES_DIR, SOLUTIONS_DIR, IMAGES_DIR):
-    p.mkdir(parents=True, exist_ok=True)
+# aucun mkdir à l'import : chaque écriture crée son dossier parent au besoin
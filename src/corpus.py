@@ -0,0 +1,254 @@
+# src/corpus.py
+"""
+Corpus multi-labyrinthes en un seul fichier (.amzc).
+
+Format (little-endian) :
+- en-tête 16 octets : magic b"AMZC", version, codec (0 = zlib, 1 = lzma)
+- blocs : murs packés d'un WallSet (2 bits par cellule) compressés, l'un après l'autre
+- index : une entrée de 40 octets par labyrinthe (algo, n, seed, offset, taille)
+- pied 16 octets : offset de l'index, nombre d'entrées, magic b"AMZI"
+
+L'index est chargé en dict à l'ouverture : accès direct O(1) par (algo, n, seed),
+un seek + une lecture + une décompression par labyrinthe.
+
+Ajout (mode "a") : les nouveaux blocs s'écrivent après le pied courant, puis
+flush() / close() écrit le nouvel index complet et son pied en fin de fichier.
+Le dernier index valide n'est jamais écrasé avant d'être remplacé : après un
+arrêt brutal, la lecture retrouve le dernier pied valide (recherche arrière)
+et seuls les blocs non indexés sont perdus. Contrepartie : chaque flush laisse
+l'index précédent en place, inutilisé (40 octets par entrée) ; espacer les
+flush en proportion de la taille de l'index borne ce surcoût (build_corpus).
+"""
+from __future__ import annotations
+import lzma
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+from config import MAZES_DIR
+from utils import Maze
+from wallset import WallSet
+
+CORPUS_MAGIC = b"AMZC"
+CORPUS_VERSION = 1
+INDEX_MAGIC = b"AMZI"
+_HEADER = struct.Struct("<4sHB9x")     # 16 octets
+_ENTRY = struct.Struct("<16sIqQI")     # algo, n, seed, offset, taille : 40 octets
+_FOOTER = struct.Struct("<QI4s")       # offset index, nombre d'entrées, magic : 16 octets
+CODECS = {"zlib": 0, "lzma": 1}
+
+Key = Tuple[str, int, int]
+
+
+def compress_walls(walls: WallSet, codec: str = "zlib") -> bytes:
+    """Bloc compressé des murs packés d'un WallSet."""
+    if codec == "zlib":
+        return zlib.compress(bytes(walls.bits), 9)
+    if codec == "lzma":
+        return lzma.compress(bytes(walls.bits), preset=6)
+    raise ValueError(f"Codec inconnu: {codec!r} (attendu: {', '.join(CODECS)})")
+
+
+def _decompress(data: bytes, codec_id: int) -> bytes:
+    return zlib.decompress(data) if codec_id == 0 else lzma.decompress(data)
+
+
+def build_block(algo: str, n: int, seed: int, codec: str = "zlib") -> Tuple[Key, bytes]:
+    """Génère (algo, n, seed) et renvoie (clé, bloc compressé) — fonction de worker pour un pool."""
+    from features.gen_many import build_walls
+    return (algo, n, seed), compress_walls(build_walls((algo, n, seed)), codec)
+
+
+class MazeCorpus:
+    """
+    Archive de labyrinthes indexée par (algo, n, seed).
+    - mode "r" : lecture seule
+    - mode "a" : lecture + ajout (crée le fichier s'il n'existe pas, avec `codec`)
+
+        with MazeCorpus("mazes.amzc", "a") as corpus:
+            corpus.add_walls("kruskal", 50, 7, KruskalGenerator(50, seed=7).generate_walls())
+        maze = MazeCorpus("mazes.amzc").get("kruskal", 50, 7)
+    """
+    def __init__(self, path: str | Path, mode: str = "r", codec: str = "zlib"):
+        if mode not in ("r", "a"):
+            raise ValueError(f"Mode invalide: {mode!r} (attendu 'r' ou 'a')")
+        self.path = Path(path)
+        self.mode = mode
+        self.index: Dict[Key, Tuple[int, int]] = {}
+        self._dirty = False
+        if mode == "a" and not self.path.exists():
+            if codec not in CODECS:
+                raise ValueError(f"Codec inconnu: {codec!r} (attendu: {', '.join(CODECS)})")
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "wb") as f:
+                f.write(_HEADER.pack(CORPUS_MAGIC, CORPUS_VERSION, CODECS[codec]))
+                f.write(_FOOTER.pack(_HEADER.size, 0, INDEX_MAGIC))
+        self._f = open(self.path, "r+b" if mode == "a" else "rb")
+        self._read_index()
+
+    def _read_index(self) -> None:
+        f = self._f
+        try:
+            magic, version, codec_id = _HEADER.unpack(f.read(_HEADER.size))
+        except struct.error:
+            raise ValueError(f"Pas un corpus de labyrinthes: {self.path}") from None
+        if magic != CORPUS_MAGIC:
+            raise ValueError(f"Pas un corpus de labyrinthes: {self.path}")
+        if version != CORPUS_VERSION or codec_id not in CODECS.values():
+            raise ValueError(f"Version/codec de corpus non supporté: v{version}, codec {codec_id}")
+        self.codec_id = codec_id
+        self.codec = next(name for name, cid in CODECS.items() if cid == codec_id)
+        end = self._find_footer(f.seek(0, os.SEEK_END))
+        if end is None:
+            raise ValueError(f"Index de corpus absent ou corrompu: {self.path}")
+        f.seek(end - _FOOTER.size)
+        index_offset, count, _ = _FOOTER.unpack(f.read(_FOOTER.size))
+        f.seek(index_offset)
+        try:
+            for name, n, seed, offset, length in _ENTRY.iter_unpack(f.read(count * _ENTRY.size)):
+                self.index[(name.rstrip(b"\0").decode("ascii"), n, seed)] = (offset, length)
+        except (struct.error, UnicodeDecodeError):
+            raise ValueError(f"Index de corpus corrompu: {self.path}") from None
+        self._end = end  # les nouveaux blocs s'écrivent après le pied (fin d'un ajout interrompu écrasée)
+
+    def _valid_footer(self, end: int) -> bool:
+        """Un pied se termine en `end` et décrit un index qui le précède immédiatement."""
+        if end < _HEADER.size + _FOOTER.size:
+            return False
+        self._f.seek(end - _FOOTER.size)
+        index_offset, count, magic = _FOOTER.unpack(self._f.read(_FOOTER.size))
+        return (magic == INDEX_MAGIC and index_offset >= _HEADER.size
+                and index_offset + count * _ENTRY.size + _FOOTER.size == end)
+
+    def _find_footer(self, size: int, chunk: int = 1 << 20) -> int | None:
+        """
+        Fin du dernier pied valide : la fin du fichier en temps normal, sinon
+        (ajout interrompu avant l'écriture du nouvel index) recherche arrière
+        du magic d'index. None si aucun pied valide.
+        """
+        if self._valid_footer(size):
+            return size
+        f = self._f
+        hi = size
+        while hi > _HEADER.size:
+            lo = max(_HEADER.size, hi - chunk)
+            f.seek(lo)
+            data = f.read(hi - lo + len(INDEX_MAGIC) - 1)  # chevauchement : magic à cheval
+            k = data.rfind(INDEX_MAGIC)
+            while k >= 0:
+                if self._valid_footer(lo + k + len(INDEX_MAGIC)):
+                    return lo + k + len(INDEX_MAGIC)
+                k = data.rfind(INDEX_MAGIC, 0, k)
+            hi = lo
+        return None
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, key) -> bool:
+        return tuple(key) in self.index
+
+    def keys(self) -> Iterator[Key]:
+        return iter(self.index)
+
+    def get_walls(self, algo: str, n: int, seed: int) -> WallSet:
+        try:
+            offset, length = self.index[(algo, n, seed)]
+        except KeyError:
+            raise KeyError(f"Labyrinthe absent du corpus: {(algo, n, seed)}") from None
+        self._f.seek(offset)
+        bits = _decompress(self._f.read(length), self.codec_id)
+        return WallSet(n, bytearray(bits))
+
+    def get(self, algo: str, n: int, seed: int) -> Maze:
+        """Labyrinthe ASCII (2n+1)x(2n+1) reconstruit depuis ses murs."""
+        return self.get_walls(algo, n, seed).to_maze()
+
+    # ------------------------------------------------------------------
+    # Ajout
+    # ------------------------------------------------------------------
+    def add_block(self, key: Key, block: bytes) -> None:
+        """Ajoute un bloc déjà compressé (avec le codec du corpus), ex. produit par build_block."""
+        if self.mode != "a":
+            raise ValueError("Corpus ouvert en lecture seule (mode 'r').")
+        algo, n, seed = key
+        if len(algo.encode("ascii")) > 16:
+            raise ValueError(f"Nom d'algorithme trop long (16 octets max): {algo!r}")
+        if key in self.index:
+            raise ValueError(f"Labyrinthe déjà présent dans le corpus: {key}")
+        self._f.seek(self._end)
+        self._f.write(block)
+        self.index[(algo, n, seed)] = (self._end, len(block))
+        self._end += len(block)
+        self._dirty = True
+
+    def add_walls(self, algo: str, n: int, seed: int, walls: WallSet) -> None:
+        if walls.n != n:
+            raise ValueError(f"Taille incohérente: WallSet n={walls.n}, clé n={n}")
+        self.add_block((algo, n, seed), compress_walls(walls, self.codec))
+
+    def add(self, algo: str, seed: int, maze: Maze) -> None:
+        walls = WallSet.from_maze(maze)
+        self.add_walls(algo, walls.n, seed, walls)
+
+    def _write_index(self) -> None:
+        f = self._f
+        f.seek(self._end)
+        f.write(b"".join(_ENTRY.pack(algo.encode("ascii"), n, seed, offset, length)
+                         for (algo, n, seed), (offset, length) in self.index.items()))
+        f.write(_FOOTER.pack(self._end, len(self.index), INDEX_MAGIC))
+        f.truncate()
+        self._end = f.tell()  # le prochain ajout ne touche pas à cet index
+        self._dirty = False
+
+    def flush(self) -> None:
+        """Écrit l'index à jour (le fichier redevient lisible par d'autres lecteurs)."""
+        if self._dirty:
+            self._write_index()
+            self._f.flush()
+
+    def close(self) -> None:
+        if not self._f.closed:
+            self.flush()
+            self._f.close()
+
+    def __enter__(self) -> "MazeCorpus":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# ----------------------------------------------------------------------
+# Références "fichier.amzc:algo:n:seed" (menu, bench)
+# ----------------------------------------------------------------------
+CORPUS_SUFFIX = ".amzc"
+
+
+def parse_corpus_ref(ref: str) -> Tuple[Path, Key] | None:
+    """'corpus.amzc:kruskal:50:7' -> (chemin, ('kruskal', 50, 7)) ; None si ce n'est pas une référence."""
+    parts = ref.rsplit(":", 3)
+    if len(parts) != 4 or not parts[0].lower().endswith(CORPUS_SUFFIX):
+        return None
+    path, algo, n, seed = parts
+    try:
+        key = (algo, int(n), int(seed))
+    except ValueError:
+        return None
+    p = Path(path)
+    if not p.exists() and p.parent == Path("."):
+        p = MAZES_DIR / p.name
+    return p, key
+
+
+def load_corpus_ref(ref: str) -> Maze:
+    parsed = parse_corpus_ref(ref)
+    if parsed is None:
+        raise ValueError(f"Référence de corpus invalide: {ref!r} (attendu fichier.amzc:algo:n:seed)")
+    path, key = parsed
+    with MazeCorpus(path) as corpus:
+        return corpus.get(*key)
@@ -0,0 +1,185 @@
+# src/delta_trace.py
+"""
+Traces binaires d'événements "delta" (ligne, colonne, nouveau caractère)
+émis par les générateurs et solveurs via leur callback on_delta.
+
+Format .mtrace (little-endian) :
+- en-tête 32 octets : magic b"AMZT", version, H, W, nombre d'événements
+- grille initiale : H * W octets ASCII (même table que Maze.cells)
+- événements : enregistrements packés int32 ligne, int32 colonne, uint8 caractère (9 octets)
+
+Le replayer ouvre les événements en numpy.memmap : seek / avance rapide /
+lecture à n'importe quelle vitesse sans relancer l'algorithme.
+"""
+from __future__ import annotations
+from array import array
+from pathlib import Path
+from typing import Callable, Iterator, Tuple
+import os, struct, time
+import numpy as np
+from utils import Maze
+
+TRACE_MAGIC = b"AMZT"
+TRACE_VERSION = 1
+_TRACE_HEADER = struct.Struct("<4sH2xIIq8x")
+TRACE_HEADER_SIZE = _TRACE_HEADER.size  # 32 octets
+RECORD_DTYPE = np.dtype([("row", "<i4"), ("col", "<i4"), ("ch", "u1")])  # packé : 9 octets
+
+
+class TraceRecorder:
+    """
+    Callback on_delta qui écrit les événements dans un fichier trace.
+    Les événements sont tamponnés puis écrits par blocs ; close() (ou la sortie
+    du bloc with) vide le tampon et inscrit le nombre d'événements dans l'en-tête.
+
+        with TraceRecorder("gen.mtrace", Maze.empty_from_n(n)) as rec:
+            BacktrackingGenerator(n).generate(on_delta=rec)
+    """
+    def __init__(self, filename: str | Path, initial: Maze, chunk: int = 1 << 16):
+        self.path = Path(filename)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        cells = np.ascontiguousarray(initial.cells, dtype=np.uint8)
+        self.height, self.width = cells.shape
+        self.chunk = chunk
+        self.count = 0
+        self._f = open(self.path, "wb")
+        self._f.write(_TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, self.height, self.width, 0))
+        cells.tofile(self._f)
+        self._rows = array("i")
+        self._cols = array("i")
+        self._chars = bytearray()
+
+    def __call__(self, r: int, c: int, ch: str) -> None:
+        self._rows.append(r)
+        self._cols.append(c)
+        self._chars.append(ord(ch))
+        if len(self._chars) >= self.chunk:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._chars:
+            return
+        rec = np.empty(len(self._chars), dtype=RECORD_DTYPE)
+        rec["row"] = np.frombuffer(self._rows, dtype=np.int32)
+        rec["col"] = np.frombuffer(self._cols, dtype=np.int32)
+        rec["ch"] = np.frombuffer(self._chars, dtype=np.uint8)
+        rec.tofile(self._f)
+        self.count += len(rec)
+        self._rows = array("i")
+        self._cols = array("i")
+        self._chars = bytearray()
+
+    def close(self) -> str:
+        if not self._f.closed:
+            self._flush()
+            self._f.seek(0)
+            self._f.write(_TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION,
+                                             self.height, self.width, self.count))
+            self._f.close()
+        return str(self.path)
+
+    def __enter__(self) -> "TraceRecorder":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _apply(flat: np.ndarray, width: int, rec: np.ndarray) -> None:
+    """Applique un bloc d'événements sur une grille aplatie (le dernier événement d'une case gagne)."""
+    if len(rec) == 0:
+        return
+    idx = rec["row"].astype(np.int64) * width + rec["col"]
+    # ordre d'affectation non garanti par numpy si une case se répète : on garde la dernière
+    rev_idx = idx[::-1]
+    uniq, first = np.unique(rev_idx, return_index=True)
+    flat[uniq] = rec["ch"][::-1][first]
+
+
+class TraceReplayer:
+    """
+    Relecture d'une trace : état à n'importe quel événement (seek), itération
+    par pas (avance rapide) et lecture animée à vitesse libre.
+    Une trace non fermée (run interrompu) reste lisible : le nombre d'événements
+    est déduit de la taille du fichier.
+    """
+    def __init__(self, filename: str | Path):
+        self.path = Path(filename)
+        with open(self.path, "rb") as f:
+            raw = f.read(TRACE_HEADER_SIZE)
+        if len(raw) < TRACE_HEADER_SIZE:
+            raise ValueError(f"Trace tronquée: {filename}")
+        magic, version, h, w, _ = _TRACE_HEADER.unpack(raw)
+        if magic != TRACE_MAGIC:
+            raise ValueError(f"Pas un fichier trace: {filename}")
+        if version != TRACE_VERSION:
+            raise ValueError(f"Version de trace non supportée: v{version}")
+        self.height, self.width = h, w
+        self._data_offset = TRACE_HEADER_SIZE + h * w
+        size = os.path.getsize(self.path)
+        if size < self._data_offset:
+            raise ValueError(f"Trace tronquée (grille initiale incomplète): {filename}")
+        count = (size - self._data_offset) // RECORD_DTYPE.itemsize
+        if count:
+            self.records = np.memmap(self.path, dtype=RECORD_DTYPE, mode="r",
+                                     offset=self._data_offset, shape=(count,))
+        else:
+            self.records = np.zeros(0, dtype=RECORD_DTYPE)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def initial(self) -> Maze:
+        """Grille de départ (avant tout événement)."""
+        cells = np.fromfile(self.path, dtype=np.uint8, count=self.height * self.width,
+                            offset=TRACE_HEADER_SIZE)
+        return Maze(cells.reshape(self.height, self.width))
+
+    def state_at(self, k: int) -> Maze:
+        """État après les k premiers événements (seek direct, vectorisé)."""
+        if not 0 <= k <= len(self):
+            raise ValueError(f"Événement hors trace: {k} (0..{len(self)})")
+        maze = self.initial()
+        _apply(maze.cells.reshape(-1), self.width, self.records[:k])
+        return maze
+
+    def events(self, start: int = 0, stop: int | None = None) -> Iterator[Tuple[int, int, str]]:
+        """Événements (r, c, ch) de start à stop."""
+        rec = self.records[start:stop]
+        for r, c, ch in zip(rec["row"].tolist(), rec["col"].tolist(), rec["ch"].tolist()):
+            yield r, c, chr(ch)
+
+    def frames(self, step: int = 1, start: int = 0, stop: int | None = None) -> Iterator[Tuple[int, Maze]]:
+        """
+        Avance rapide : produit (k, maze) tous les `step` événements, de start à stop
+        (le dernier état est toujours produit). Le même Maze est mis à jour sur place.
+        """
+        if step < 1:
+            raise ValueError("step doit être >= 1")
+        stop = len(self) if stop is None else min(stop, len(self))
+        maze = self.state_at(start)
+        flat = maze.cells.reshape(-1)
+        k = start
+        yield k, maze
+        while k < stop:
+            nxt = min(k + step, stop)
+            _apply(flat, self.width, self.records[k:nxt])
+            k = nxt
+            yield k, maze
+
+    def play(self, on_frame: Callable, events_per_second: float = 1000.0, fps: float = 30.0,
+             start: int = 0, stop: int | None = None) -> None:
+        """
+        Lecture animée à `events_per_second` : `on_frame(maze.grid)` est appelé
+        au plus `fps` fois par seconde (ex. un ConsoleAnimator).
+        """
+        if events_per_second <= 0 or fps <= 0:
+            raise ValueError("events_per_second et fps doivent être > 0")
+        step = max(1, int(events_per_second / fps))
+        period = step / events_per_second
+        t0 = time.perf_counter()
+        for i, (_, maze) in enumerate(self.frames(step, start, stop)):
+            on_frame(maze.grid)
+            delay = t0 + (i + 1) * period - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
@@ -0,0 +1,257 @@
+# src/features/export_anim.py
+"""
+Export animé (GIF / APNG) d'une génération ou d'une résolution, à partir des
+événements delta (r, c, ch) : callback on_delta des algos ou trace .mtrace.
+
+- La grille courante est tenue à jour événement par événement (O(1)) avec le
+  rectangle "sale" (bornes des cases modifiées depuis la dernière frame).
+- Toutes les `stride` étapes, seule la zone sale est rendue (index de palette)
+  et encodée comme une sous-image posée sur la frame précédente.
+- Les frames sont écrites au fil de l'eau : mémoire O(une zone sale), temps
+  proportionnel au nombre de frames émises, jamais au nombre d'étapes x grille.
+"""
+from __future__ import annotations
+import io
+import struct
+import zlib
+from pathlib import Path
+from typing import BinaryIO
+import numpy as np
+from PIL import Image
+from config import IMAGES_DIR
+from utils import Maze
+from features.export_img import AsciiExporter, PNG_SIGNATURE, png_chunk
+
+ANIM_FORMATS = (".gif", ".png", ".apng")
+
+
+class GifAnimWriter:
+    """
+    GIF89a animé en flux. Chaque frame est une sous-image (x, y, w, h) sans
+    effacement (disposal 1) : les zones non modifiées restent celles de la
+    frame précédente. La compression LZW d'une frame est déléguée à Pillow.
+    """
+    def __init__(self, f: BinaryIO, width: int, height: int, palette: np.ndarray, loop: int = 0):
+        if width > 0xFFFF or height > 0xFFFF:
+            raise ValueError(f"Image {width}x{height} trop grande pour le GIF (max 65535).")
+        self.f = f
+        self.palette = np.asarray(palette, dtype=np.uint8)
+        self.frames = 0
+        f.write(b"GIF89a" + struct.pack("<HHBBB", width, height, 0, 0, 0))  # pas de table globale
+        # extension NETSCAPE2.0 : nombre de boucles (0 = infini)
+        f.write(b"\x21\xff\x0bNETSCAPE2.0\x03\x01" + struct.pack("<H", loop) + b"\x00")
+
+    def _encode(self, pixels: np.ndarray) -> tuple[bytes, int, bytes]:
+        """(table de couleurs, drapeaux du descripteur, données LZW) d'une frame encodée par Pillow."""
+        img = Image.fromarray(pixels)
+        img.putpalette(self.palette.ravel().tolist())
+        buf = io.BytesIO()
+        img.save(buf, "GIF", optimize=False, interlace=False)
+        data = buf.getvalue()
+        flags = data[10]
+        pos = 13
+        table, bits = b"", 0
+        if flags & 0x80:
+            bits = flags & 7
+            size = 3 * (2 << bits)
+            table = data[pos:pos + size]
+            pos += size
+        while data[pos] == 0x21:  # extensions éventuelles : ignorées
+            pos += 2
+            while data[pos]:
+                pos += data[pos] + 1
+            pos += 1
+        if data[pos] != 0x2C:
+            raise ValueError("Flux GIF inattendu (descripteur d'image manquant).")
+        iflags = data[pos + 9]
+        pos += 10
+        if iflags & 0x80:  # table locale : prioritaire
+            bits = iflags & 7
+            size = 3 * (2 << bits)
+            table = data[pos:pos + size]
+            pos += size
+        end = data.rindex(b"\x3b")
+        flags = (0x80 | bits) if table else 0
+        return table, flags | (iflags & 0x40), data[pos:end]  # bit 0x40 : entrelacement
+
+    def add_frame(self, pixels: np.ndarray, x: int, y: int, delay_ms: int) -> None:
+        """Ajoute la sous-image `pixels` (index de palette) en position (x, y)."""
+        h, w = pixels.shape
+        table, flags, lzw = self._encode(pixels)
+        # Graphic Control Extension : disposal 1 (conserver), délai en centièmes
+        self.f.write(b"\x21\xf9\x04" + struct.pack("<BHBB", 1 << 2, max(0, delay_ms) // 10, 0, 0))
+        self.f.write(b"\x2c" + struct.pack("<HHHHB", x, y, w, h, flags) + table + lzw)
+        self.frames += 1
+
+    def close(self) -> None:
+        self.f.write(b"\x3b")
+
+
+class ApngAnimWriter:
+    """
+    APNG palette 8 bits en flux : IHDR + acTL + PLTE, puis par frame un fcTL
+    (sous-rectangle, dispose NONE, blend SOURCE) et ses données (IDAT pour la
+    première frame, plein cadre ; fdAT ensuite). Le nombre de frames de l'acTL
+    est réécrit à la fermeture (fichier seekable).
+    """
+    def __init__(self, f: BinaryIO, width: int, height: int, palette: np.ndarray,
+                 loop: int = 0, level: int = 6):
+        self.f = f
+        self.width = width
+        self.height = height
+        self.loop = loop
+        self.level = level
+        self.frames = 0
+        self._seq = 0
+        f.write(PNG_SIGNATURE)
+        f.write(png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0)))
+        self._actl_pos = f.tell()
+        f.write(png_chunk(b"acTL", struct.pack(">II", 0, loop)))
+        f.write(png_chunk(b"PLTE", np.asarray(palette, dtype=np.uint8).tobytes()))
+
+    def add_frame(self, pixels: np.ndarray, x: int, y: int, delay_ms: int) -> None:
+        h, w = pixels.shape
+        if self.frames == 0 and (x, y, w, h) != (0, 0, self.width, self.height):
+            raise ValueError("La première frame APNG doit couvrir toute l'image.")
+        # fcTL : séquence, w, h, x, y, délai (num/den), dispose NONE, blend SOURCE
+        self.f.write(png_chunk(b"fcTL", struct.pack(">IIIIIHHBB", self._seq, w, h, x, y,
+                                                    max(0, delay_ms), 1000, 0, 0)))
+        self._seq += 1
+        scan = np.zeros((h, w + 1), dtype=np.uint8)
+        scan[:, 1:] = pixels
+        data = zlib.compress(scan.tobytes(), self.level)
+        if self.frames == 0:
+            self.f.write(png_chunk(b"IDAT", data))
+        else:
+            self.f.write(png_chunk(b"fdAT", struct.pack(">I", self._seq) + data))
+            self._seq += 1
+        self.frames += 1
+
+    def close(self) -> None:
+        self.f.write(png_chunk(b"IEND", b""))
+        end = self.f.tell()
+        self.f.seek(self._actl_pos)
+        self.f.write(png_chunk(b"acTL", struct.pack(">II", self.frames, self.loop)))
+        self.f.seek(end)
+
+
+class AnimRecorder:
+    """
+    Callback on_delta qui produit l'animation : une frame toutes les `stride`
+    étapes, limitée au rectangle modifié. close() émet la dernière frame.
+    """
+    def __init__(self, exporter: "AnimExporter", initial: Maze, dest: Path):
+        self.exporter = exporter
+        self.cells = np.array(initial.cells, dtype=np.uint8)
+        H, W = self.cells.shape
+        if H == 0 or W == 0:
+            raise ValueError("La grille est vide, impossible d'exporter l'animation.")
+        self.path = dest
+        self.steps = 0
+        self._f = open(dest, "wb")
+        cs = exporter.cell_size
+        colors = exporter.image.colors
+        if dest.suffix.lower() == ".gif":
+            self.writer = GifAnimWriter(self._f, W * cs, H * cs, colors, exporter.loop)
+        else:
+            self.writer = ApngAnimWriter(self._f, W * cs, H * cs, colors, exporter.loop)
+        self._reset_dirty()
+        self._emit(0, H, 0, W)  # frame initiale, plein cadre
+
+    def _reset_dirty(self) -> None:
+        self.r0, self.r1, self.c0, self.c1 = self.cells.shape[0], -1, self.cells.shape[1], -1
+
+    def _emit(self, r0: int, r1: int, c0: int, c1: int) -> None:
+        """Rend et écrit la zone [r0, r1) x [c0, c1) de cellules."""
+        cs = self.exporter.cell_size
+        pixels = self.exporter.image.render_indices(self.cells[r0:r1, c0:c1])
+        self.writer.add_frame(np.ascontiguousarray(pixels), c0 * cs, r0 * cs, self.exporter.frame_ms)
+
+    def frame(self) -> None:
+        """Émet une frame si des cases ont changé depuis la précédente."""
+        if self.r1 < 0:
+            return
+        self._emit(self.r0, self.r1 + 1, self.c0, self.c1 + 1)
+        self._reset_dirty()
+
+    def __call__(self, r: int, c: int, ch: str) -> None:
+        self.cells[r, c] = ord(ch)
+        if r < self.r0: self.r0 = r
+        if r > self.r1: self.r1 = r
+        if c < self.c0: self.c0 = c
+        if c > self.c1: self.c1 = c
+        self.steps += 1
+        if self.steps % self.exporter.stride == 0:
+            self.frame()
+
+    def apply_block(self, rows: np.ndarray, cols: np.ndarray, chars: np.ndarray) -> None:
+        """Applique d'un coup un bloc d'événements (au plus une frame), ex. depuis une trace."""
+        if len(rows) == 0:
+            return
+        flat = self.cells.reshape(-1)
+        idx = rows.astype(np.int64) * self.cells.shape[1] + cols
+        # dernier événement d'une case prioritaire
+        uniq, first = np.unique(idx[::-1], return_index=True)
+        flat[uniq] = chars[::-1][first]
+        self.r0 = min(self.r0, int(rows.min())); self.r1 = max(self.r1, int(rows.max()))
+        self.c0 = min(self.c0, int(cols.min())); self.c1 = max(self.c1, int(cols.max()))
+        self.steps += len(rows)
+        self.frame()
+
+    def close(self) -> str:
+        if not self._f.closed:
+            self.frame()
+            self.writer.close()
+            self._f.close()
+        return str(self.path)
+
+    def __enter__(self) -> "AnimRecorder":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class AnimExporter:
+    """
+    Exporte une animation GIF (.gif) ou APNG (.png / .apng) en mode palette.
+    - cell_size : pixels par cellule
+    - stride    : une frame toutes les `stride` étapes (250 000 étapes, stride=1000 -> ~250 frames)
+    - frame_ms  : durée d'une frame ; loop : nombre de boucles (0 = infini)
+
+        with AnimExporter(cell_size=4, stride=500).open(Maze.empty_from_n(n), "gen.gif") as anim:
+            BacktrackingGenerator(n).generate(on_delta=anim)
+    """
+    def __init__(self, cell_size: int = 4, stride: int = 1, frame_ms: int = 40, loop: int = 0):
+        if stride < 1:
+            raise ValueError("stride doit être >= 1")
+        self.image = AsciiExporter(cell_size=cell_size)
+        self.cell_size = self.image.cell_size
+        self.stride = int(stride)
+        self.frame_ms = int(frame_ms)
+        self.loop = int(loop)
+
+    @staticmethod
+    def _dest_path(filename: str | Path | None) -> Path:
+        """Mêmes règles que AsciiExporter : nom simple -> IMAGES_DIR, extension par défaut .gif."""
+        dest = Path(filename) if filename else IMAGES_DIR / "maze_anim.gif"
+        if dest.parent == Path("."):
+            dest = IMAGES_DIR / dest.name
+        if dest.suffix.lower() not in ANIM_FORMATS:
+            dest = dest.with_suffix(".gif")
+        return dest
+
+    def open(self, initial: Maze, filename: str | Path | None = None) -> AnimRecorder:
+        """Ouvre une animation partant de `initial` ; le résultat s'utilise comme on_delta."""
+        dest = self._dest_path(filename)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        return AnimRecorder(self, initial, dest)
+
+    def export_trace(self, replayer, filename: str | Path | None = None) -> str:
+        """Animation depuis une trace (delta_trace.TraceReplayer), bloc de `stride` événements par frame."""
+        rec = replayer.records
+        with self.open(replayer.initial(), filename) as anim:
+            for k in range(0, len(rec), self.stride):
+                block = rec[k:k + self.stride]
+                anim.apply_block(block["row"], block["col"], block["ch"])
+        return str(anim.path)
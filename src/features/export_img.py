@@ -1,9 +1,11 @@
 # src/features/export_img.py
 from __future__ import annotations
-from typing import List
-from PIL import Image
 from pathlib import Path
-import os
+from itertools import chain
+from typing import BinaryIO, Iterable, Iterator
+import struct
+import zlib
+import numpy as np
 from config import IMAGES_DIR
 from utils import Maze
 
@@ -15,24 +17,97 @@ COLOR_MAP = {
     "*": (200, 200, 200),  # explored -> light gray
 }
 
+# formats acceptant directement une image palette ("P")
+PALETTE_FORMATS = (".png", ".gif")
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+def png_chunk(tag: bytes, data: bytes) -> bytes:
+    """Chunk PNG : longueur, type, données, CRC32."""
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+class PngStreamWriter:
+    """
+    Encodeur PNG palette (8 bits) incrémental : les lignes de pixels sont
+    compressées en flux (zlib) et émises en chunks IDAT au fil de l'eau.
+    height=0 : hauteur inconnue, l'IHDR est réécrit à la fermeture (fichier seekable).
+    """
+    IDAT_SIZE = 1 << 16
+
+    def __init__(self, f: BinaryIO, width: int, height: int, palette: np.ndarray, level: int = 6):
+        self.f = f
+        self.width = width
+        self.height = height
+        self.rows_written = 0
+        f.write(PNG_SIGNATURE)
+        self._ihdr_pos = f.tell()
+        f.write(png_chunk(b"IHDR", self._ihdr(height)))
+        f.write(png_chunk(b"PLTE", np.asarray(palette, dtype=np.uint8).tobytes()))
+        self._z = zlib.compressobj(level)
+        self._pending = bytearray()
+
+    def _ihdr(self, height: int) -> bytes:
+        # largeur, hauteur, 8 bits, type 3 (palette), compression, filtre, entrelacement
+        return struct.pack(">IIBBBBB", self.width, height, 8, 3, 0, 0, 0)
+
+    def _emit(self, final: bool = False) -> None:
+        while len(self._pending) >= self.IDAT_SIZE or (final and self._pending):
+            data = bytes(self._pending[: self.IDAT_SIZE])
+            del self._pending[: self.IDAT_SIZE]
+            self.f.write(png_chunk(b"IDAT", data))
+
+    def write_rows(self, pixels: np.ndarray) -> None:
+        """Ajoute des lignes d'index de palette (k, width), filtre PNG 0 (None)."""
+        k, w = pixels.shape
+        if w != self.width:
+            raise ValueError(f"Largeur de bande {w} != largeur d'image {self.width}.")
+        scan = np.zeros((k, w + 1), dtype=np.uint8)
+        scan[:, 1:] = pixels
+        self._pending += self._z.compress(scan)
+        self.rows_written += k
+        self._emit()
+
+    def close(self) -> None:
+        self._pending += self._z.flush()
+        self._emit(final=True)
+        self.f.write(png_chunk(b"IEND", b""))
+        if not self.height:
+            end = self.f.tell()
+            self.f.seek(self._ihdr_pos)
+            self.f.write(png_chunk(b"IHDR", self._ihdr(self.rows_written)))
+            self.f.seek(end)
+        elif self.rows_written != self.height:
+            raise ValueError(f"{self.rows_written} lignes écrites, {self.height} annoncées.")
+
 class AsciiExporter:
     """
     Convertit une grille ASCII Maze en image PNG.
     - cell_size: taille en pixels d'une cellule (ex: 8, 10)
     - background_color: couleur de fond si caractère inconnu
+    - palette: image en mode palette "P" (1 octet/pixel, PNG optimisé) pour .png/.gif
+    Le rendu est vectorisé : caractères -> index de palette via une table de 256
+    entrées, puis agrandissement par répétition de blocs, et un seul Image.fromarray.
     """
 
-    def __init__(self, cell_size: int = 10, background_color: tuple[int,int,int] | None = None):
+    def __init__(self, cell_size: int = 10, background_color: tuple[int,int,int] | None = None,
+                 palette: bool = True):
         self.cell_size = max(1, int(cell_size))
         self.background_color = background_color or (255, 0, 255)  # magenta for unknown
+        self.palette = palette
+        # palette : couleurs de COLOR_MAP puis couleur de fond (dernier index)
+        self.colors = np.array(list(COLOR_MAP.values()) + [self.background_color], dtype=np.uint8)
+        self.index_lut = np.full(256, len(COLOR_MAP), dtype=np.uint8)
+        for i, ch in enumerate(COLOR_MAP):
+            self.index_lut[ord(ch)] = i
 
-    def export(self, maze: Maze, filename: str | Path | None = None) -> str:
-        """
-        Exporte la grille Maze en PNG.
-        - filename: chemin souhaité (str ou Path). Si None ou vide, on utilisera IMAGES_DIR/maze_auto.png
-        - Si l'extension est manquante, on ajoute automatiquement .png
-        - Retourne le chemin du fichier exporté (string)
-        """
+    def render_indices(self, cells: np.ndarray) -> np.ndarray:
+        """Index de palette par pixel (H*cell_size, W*cell_size) pour une matrice de cellules."""
+        cs = self.cell_size
+        idx = self.index_lut[cells]
+        h, w = idx.shape
+        return np.broadcast_to(idx[:, None, :, None], (h, cs, w, cs)).reshape(h * cs, w * cs)
+
+    def _dest_path(self, filename: str | Path | None) -> Path:
         # Prépare le nom de fichier
         if not filename:
             dest = IMAGES_DIR / "maze_auto.png"
@@ -48,33 +123,81 @@ class AsciiExporter:
         # Si l'extension n'est pas reconnue par Pillow, normaliser vers .png
         if dest.suffix.lower() not in (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tiff"):
             dest = dest.with_suffix(".png")
+        return dest
 
+    def export(self, maze: Maze, filename: str | Path | None = None) -> str:
+        """
+        Exporte la grille Maze en PNG.
+        - filename: chemin souhaité (str ou Path). Si None ou vide, on utilisera IMAGES_DIR/maze_auto.png
+        - Si l'extension est manquante, on ajoute automatiquement .png
+        - Retourne le chemin du fichier exporté (string)
+        """
+        dest = self._dest_path(filename)
         # Créer dossier si besoin
         dest.parent.mkdir(parents=True, exist_ok=True)
 
-        grid: List[List[str]] = maze.grid
-        h = len(grid)
-        w = len(grid[0]) if h > 0 else 0
+        h, w = maze.ascii_height, maze.ascii_width
         if h == 0 or w == 0:
             raise ValueError("La grille est vide, impossible d'exporter l'image.")
 
-        img_h = h * self.cell_size
-        img_w = w * self.cell_size
-
-        # Crée l'image
-        img = Image.new("RGB", (img_w, img_h), (0, 0, 0))
-        pixels = img.load()
-
-        for r in range(h):
-            for c in range(w):
-                ch = grid[r][c]
-                color = COLOR_MAP.get(ch, self.background_color)
-                top = r * self.cell_size
-                left = c * self.cell_size
-                for y in range(top, top + self.cell_size):
-                    for x in range(left, left + self.cell_size):
-                        pixels[x, y] = color
-
-        # Sauvegarde en PNG (on force format PNG via suffix)
-        img.save(str(dest))
+        from PIL import Image  # à la demande : export_stream (PNG en flux) n'utilise pas Pillow
+
+        pixels = self.render_indices(maze.cells)
+        if self.palette and dest.suffix.lower() in PALETTE_FORMATS:
+            img = Image.fromarray(pixels)
+            img.putpalette(self.colors.ravel().tolist())
+            img.save(str(dest), optimize=True)
+        else:
+            img = Image.fromarray(self.colors[pixels])
+            img.save(str(dest))
+        return str(dest)
+
+    @staticmethod
+    def _iter_strips(source: Maze | Iterable[str | bytes], strip_rows: int) -> Iterator[np.ndarray]:
+        """Découpe la source en bandes (k, W) de cellules uint8."""
+        if isinstance(source, Maze):
+            for r in range(0, source.ascii_height, strip_rows):
+                yield source.cells[r:r + strip_rows]
+            return
+        batch: list[bytes] = []
+        width = None
+        for row in source:
+            data = row.encode("latin-1") if isinstance(row, str) else bytes(row)
+            if width is None:
+                width = len(data)
+            elif len(data) != width:
+                raise ValueError(f"Grille irrégulière: ligne de largeur {len(data)} (attendu {width}).")
+            batch.append(data)
+            if len(batch) == strip_rows:
+                yield np.frombuffer(b"".join(batch), dtype=np.uint8).reshape(len(batch), width)
+                batch = []
+        if batch:
+            yield np.frombuffer(b"".join(batch), dtype=np.uint8).reshape(len(batch), width)
+
+    def export_stream(self, source: Maze | Iterable[str | bytes], filename: str | Path | None = None,
+                      strip_rows: int = 32, height: int | None = None) -> str:
+        """
+        Export PNG en flux, bande horizontale par bande : le pic mémoire est borné
+        par une bande (strip_rows lignes de cellules), pas par l'image entière.
+        - source : Maze (y compris Maze.open_mmap) ou itérable de lignes ASCII (str/bytes),
+          par ex. EllerGenerator.iter_rows()
+        - height : nombre de lignes de la source si connu ; sinon l'en-tête est corrigé à la fin
+        Toujours en PNG palette. Retourne le chemin du fichier exporté (string).
+        """
+        dest = self._dest_path(filename).with_suffix(".png")
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(source, Maze):
+            height = source.ascii_height
+
+        strips = self._iter_strips(source, max(1, int(strip_rows)))
+        first = next(strips, None)
+        if first is None or first.shape[1] == 0:
+            raise ValueError("La grille est vide, impossible d'exporter l'image.")
+
+        cs = self.cell_size
+        with open(dest, "wb") as f:
+            writer = PngStreamWriter(f, first.shape[1] * cs, (height or 0) * cs, self.colors)
+            for strip in chain([first], strips):
+                writer.write_rows(self.render_indices(strip))
+            writer.close()
         return str(dest)
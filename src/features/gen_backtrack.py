@@ -1,19 +1,24 @@
 from __future__ import annotations
+import itertools
 import random
-from typing import List, Tuple, Callable, Optional
-from utils import Maze
+from array import array
+from typing import Iterator, List, Tuple, Callable, Optional
+import numpy as np
+from utils import Maze, WALL, PASSAGE
+from wallset import WallSet, EAST, SOUTH
 
 Cell = Tuple[int, int]
 OnStep = Optional[Callable[[List[List[str]]], None]]
+OnDelta = Optional[Callable[[int, int, str], None]]  # (ligne, colonne, nouveau caractère)
 
-def _neighbors(cell: Cell, n: int) -> List[Cell]:
+def _neighbors(cell: Cell, n: int, rng: random.Random) -> List[Cell]:
     r, c = cell
     neigh = []
     if r > 0: neigh.append((r - 1, c))
     if r < n - 1: neigh.append((r + 1, c))
     if c > 0: neigh.append((r, c - 1))
     if c < n - 1: neigh.append((r, c + 1))
-    random.shuffle(neigh)
+    rng.shuffle(neigh)
     return neigh
 
 def _to_ascii(cell: Cell) -> Cell:
@@ -21,19 +26,160 @@ def _to_ascii(cell: Cell) -> Cell:
     return 2 * r + 1, 2 * c + 1
 
 class BacktrackingGenerator:
-    """DFS backtracking itératif (pile) — avec callback on_step facultatif."""
-    def __init__(self, n: int, seed: int | None = None):
+    """
+    DFS backtracking itératif (pile) — avec callback on_step facultatif.
+    Chaque parcours utilise son propre random.Random(seed) : aucun état global,
+    résultat identique quel que soit le thread ou le code voisin qui utilise `random`.
+    fast=True : noyau sans allocation par pas (index plats de la grille ASCII,
+    visités en bytearray, pile array('i') / 'q' selon la taille, un seul tirage
+    par pas parmi les voisins libres) ; déterministe par seed dans ce mode, mais
+    différent du mode classique.
+    """
+    VERSION = 1
+    def __init__(self, n: int, seed: int | None = None, fast: bool = False):
         if n < 1:
             raise ValueError("n doit être >= 1")
         self.n = n
         self.seed = seed
+        self.fast = fast
 
-    def generate(self, on_step: OnStep = None) -> Maze:
-        if self.seed is not None:
-            random.seed(self.seed)
+    def _visited_grid(self) -> bytearray:
+        """Masque des cases visitées, grille ASCII aplatie + 2 lignes de garde en haut et en bas."""
+        W = 2 * self.n + 1
+        # rempli en place via une vue NumPy : pas de copie intermédiaire
+        vis = bytearray((W + 4) * W)
+        grid = np.frombuffer(vis, dtype=np.uint8).reshape(W + 4, W)
+        grid[:] = 1
+        grid[3:W + 2:2, 1::2] = 0
+        return vis
 
+    def _dfs_flat(self, record: bool = False) -> Tuple[bytearray, int, array | None]:
+        """
+        Mode fast : DFS directement sur la grille ASCII aplatie, entourée de
+        2 lignes de garde. Toute case qui n'est pas un centre de cellule est
+        marquée visitée : les voisins à ±2 / ±2W qui sortent de la grille (ou
+        débordent sur la ligne voisine) tombent sur un mur ou une garde et sont
+        ignorés sans test de bornes. Le mur ouvert est au milieu : a + off // 2.
+        Renvoie (cases ASCII paddées, décalage de la garde, murs dans l'ordre si record).
+        """
+        n = self.n
+        W = 2 * n + 1
+        pad = 2 * W
+        vis = self._visited_grid()
+        out = bytearray(len(vis))
+        grid = np.frombuffer(out, dtype=np.uint8).reshape(W + 4, W)
+        grid[:] = WALL
+        grid[3:W + 2:2, 1::2] = PASSAGE
+        # index plats : 'i' (int32) tant que la grille paddée tient, sinon 'q' (n > ~23 000)
+        code = "i" if len(vis) < 2 ** 31 else "q"
+        order = array(code) if record else None
+        o0, o1, o2, o3 = 2 * W, -2 * W, 2, -2
+        rand = random.Random(self.seed).random
+
+        a = pad + W + 1  # cellule (0, 0)
+        vis[a] = 1
+        stack = array(code, [a])
+        push, pop = stack.append, stack.pop
+        while stack:
+            a = stack[-1]
+            f0 = not vis[a + o0]; f1 = not vis[a + o1]
+            f2 = not vis[a + o2]; f3 = not vis[a + o3]
+            k = f0 + f1 + f2 + f3
+            if not k:
+                pop()
+                continue
+            # un seul tirage : le j-ème voisin libre (ordre bas, haut, droite, gauche)
+            j = int(rand() * k)
+            if f0 and not j:
+                o = o0
+            else:
+                j -= f0
+                if f1 and not j:
+                    o = o1
+                else:
+                    j -= f1
+                    o = o2 if f2 and not j else o3
+            b = a + o
+            vis[b] = 1
+            w = a + (o >> 1)
+            out[w] = PASSAGE
+            if record: order.append(w - pad)
+            push(b)
+        return out, pad, order
+
+    def _dfs_walls(self) -> WallSet:
+        """
+        Même DFS (mêmes tirages, même labyrinthe) que _dfs_flat, écrit
+        directement dans WallSet.bits, sans grille ASCII ni pile. Mémoire :
+        - visités : 1 bit par cellule logique, grille (n+2) x (n+2) dont le
+          bord est marqué visité (voisins hors grille ignorés sans test de bornes)
+        - pile remplacée par la direction d'arrivée de chaque cellule (2 bits) :
+          revenir en arrière = remonter vers la cellule parente
+        Soit ~5 bits par cellule en tout (murs compris).
+        """
+        n = self.n
+        P = n + 2
+        vis = bytearray(((n + 2) * P + 7) // 8)
+        for b in itertools.chain(range(P), range((n + 1) * P, (n + 2) * P),
+                                 range(P, (n + 1) * P, P), range(2 * P - 1, (n + 1) * P, P)):
+            vis[b >> 3] |= 1 << (b & 7)
+        walls = WallSet(n)
+        bits = walls.bits
+        came = bytearray((n * n + 3) // 4)
+        # directions : bas, haut, droite, gauche (même ordre que _dfs_flat)
+        step_a = (P, -P, 1, -1)
+        step_i = (n, -n, 1, -1)
+        rand = random.Random(self.seed).random
+
+        a = P + 1  # cellule (0, 0) dans la grille bordée
+        i = 0
+        vis[a >> 3] |= 1 << (a & 7)
+        while True:
+            b = a + P; f0 = not vis[b >> 3] >> (b & 7) & 1
+            b = a - P; f1 = not vis[b >> 3] >> (b & 7) & 1
+            b = a + 1; f2 = not vis[b >> 3] >> (b & 7) & 1
+            b = a - 1; f3 = not vis[b >> 3] >> (b & 7) & 1
+            k = f0 + f1 + f2 + f3
+            if not k:
+                if not i:
+                    return walls
+                d = came[i >> 2] >> ((i & 3) << 1) & 3
+                a -= step_a[d]
+                i -= step_i[d]
+                continue
+            j = int(rand() * k)
+            if f0 and not j:
+                d = 0; bits[i >> 2] |= SOUTH << ((i & 3) << 1)
+            else:
+                j -= f0
+                if f1 and not j:
+                    d = 1; w = i - n; bits[w >> 2] |= SOUTH << ((w & 3) << 1)
+                else:
+                    j -= f1
+                    if f2 and not j:
+                        d = 2; bits[i >> 2] |= EAST << ((i & 3) << 1)
+                    else:
+                        d = 3; w = i - 1; bits[w >> 2] |= EAST << ((w & 3) << 1)
+            a += step_a[d]
+            i += step_i[d]
+            vis[a >> 3] |= 1 << (a & 7)
+            came[i >> 2] |= d << ((i & 3) << 1)
+
+    def _carve(self) -> Iterator[Tuple[Cell, Cell]]:
+        """Parcours DFS : produit, dans l'ordre, les paires de cellules logiques reliées."""
+        if self.fast:
+            W = 2 * self.n + 1
+            _, _, order = self._dfs_flat(record=True)
+            for w in order:
+                r, c = divmod(w, W)
+                # mur en ligne impaire : voisins gauche/droite, sinon haut/bas
+                if r & 1:
+                    yield (r >> 1, (c - 1) >> 1), (r >> 1, (c + 1) >> 1)
+                else:
+                    yield ((r - 1) >> 1, c >> 1), ((r + 1) >> 1, c >> 1)
+            return
+        rng = random.Random(self.seed)
         n = self.n
-        maze = Maze.empty_from_n(n)
         visited = [[False] * n for _ in range(n)]
 
         start = (0, 0)
@@ -42,21 +188,53 @@ class BacktrackingGenerator:
 
         while stack:
             curr = stack[-1]
-            unvisited = [nb for nb in _neighbors(curr, n) if not visited[nb[0]][nb[1]]]
+            unvisited = [nb for nb in _neighbors(curr, n, rng) if not visited[nb[0]][nb[1]]]
             if unvisited:
                 nb = unvisited[0]
-                cr, cc = _to_ascii(curr)
-                nr, nc = _to_ascii(nb)
-                wall_r = (cr + nr) // 2
-                wall_c = (cc + nc) // 2
-                maze.grid[wall_r][wall_c] = "."
-                if on_step: on_step(maze.grid)  # <-- callback visuel
+                yield curr, nb
                 visited[nb[0]][nb[1]] = True
                 stack.append(nb)
             else:
                 stack.pop()
 
-        maze.grid[0][1] = "."
-        maze.grid[2 * n][2 * n - 1] = "."
+    def generate(self, on_step: OnStep = None, on_delta: OnDelta = None) -> Maze:
+        """
+        on_step reçoit la grille entière après chaque mur ouvert ; on_delta reçoit
+        seulement la case modifiée (r, c, '.'), à partir de Maze.empty_from_n(n).
+        """
+        n = self.n
+        if self.fast and on_step is None and on_delta is None:
+            out, pad, _ = self._dfs_flat()
+            W = 2 * n + 1
+            # vue sur le bytearray du noyau (modifiable, sans copie)
+            cells = np.frombuffer(out, dtype=np.uint8)[pad:pad + W * W].reshape(W, W)
+            cells[0, 1] = PASSAGE
+            cells[2 * n, 2 * n - 1] = PASSAGE
+            return Maze(cells)
+
+        maze = Maze.empty_from_n(n)
+        for curr, nb in self._carve():
+            cr, cc = _to_ascii(curr)
+            nr, nc = _to_ascii(nb)
+            wall_r = (cr + nr) // 2
+            wall_c = (cc + nc) // 2
+            maze.cells[wall_r, wall_c] = PASSAGE
+            if on_delta: on_delta(wall_r, wall_c, ".")
+            if on_step: on_step(maze.grid)  # <-- callback visuel
+
+        maze.cells[0, 1] = PASSAGE
+        maze.cells[2 * n, 2 * n - 1] = PASSAGE
+        if on_delta:
+            on_delta(0, 1, ".")
+            on_delta(2 * n, 2 * n - 1, ".")
         if on_step: on_step(maze.grid)
         return maze
+
+    def generate_walls(self) -> WallSet:
+        """Même labyrinthe que generate() (à seed égale), écrit directement en WallSet."""
+        if self.fast:
+            return self._dfs_walls()
+        walls = WallSet(self.n)
+        for curr, nb in self._carve():
+            walls.carve(curr, nb)
+        return walls
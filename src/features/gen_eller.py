@@ -0,0 +1,96 @@
+# src/features/gen_eller.py
+from __future__ import annotations
+import random
+from typing import Iterator, List, Callable, Optional
+import numpy as np
+from utils import Maze, save_rows_txt
+
+OnStep = Optional[Callable[[List[List[str]]], None]]
+OnDelta = Optional[Callable[[int, int, str], None]]  # (ligne, colonne, nouveau caractère)
+
+class EllerGenerator:
+    """
+    Algorithme d'Eller : génère le labyrinthe ligne par ligne en ne gardant
+    qu'une seule ligne d'état (ensembles de connexité) → mémoire O(n),
+    quelle que soit la hauteur. Les lignes ASCII sont produites au fil de l'eau
+    et peuvent être écrites directement sur disque (stream_txt).
+    """
+    VERSION = 1
+    def __init__(self, n: int, seed: int | None = None):
+        if n < 1:
+            raise ValueError("n doit être >= 1")
+        self.n = n
+        self.seed = seed
+
+    def iter_rows(self) -> Iterator[str]:
+        """Produit les 2n+1 lignes ASCII du labyrinthe, de haut en bas."""
+        rng = random.Random(self.seed)  # RNG propre à l'appel : pas d'état global partagé
+
+        n = self.n
+        W = 2 * n + 1
+        yield "#." + "#" * (W - 2)  # bord haut + entrée (0,1)
+
+        labels = list(range(n))  # ensemble de chaque colonne, normalisé 0..n-1
+        for r in range(n):
+            last = r == n - 1
+
+            # --- fusions horizontales (union-find local à la ligne) ---
+            parent = list(range(n))
+
+            def find(x: int) -> int:
+                while parent[x] != x:
+                    parent[x] = parent[parent[x]]
+                    x = parent[x]
+                return x
+
+            cell_row = bytearray(b"#" * W)
+            cell_row[1::2] = b"." * n
+            for c in range(n - 1):
+                a, b = find(labels[c]), find(labels[c + 1])
+                if a != b and (last or rng.random() < 0.5):
+                    parent[b] = a
+                    cell_row[2 * c + 2] = 46  # '.'
+            labels = [find(lab) for lab in labels]
+            yield cell_row.decode("ascii")
+
+            if last:
+                yield "#" * (W - 2) + ".#"  # bord bas + sortie (H-1, W-2)
+                return
+
+            # --- ouvertures verticales : au moins une par ensemble ---
+            members: dict[int, List[int]] = {}
+            for c, lab in enumerate(labels):
+                members.setdefault(lab, []).append(c)
+            wall_row = bytearray(b"#" * W)
+            south = bytearray(n)
+            for cols in members.values():
+                opened = [c for c in cols if rng.random() < 0.5] or [rng.choice(cols)]
+                for c in opened:
+                    south[c] = 1
+                    wall_row[2 * c + 1] = 46  # '.'
+            yield wall_row.decode("ascii")
+
+            # ligne suivante : les cellules non reliées au-dessus ouvrent un nouvel ensemble
+            mapping: dict[int, int] = {}
+            labels = [mapping.setdefault(lab if south[c] else n + c, len(mapping))
+                      for c, lab in enumerate(labels)]
+
+    def generate(self, on_step: OnStep = None, on_delta: OnDelta = None) -> Maze:
+        """
+        on_step reçoit les lignes déjà produites ; on_delta reçoit chaque case
+        ouverte (r, c, '.') par rapport à Maze.empty_from_n(n), ligne par ligne.
+        """
+        rows: List[List[str]] = []
+        base = Maze.empty_from_n(self.n).cells if on_delta else None
+        for line in self.iter_rows():
+            if on_delta:
+                r = len(rows)
+                for c in np.flatnonzero(np.frombuffer(line.encode("ascii"), np.uint8) != base[r]).tolist():
+                    on_delta(r, c, line[c])
+            rows.append(list(line))
+            if on_step: on_step(rows)  # <-- callback visuel (ligne par ligne)
+        return Maze(rows)
+
+    def stream_txt(self, filename: str | None = None) -> str:
+        """Écrit le labyrinthe directement dans un .txt, sans jamais le garder en mémoire."""
+        return save_rows_txt(self.iter_rows(), filename)
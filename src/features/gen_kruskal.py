@@ -1,20 +1,27 @@
 # src/features/gen_kruskal.py
 from __future__ import annotations
 import random
-from typing import Tuple, List, Callable, Optional
-from utils import Maze
+from array import array
+from typing import Iterator, Tuple, List, Callable, Optional
+import numpy as np
+from utils import Maze, PASSAGE
+from wallset import WallSet
 
 Cell = Tuple[int, int]
 OnStep = Optional[Callable[[List[List[str]]], None]]
+OnDelta = Optional[Callable[[int, int, str], None]]  # (ligne, colonne, nouveau caractère)
 
 class UnionFind:
     def __init__(self, n: int):
         self.parent = list(range(n))
         self.rank = [0] * n
     def find(self, x: int) -> int:
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
+        # itératif (path halving) : pas de RecursionError sur les grandes tailles
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
     def union(self, a: int, b: int) -> bool:
         ra, rb = self.find(a), self.find(b)
         if ra == rb: return False
@@ -27,41 +34,146 @@ class UnionFind:
             self.rank[ra] += 1
         return True
 
+def _kruskal_kernel(edges: np.ndarray, n: int, bits: bytearray, keep: bytearray | None = None) -> None:
+    """
+    Union-find sur tableaux (path halving + union par rang), sans appel de
+    méthode par arête. Arêtes codées e = 2 * i + (0 : est, 1 : sud) pour la
+    cellule i ; chaque arête retenue ouvre directement son mur dans `bits`
+    (codage WallSet, drapeau (e & 1) + 1) et, si `keep` est fourni, y est marquée.
+    """
+    n_cells = n * n
+    parent = array("i" if n_cells < 2 ** 31 else "q", range(n_cells))
+    rank = bytearray(n_cells)  # rang <= log2(n_cells) : un octet suffit
+    remaining = n_cells - 1
+    for k, e in enumerate(memoryview(edges)):
+        if not remaining:
+            break
+        i = x = e >> 1
+        y = x + n if e & 1 else x + 1
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        while parent[y] != y:
+            parent[y] = parent[parent[y]]
+            y = parent[y]
+        if x == y:
+            continue
+        if rank[x] < rank[y]:
+            x, y = y, x
+        elif rank[x] == rank[y]:
+            rank[x] += 1
+        parent[y] = x
+        bits[i >> 2] |= ((e & 1) + 1) << ((i & 3) << 1)
+        if keep is not None:
+            keep[k] = 1
+        remaining -= 1
+
 class KruskalGenerator:
-    def __init__(self, n: int, seed: int | None = None):
+    """
+    Kruskal (union-find) — avec callback on_step facultatif.
+    fast=True : arêtes en tableaux NumPy mélangés par un Generator seedé,
+    union-find sur tableaux et murs ouverts en bloc (sortie déterministe
+    par seed dans ce mode, mais différente du mode classique).
+    """
+    VERSION = 1
+    def __init__(self, n: int, seed: int | None = None, fast: bool = False):
         if n < 1:
             raise ValueError("n doit être >= 1")
         self.n = n
         self.seed = seed
+        self.fast = fast
 
     def _cell_index(self, r: int, c: int) -> int:
         return r * self.n + c
 
-    def generate(self, on_step: OnStep = None) -> Maze:
-        if self.seed is not None:
-            random.seed(self.seed)
+    def _shuffled_edges(self) -> np.ndarray:
+        """
+        Mode fast : arêtes codées 2 * i + (0 : est, 1 : sud), une seule valeur
+        par arête (sud puis est, ordre ligne par ligne), mélangées par un
+        Generator seedé. Remplies en place : pas de tableau d'index intermédiaire.
+        """
+        n = self.n
+        vertical = n * (n - 1)
+        edges = np.empty(2 * vertical, dtype=np.int32 if 2 * n * n < 2 ** 31 else np.int64)
+        south = edges[:vertical]
+        south[:] = np.arange(vertical, dtype=edges.dtype)
+        south *= 2
+        south += 1
+        east = edges[vertical:].reshape(n, n - 1)
+        east[:] = np.arange(n - 1, dtype=edges.dtype)
+        east += np.arange(0, n * n, n, dtype=edges.dtype)[:, None]
+        east *= 2
+        np.random.default_rng(self.seed).shuffle(edges)
+        return edges
+
+    def _accepted_edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Mode fast : arêtes retenues (index plats a < b), dans l'ordre de Kruskal."""
+        n = self.n
+        edges = self._shuffled_edges()
+        keep = bytearray(len(edges))
+        _kruskal_kernel(edges, n, WallSet(n).bits, keep)
+        kept = edges[np.frombuffer(keep, dtype=np.bool_)]
+        a = kept >> 1
+        return a, a + np.where(kept & 1, n, 1)
+
+    def _carve(self) -> Iterator[Tuple[Cell, Cell]]:
+        """Kruskal : produit, dans l'ordre, les paires de cellules logiques reliées."""
+        if self.fast:
+            n = self.n
+            a, b = self._accepted_edges()
+            for x, y in zip(a.tolist(), b.tolist()):
+                yield divmod(x, n), divmod(y, n)
+            return
+        rng = random.Random(self.seed)  # RNG propre à l'appel : pas d'état global partagé
         n = self.n
-        maze = Maze.empty_from_n(n)
 
         edges: List[Tuple[Tuple[int,int], Tuple[int,int]]] = []
         for r in range(n):
             for c in range(n):
                 if r + 1 < n: edges.append(((r, c), (r + 1, c)))
                 if c + 1 < n: edges.append(((r, c), (r, c + 1)))
-        random.shuffle(edges)
+        rng.shuffle(edges)
         uf = UnionFind(n * n)
 
         for a, b in edges:
             ai = self._cell_index(a[0], a[1])
             bi = self._cell_index(b[0], b[1])
             if uf.union(ai, bi):
-                ar, ac = 2 * a[0] + 1, 2 * a[1] + 1
-                br, bc = 2 * b[0] + 1, 2 * b[1] + 1
-                wall_r, wall_c = (ar + br) // 2, (ac + bc) // 2
-                maze.grid[wall_r][wall_c] = "."
-                if on_step: on_step(maze.grid)  # <-- callback visuel
+                yield a, b
 
-        maze.grid[0][1] = "."
-        maze.grid[2 * n][2 * n - 1] = "."
+    def generate(self, on_step: OnStep = None, on_delta: OnDelta = None) -> Maze:
+        """
+        on_step reçoit la grille entière après chaque mur ouvert ; on_delta reçoit
+        seulement la case modifiée (r, c, '.'), à partir de Maze.empty_from_n(n).
+        """
+        n = self.n
+        if self.fast and on_step is None and on_delta is None:
+            return self.generate_walls().to_maze()
+
+        maze = Maze.empty_from_n(n)
+        for a, b in self._carve():
+            ar, ac = 2 * a[0] + 1, 2 * a[1] + 1
+            br, bc = 2 * b[0] + 1, 2 * b[1] + 1
+            wall_r, wall_c = (ar + br) // 2, (ac + bc) // 2
+            maze.cells[wall_r, wall_c] = PASSAGE
+            if on_delta: on_delta(wall_r, wall_c, ".")
+            if on_step: on_step(maze.grid)  # <-- callback visuel
+
+        maze.cells[0, 1] = PASSAGE
+        maze.cells[2 * n, 2 * n - 1] = PASSAGE
+        if on_delta:
+            on_delta(0, 1, ".")
+            on_delta(2 * n, 2 * n - 1, ".")
         if on_step: on_step(maze.grid)
         return maze
+
+    def generate_walls(self) -> WallSet:
+        """Même labyrinthe que generate() (à seed égale), écrit directement en WallSet."""
+        if self.fast:  # le noyau ouvre les murs directement dans les bits du WallSet
+            walls = WallSet(self.n)
+            _kruskal_kernel(self._shuffled_edges(), self.n, walls.bits)
+            return walls
+        walls = WallSet(self.n)
+        for a, b in self._carve():
+            walls.carve(a, b)
+        return walls
@@ -0,0 +1,65 @@
+# src/features/gen_many.py
+"""
+Génération concurrente de plusieurs labyrinthes.
+Chaque générateur tire ses nombres dans son propre random.Random(seed) :
+une spec (algo, n, seed) donne toujours le même labyrinthe, quel que soit
+le thread/processus qui l'exécute et l'ordre d'exécution.
+"""
+from __future__ import annotations
+from concurrent.futures import Executor
+from functools import partial
+from typing import Iterable, List, Optional, Tuple
+from utils import Maze
+from wallset import WallSet
+from features.gen_backtrack import BacktrackingGenerator
+from features.gen_kruskal import KruskalGenerator
+from features.gen_eller import EllerGenerator
+from features.gen_binary_tree import BinaryTreeGenerator
+from features.gen_sidewinder import SidewinderGenerator
+
+# spec = (algo, n, seed) ; seed None = aléatoire (non reproductible)
+Spec = Tuple[str, int, Optional[int]]
+
+GENERATORS = {
+    "backtrack": BacktrackingGenerator,
+    "backtrack_fast": partial(BacktrackingGenerator, fast=True),
+    "kruskal": KruskalGenerator,
+    "eller": EllerGenerator,
+    "binary_tree": BinaryTreeGenerator,
+    "sidewinder": SidewinderGenerator,
+}
+
+
+def _check_spec(spec) -> Spec:
+    algo, n, *rest = spec
+    if algo not in GENERATORS:
+        raise ValueError(f"Algorithme inconnu: {algo!r} (attendu: {', '.join(GENERATORS)})")
+    if len(rest) > 1:
+        raise ValueError(f"Spec invalide: {spec!r} (attendu (algo, n, seed))")
+    return algo, n, (rest[0] if rest else None)
+
+
+def build_maze(spec: Spec) -> Maze:
+    """Génère le labyrinthe d'une spec (fonction de module : utilisable par un pool de processus)."""
+    algo, n, seed = _check_spec(spec)
+    return GENERATORS[algo](n, seed=seed).generate()
+
+
+def build_walls(spec: Spec) -> WallSet:
+    """Comme build_maze, en WallSet (generate_walls si le générateur l'a) : résultat compact à transférer."""
+    algo, n, seed = _check_spec(spec)
+    gen = GENERATORS[algo](n, seed=seed)
+    return gen.generate_walls() if hasattr(gen, "generate_walls") else WallSet.from_maze(gen.generate())
+
+
+def generate_many(specs: Iterable[Spec], executor: Executor | None = None) -> List[Maze]:
+    """
+    Génère un labyrinthe par spec, dans l'ordre des specs.
+    - executor : ThreadPoolExecutor / ProcessPoolExecutor (ou tout Executor) ;
+      None = exécution séquentielle dans le thread courant.
+    Les specs sont validées avant tout envoi au pool.
+    """
+    specs = [_check_spec(s) for s in specs]
+    if executor is None:
+        return [build_maze(s) for s in specs]
+    return list(executor.map(build_maze, specs))
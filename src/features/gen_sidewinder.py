@@ -0,0 +1,64 @@
+# src/features/gen_sidewinder.py
+from __future__ import annotations
+from typing import List, Callable, Optional
+import numpy as np
+from utils import Maze, PASSAGE
+from wallset import WallSet
+
+OnStep = Optional[Callable[[List[List[str]]], None]]
+OnDelta = Optional[Callable[[int, int, str], None]]  # (ligne, colonne, nouveau caractère)
+
+
+class SidewinderGenerator:
+    """
+    Sidewinder entièrement vectorisé (NumPy). Dernière ligne : un seul couloir.
+    Ailleurs, chaque cellule tire "continuer vers l'est" ; une suite de cellules
+    reliées forme un segment (run) qui s'ouvre vers le sud par une cellule tirée
+    au hasard dans le segment. La segmentation par ligne se fait par cumsum sur
+    les débuts de segment, sans parcours Python.
+    """
+    VERSION = 1
+
+    def __init__(self, n: int, seed: int | None = None):
+        if n < 1:
+            raise ValueError("n doit être >= 1")
+        self.n = n
+        self.seed = seed
+
+    def generate_walls(self) -> WallSet:
+        n = self.n
+        rng = np.random.default_rng(self.seed)
+        east = np.zeros((n, n), dtype=bool)
+        south = np.zeros((n, n), dtype=bool)
+        east[n - 1, : n - 1] = True
+        if n > 1:
+            cont = rng.random((n - 1, n)) < 0.5
+            cont[:, n - 1] = False  # le bord est ferme toujours le segment
+            east[: n - 1] = cont
+            # début de segment : première colonne, ou cellule après une fermeture
+            start = np.ones((n - 1, n), dtype=bool)
+            start[:, 1:] = ~cont[:, :-1]
+            first = np.flatnonzero(start)
+            lengths = np.diff(np.append(first, (n - 1) * n))
+            chosen = first + (rng.random(len(first)) * lengths).astype(np.int64)
+            south[: n - 1].ravel()[chosen] = True
+        return WallSet.from_flags(east, south)
+
+    def generate(self, on_step: OnStep = None, on_delta: OnDelta = None) -> Maze:
+        """
+        Sans callback : grille construite en bloc. Avec callbacks, les murs ouverts
+        sont rejoués dans l'ordre de lecture (on_step : grille entière, on_delta :
+        case modifiée), à partir de Maze.empty_from_n(n).
+        """
+        walls = self.generate_walls()
+        if on_step is None and on_delta is None:
+            return walls.to_maze()
+        n = self.n
+        maze = Maze.empty_from_n(n)
+        rows, cols = walls.passages()
+        opened = list(zip(rows.tolist(), cols.tolist())) + [(0, 1), (2 * n, 2 * n - 1)]
+        for r, c in opened:
+            maze.cells[r, c] = PASSAGE
+            if on_delta: on_delta(r, c, ".")
+            if on_step: on_step(maze.grid)
+        return maze
@@ -0,0 +1,123 @@
+# src/features/gen_tiled.py
+"""
+Génération tuilée multi-cœurs pour les très grands labyrinthes.
+
+La grille logique n x n est découpée en k x k tuiles de (n/k) x (n/k) cellules.
+Chaque tuile est un labyrinthe parfait indépendant, généré par n'importe quel
+générateur de features.gen_many (en parallèle dans un pool de processus ; les
+tuiles voyagent en WallSet, 2 bits par cellule). Les tuiles sont ensuite
+cousues : un passage Kruskal sur le graphe des tuiles retient k² - 1 frontières
+(arbre couvrant des tuiles) et ouvre un seul mur, tiré au hasard, sur chacune.
+Arbres couvrants des tuiles + arbre couvrant entre tuiles = un seul arbre
+couvrant des n² cellules : le résultat reste un labyrinthe parfait.
+"""
+from __future__ import annotations
+import random
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Callable, Optional, Tuple
+import numpy as np
+from utils import Maze, PASSAGE
+from wallset import WallSet, EAST, SOUTH
+from features.gen_kruskal import UnionFind
+from features.gen_many import GENERATORS, build_walls
+
+OnStep = Optional[Callable[[List[List[str]]], None]]
+OnDelta = Optional[Callable[[int, int, str], None]]  # (ligne, colonne, nouveau caractère)
+
+
+class TiledGenerator:
+    """
+    - n    : côté du labyrinthe (cellules logiques), multiple de k
+    - k    : tuiles par côté (k x k tuiles)
+    - base : clé de features.gen_many.GENERATORS pour les tuiles
+    - jobs : processus du pool (1 = séquentiel) ; ou `executor` fourni par l'appelant
+    Avec une seed, les seeds des tuiles et la couture en dérivent : résultat
+    identique quel que soit le nombre de processus.
+    """
+    VERSION = 1
+
+    def __init__(self, n: int, k: int, base: str = "backtrack_fast", seed: int | None = None,
+                 jobs: int = 1, executor: Executor | None = None):
+        if n < 1:
+            raise ValueError("n doit être >= 1")
+        if k < 1 or n % k:
+            raise ValueError(f"k={k} doit diviser n={n} (tuiles carrées de n/k cellules).")
+        if base not in GENERATORS:
+            raise ValueError(f"Algorithme inconnu: {base!r} (attendu: {', '.join(GENERATORS)})")
+        self.n = n
+        self.k = k
+        self.base = base
+        self.seed = seed
+        self.jobs = jobs
+        self.executor = executor
+
+    def cache_tag(self) -> str:
+        """Variante pour memo_cache : k et générateur des tuiles (avec sa VERSION)."""
+        base = GENERATORS[self.base]
+        return f"k{self.k}+{self.base}_v{getattr(base, 'func', base).VERSION}"
+
+    def _tiles(self, tile_seeds: List[int | None]) -> List[WallSet]:
+        specs = [(self.base, self.n // self.k, s) for s in tile_seeds]
+        if self.executor is not None:
+            return list(self.executor.map(build_walls, specs))
+        if self.jobs > 1 and len(specs) > 1:
+            with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+                return list(pool.map(build_walls, specs))
+        return [build_walls(s) for s in specs]
+
+    def _stitch(self, rng: random.Random) -> List[Tuple[int, int, int, int]]:
+        """
+        Kruskal sur le graphe k x k des tuiles : (ligne, colonne, flag, position)
+        pour chaque frontière retenue — flag EAST (tuile de droite) ou SOUTH
+        (tuile du dessous), position = cellule tirée le long de la frontière.
+        """
+        k, t = self.k, self.n // self.k
+        edges = [(r, c, flag) for r in range(k) for c in range(k)
+                 for flag in (EAST, SOUTH)
+                 if (flag == EAST and c + 1 < k) or (flag == SOUTH and r + 1 < k)]
+        rng.shuffle(edges)
+        uf = UnionFind(k * k)
+        doors = []
+        for r, c, flag in edges:
+            other = r * k + c + (1 if flag == EAST else k)
+            if uf.union(r * k + c, other):
+                doors.append((r, c, flag, rng.randrange(t)))
+        return doors
+
+    def generate_walls(self) -> WallSet:
+        n, k = self.n, self.k
+        t = n // k
+        rng = random.Random(self.seed)
+        tile_seeds = ([rng.getrandbits(63) for _ in range(k * k)] if self.seed is not None
+                      else [None] * (k * k))
+        tiles = self._tiles(tile_seeds)
+
+        flags = np.empty((n, n), dtype=np.uint8)
+        for i, tile in enumerate(tiles):
+            r, c = divmod(i, k)
+            flags[r * t:(r + 1) * t, c * t:(c + 1) * t] = tile._flags()
+        for r, c, flag, pos in self._stitch(rng):
+            if flag == EAST:   # mur est de la dernière colonne de la tuile (r, c)
+                flags[r * t + pos, (c + 1) * t - 1] |= EAST
+            else:              # mur sud de la dernière ligne de la tuile (r, c)
+                flags[(r + 1) * t - 1, c * t + pos] |= SOUTH
+        return WallSet.from_flags((flags & EAST) != 0, (flags & SOUTH) != 0)
+
+    def generate(self, on_step: OnStep = None, on_delta: OnDelta = None) -> Maze:
+        """
+        Sans callback : grille construite en bloc. Avec callbacks, les murs ouverts
+        sont rejoués dans l'ordre de lecture (on_step : grille entière, on_delta :
+        case modifiée), à partir de Maze.empty_from_n(n).
+        """
+        walls = self.generate_walls()
+        if on_step is None and on_delta is None:
+            return walls.to_maze()
+        n = self.n
+        maze = Maze.empty_from_n(n)
+        rows, cols = walls.passages()
+        opened = list(zip(rows.tolist(), cols.tolist())) + [(0, 1), (2 * n, 2 * n - 1)]
+        for r, c in opened:
+            maze.cells[r, c] = PASSAGE
+            if on_delta: on_delta(r, c, ".")
+            if on_step: on_step(maze.grid)
+        return maze
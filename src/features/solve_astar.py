@@ -1,11 +1,14 @@
 # src/features/solve_astar.py
 from __future__ import annotations
-from typing import Tuple, List, Dict, Optional, Callable
+from typing import Tuple, List, Optional, Callable
 import heapq
 from utils import Maze
+from features.solve_kernel import astar_search, mark_solution
+from wallset import WallSet, parent_dir, parent_table, seen_table, walls_path
 
 Coord = Tuple[int, int]
 OnStep = Optional[Callable[[List[List[str]]], None]]
+OnDelta = Optional[Callable[[int, int, str], None]]  # (ligne, colonne, nouveau caractère)
 
 class AStarSolver:
     """
@@ -14,6 +17,8 @@ class AStarSolver:
     - Marque '*' = cases explorées
     """
 
+    VERSION = 1
+
     def __init__(self):
         pass
 
@@ -23,59 +28,49 @@ class AStarSolver:
 
     def solve(self, maze: Maze,
               on_visit: OnStep = None,
-              on_path: OnStep = None) -> Maze:
+              on_path: OnStep = None,
+              on_delta: OnDelta = None) -> Maze:
+        """
+        Résout de (0,1) à (H-1, W-2) via le noyau plat (features.solve_kernel) ;
+        à f égal, le nœud de plus petite heuristique est développé en premier.
+        Les callbacks sont optionnels : s'ils sont fournis, les marques sont
+        rejouées case par case pour l'animation (chemin lent).
+        on_delta reçoit seulement chaque case marquée (r, c, '*'/'o').
+        """
         H, W = maze.ascii_height, maze.ascii_width
         start: Coord = (0, 1)
         goal:  Coord = (H - 1, W - 2)
+        result = astar_search(maze.cells, start, goal)
+        return mark_solution(maze, result, on_visit=on_visit, on_path=on_path, on_delta=on_delta)
 
-        grid = [row[:] for row in maze.grid]
-
-        def neighbors(r: int, c: int):
-            for dr, dc in ((1,0),(-1,0),(0,1),(0,-1)):
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < H and 0 <= nc < W and grid[nr][nc] == ".":
-                    yield nr, nc
-
-        open_set: List[Tuple[int, Coord]] = []
-        heapq.heappush(open_set, (0, start))
-
-        came_from: Dict[Coord, Optional[Coord]] = {start: None}
-        g_score: Dict[Coord, int] = {start: 0}
+    def solve_walls(self, walls: WallSet) -> List[Coord]:
+        """
+        A* directement sur un WallSet, sans construire la grille ASCII.
+        Retourne le chemin en cellules logiques de (0,0) à (n-1,n-1), [] si aucun.
+        g n'est pas stocké : il se déduit de f - h dans chaque entrée du tas.
+        Fermés sur 1 bit et directions parent sur 2 bits par cellule.
+        """
+        n = walls.n
+        start, goal = 0, n * n - 1
+        gr, gc = divmod(goal, n)
 
-        visited = set()
+        def h(i: int) -> int:
+            r, c = divmod(i, n)
+            return abs(r - gr) + abs(c - gc)
 
+        came = parent_table(n)
+        closed = seen_table(n)
+        open_set: List[Tuple[int, int, int]] = [(h(start), start, 0)]  # direction du départ ignorée
         while open_set:
-            _, current = heapq.heappop(open_set)
-            if current in visited:
+            f, i, d = heapq.heappop(open_set)
+            if closed[i >> 3] >> (i & 7) & 1:
                 continue
-            visited.add(current)
-
-            r, c = current
-            if current == goal:
-                # reconstruire le chemin
-                node: Optional[Coord] = goal
-                while node is not None:
-                    rr, cc = node
-                    grid[rr][cc] = "o"
-                    if on_path: on_path(grid)
-                    node = came_from[node]
-                grid[start[0]][start[1]] = "o"
-                grid[goal[0]][goal[1]] = "o"
-                if on_path: on_path(grid)
-                return Maze(grid)
-
-            # marquer comme exploré
-            if current != start and grid[r][c] == ".":
-                grid[r][c] = "*"
-                if on_visit: on_visit(grid)
-
-            for nb in neighbors(r, c):
-                tentative_g = g_score[current] + 1
-                if tentative_g < g_score.get(nb, 1e9):
-                    came_from[nb] = current
-                    g_score[nb] = tentative_g
-                    f = tentative_g + self.heuristic(nb, goal)
-                    heapq.heappush(open_set, (f, nb))
-
-        # si pas de chemin trouvé
-        return Maze(grid)
+            closed[i >> 3] |= 1 << (i & 7)
+            came[i >> 2] |= d << ((i & 3) << 1)
+            if i == goal:
+                return walls_path(came, n, goal)
+            g = f - h(i) + 1
+            for j in walls.neighbors(i):
+                if not closed[j >> 3] >> (j & 7) & 1:
+                    heapq.heappush(open_set, (g + h(j), j, parent_dir(i, j, n)))
+        return []
@@ -1,62 +1,56 @@
 # src/features/solve_backtrack.py
 from __future__ import annotations
-from typing import Tuple, List, Dict, Optional, Callable
+from typing import Tuple, List, Optional, Callable
 from utils import Maze
+from features.solve_kernel import dfs_search, mark_solution
+from wallset import WallSet, parent_dir, parent_table, seen_table, walls_path
 
 Coord = Tuple[int, int]
 OnStep = Optional[Callable[[List[List[str]]], None]]
+OnDelta = Optional[Callable[[int, int, str], None]]  # (ligne, colonne, nouveau caractère)
+
 
 class BacktrackingSolver:
     """DFS itératif – callbacks on_visit/on_path pour l'animation."""
+    VERSION = 1
     def __init__(self):
         pass
 
     def solve(self, maze: Maze,
               on_visit: OnStep = None,
-              on_path: OnStep = None) -> Maze:
+              on_path: OnStep = None,
+              on_delta: OnDelta = None) -> Maze:
+        """
+        Résout de (0,1) à (H-1, W-2) via le noyau plat (features.solve_kernel).
+        Les callbacks sont optionnels : s'ils sont fournis, les marques sont
+        rejouées case par case pour l'animation (chemin lent).
+        on_delta reçoit seulement chaque case marquée (r, c, '*'/'o').
+        """
         H, W = maze.ascii_height, maze.ascii_width
         start: Coord = (0, 1)
         goal:  Coord = (H - 1, W - 2)
-        grid = [row[:] for row in maze.grid]
-
-        def neighbors(r: int, c: int):
-            for dr, dc in ((1,0),(-1,0),(0,1),(0,-1)):
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < H and 0 <= nc < W and grid[nr][nc] == ".":
-                    yield nr, nc
-
-        visited = [[False]*W for _ in range(H)]
-        parent: Dict[Coord, Optional[Coord]] = {start: None}
-        stack: List[Coord] = [start]
-        visited[start[0]][start[1]] = True
-
-        found = False
+        result = dfs_search(maze.cells, start, goal)
+        return mark_solution(maze, result, on_visit=on_visit, on_path=on_path, on_delta=on_delta)
+
+    def solve_walls(self, walls: WallSet) -> List[Coord]:
+        """
+        DFS directement sur un WallSet, sans construire la grille ASCII.
+        Retourne le chemin en cellules logiques de (0,0) à (n-1,n-1), [] si aucun.
+        Visités sur 1 bit et directions parent sur 2 bits par cellule.
+        """
+        n = walls.n
+        start, goal = 0, n * n - 1
+        came = parent_table(n)
+        seen = seen_table(n)
+        seen[start >> 3] |= 1 << (start & 7)
+        stack: List[int] = [start]
         while stack:
-            r, c = stack.pop()
-            if (r, c) == goal:
-                found = True
-                break
-            if (r, c) != start and grid[r][c] == ".":
-                grid[r][c] = "*"
-                if on_visit: on_visit(grid)  # <-- animation exploration
-
-            for nr, nc in neighbors(r, c):
-                if not visited[nr][nc]:
-                    visited[nr][nc] = True
-                    parent[(nr, nc)] = (r, c)
-                    stack.append((nr, nc))
-
-        if not found:
-            return Maze(grid)
-
-        node: Optional[Coord] = goal
-        while node is not None:
-            rr, cc = node
-            grid[rr][cc] = "o"
-            if on_path: on_path(grid)       # <-- animation “chemin final”
-            node = parent.get(node)
-
-        grid[start[0]][start[1]] = "o"
-        grid[goal[0]][goal[1]] = "o"
-        if on_path: on_path(grid)
-        return Maze(grid)
+            i = stack.pop()
+            if i == goal:
+                return walls_path(came, n, goal)
+            for j in walls.neighbors(i):
+                if not seen[j >> 3] >> (j & 7) & 1:
+                    seen[j >> 3] |= 1 << (j & 7)
+                    came[j >> 2] |= parent_dir(i, j, n) << ((j & 3) << 1)
+                    stack.append(j)
+        return []
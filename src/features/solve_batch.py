@@ -0,0 +1,182 @@
+# src/features/solve_batch.py
+"""
+Résolution par lots : un labyrinthe, beaucoup de requêtes (départ, arrivée).
+Les requêtes sont regroupées par extrémité commune ; pour chaque source
+distincte, un seul BFS calcule un champ distance/parent sur toute la grille,
+puis chaque chemin se lit en remontant les parents (O(longueur du chemin)).
+Les champs restent dans un cache LRU borné en octets (un champ coûte environ
+5 octets par case paddée), clé = (empreinte du maze, source) ; l'empreinte
+est calculée une seule fois par lot.
+"""
+from __future__ import annotations
+from array import array
+from collections import Counter, OrderedDict
+from typing import Iterable, List, Tuple
+import numpy as np
+from utils import Maze
+from features.solve_kernel import DOWN, UP, RIGHT, LEFT, ROOT, padded_passable
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+Coord = Tuple[int, int]
+Query = Tuple[Coord, Coord]
+
+
+class DistanceField:
+    """Champ BFS depuis une source : distance (-1 = inatteignable ou mur) et direction du parent, en index paddés."""
+    __slots__ = ("source", "shape", "P", "came", "dist")
+
+    def __init__(self, source: Coord, shape: Tuple[int, int], P: int, came: bytearray, dist: array):
+        self.source = source
+        self.shape = shape
+        self.P = P
+        self.came = came
+        self.dist = dist
+
+    @classmethod
+    def compute(cls, cells: np.ndarray, source: Coord) -> "DistanceField":
+        free, P = padded_passable(cells)
+        s = (source[0] + 1) * P + source[1] + 1
+        came = bytearray(len(free))
+        dist = array("i", [-1]) * len(free)
+        if not free[s]:  # source sur un mur : rien n'est atteignable
+            return cls(source, cells.shape, P, came, dist)
+        came[s] = ROOT
+        dist[s] = 0
+        free[s] = 0
+        queue = array("i", [s])
+        push = queue.append
+        pos = 0
+        while pos < len(queue):
+            p = queue[pos]
+            pos += 1
+            d = dist[p] + 1
+            x = p + P
+            if free[x]:
+                free[x] = 0; came[x] = DOWN; dist[x] = d; push(x)
+            x = p - P
+            if free[x]:
+                free[x] = 0; came[x] = UP; dist[x] = d; push(x)
+            x = p + 1
+            if free[x]:
+                free[x] = 0; came[x] = RIGHT; dist[x] = d; push(x)
+            x = p - 1
+            if free[x]:
+                free[x] = 0; came[x] = LEFT; dist[x] = d; push(x)
+        return cls(source, cells.shape, P, came, dist)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.came) + self.dist.itemsize * len(self.dist)
+
+    def _flat(self, cell: Coord) -> int:
+        return (cell[0] + 1) * self.P + cell[1] + 1
+
+    def distance(self, target: Coord) -> int:
+        return self.dist[self._flat(target)]
+
+    def path_from(self, target: Coord) -> np.ndarray:
+        """Chemin target -> source en coordonnées (k, 2) int32 ; vide si inatteignable."""
+        p = self._flat(target)
+        if self.dist[p] < 0:
+            return np.zeros((0, 2), dtype=np.int32)
+        P, came = self.P, self.came
+        offs = (0, P, -P, 1, -1, 0)  # ROOT : on reste sur place (dernier tour)
+        out = array("i", [0]) * (self.dist[p] + 1)
+        for k in range(len(out)):
+            out[k] = p
+            p -= offs[came[p]]
+        flat = np.frombuffer(out, dtype=np.int32)
+        return np.stack((flat // P - 1, flat % P - 1), axis=1).astype(np.int32)
+
+
+class BatchSolver:
+    """
+    API multi-requêtes : solve_many(maze, [(start, goal), ...]) renvoie un
+    tableau (k, 2) de coordonnées par requête (chemin start -> goal, plus court
+    chemin BFS), sans copier ni marquer le Maze.
+    """
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes < 0:
+            raise ValueError("max_bytes doit être >= 0")
+        self.max_bytes = max_bytes
+        self._cache: OrderedDict[Tuple[str, Coord], DistanceField] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def field(self, maze: Maze, source: Coord, fingerprint: str | None = None) -> DistanceField:
+        """
+        Champ BFS depuis `source` (cache LRU par (empreinte, source)). Passer
+        `fingerprint` évite de rehacher toute la grille à chaque appel.
+        """
+        self._check(maze, source)
+        key = (fingerprint or maze.fingerprint(), tuple(source))
+        field = self._cache.get(key)
+        if field is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return field
+        self.misses += 1
+        field = DistanceField.compute(maze.cells, key[1])
+        if field.nbytes <= self.max_bytes:  # plus gros que tout le budget : pas mis en cache
+            self._cache[key] = field
+            self.bytes += field.nbytes
+            while self.bytes > self.max_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self.bytes -= evicted.nbytes
+        return field
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self.bytes = 0
+
+    @staticmethod
+    def _check(maze: Maze, cell: Coord) -> None:
+        H, W = maze.ascii_height, maze.ascii_width
+        if not (0 <= cell[0] < H and 0 <= cell[1] < W):
+            raise ValueError(f"Case hors grille {H}x{W}: {cell}")
+
+    def _groups(self, maze: Maze, queries: Iterable[Query]):
+        """
+        Regroupe les requêtes par source BFS : pour chacune, on part de
+        l'extrémité la plus partagée (graphe non orienté, chemin symétrique).
+        Renvoie (nombre de requêtes, {source: [(indice, cible, depuis_départ)]}).
+        """
+        queries = [(tuple(a), tuple(b)) for a, b in queries]
+        freq = Counter()
+        for a, b in queries:
+            self._check(maze, a)
+            self._check(maze, b)
+            freq[a] += 1
+            freq[b] += 1
+        groups: dict[Coord, List[Tuple[int, Coord, bool]]] = {}
+        for k, (a, b) in enumerate(queries):
+            if freq[a] >= freq[b]:
+                groups.setdefault(a, []).append((k, b, True))
+            else:
+                groups.setdefault(b, []).append((k, a, False))
+        return len(queries), groups
+
+    def solve_many(self, maze: Maze, queries: Iterable[Query]) -> List[np.ndarray]:
+        """Un chemin (k, 2) int32 start -> goal par requête ; tableau vide si aucun chemin."""
+        count, groups = self._groups(maze, queries)
+        fp = maze.fingerprint()
+        paths: List[np.ndarray] = [None] * count
+        for src, items in groups.items():
+            field = self.field(maze, src, fp)
+            for k, dst, from_start in items:
+                path = field.path_from(dst)
+                paths[k] = path[::-1] if from_start else path
+        return paths
+
+    def distances(self, maze: Maze, queries: Iterable[Query]) -> np.ndarray:
+        """Longueur (en pas) du plus court chemin par requête, -1 si aucun."""
+        count, groups = self._groups(maze, queries)
+        fp = maze.fingerprint()
+        out = np.empty(count, dtype=np.int64)
+        for src, items in groups.items():
+            field = self.field(maze, src, fp)
+            for k, dst, _ in items:
+                out[k] = field.distance(dst)
+        return out
@@ -0,0 +1,129 @@
+# src/features/solve_bidir.py
+from __future__ import annotations
+from array import array
+from typing import Tuple, List, Optional, Callable
+import numpy as np
+from utils import Maze
+from features.solve_kernel import (SearchResult, DOWN, UP, RIGHT, LEFT, ROOT,
+                                   padded_passable, trace_path, unpad, mark_solution)
+from wallset import WallSet, parent_dir, parent_table, seen_table, walls_path
+
+Coord = Tuple[int, int]
+OnStep = Optional[Callable[[List[List[str]]], None]]
+OnDelta = Optional[Callable[[int, int, str], None]]  # (ligne, colonne, nouveau caractère)
+
+
+def bidir_search(cells: np.ndarray, start: Coord, goal: Coord) -> SearchResult:
+    """
+    BFS lancé simultanément depuis l'entrée et la sortie, couche par couche
+    (on étend toujours la frontière la plus petite). Arrêt dès que les deux
+    arbres se touchent : la première rencontre donne un plus court chemin.
+    Même convention de résultat que dfs_search / astar_search.
+    """
+    H, W = cells.shape
+    free, P = padded_passable(cells)
+    offs = (0, P, -P, 1, -1)
+    s = (start[0] + 1) * P + start[1] + 1
+    g = (goal[0] + 1) * P + goal[1] + 1
+    explored = array("i")
+    if s == g:
+        return True, unpad(array("i", [g]), P, W), unpad(explored, P, W)
+
+    came = bytearray(len(free))   # direction vers le parent, dans l'arbre du côté
+    side = bytearray(len(free))   # 1 = atteint depuis l'entrée, 2 = depuis la sortie
+    came[s] = came[g] = ROOT
+    side[s], side[g] = 1, 2
+    free[s] = free[g] = 0
+    fronts = {1: [s], 2: [g]}
+    visit = explored.append
+    meet = None
+
+    while fronts[1] and fronts[2] and meet is None:
+        k = 1 if len(fronts[1]) <= len(fronts[2]) else 2
+        nxt: List[int] = []
+        push = nxt.append
+        for p in fronts[k]:
+            if p != s and p != g:
+                visit(p)
+            for d in (DOWN, UP, RIGHT, LEFT):
+                q = p + offs[d]
+                if free[q]:
+                    free[q] = 0
+                    side[q] = k
+                    came[q] = d
+                    push(q)
+                elif side[q] and side[q] != k:
+                    meet = (p, q) if k == 1 else (q, p)
+                    break
+            if meet is not None:
+                break
+        fronts[k] = nxt
+
+    if meet is None:
+        return False, unpad(array("i"), P, W), unpad(explored, P, W)
+    # chemin but -> départ : sortie..b (renversé) puis a..entrée
+    a, b = meet
+    path = trace_path(came, offs, b)
+    path.reverse()
+    path.extend(trace_path(came, offs, a))
+    return True, unpad(path, P, W), unpad(explored, P, W)
+
+
+class BidirectionalSolver:
+    """
+    BFS bidirectionnel (entrée et sortie en même temps) – plus court chemin.
+    - Marque 'o' = chemin final
+    - Marque '*' = cases explorées (des deux côtés)
+    """
+    VERSION = 1
+
+    def __init__(self):
+        pass
+
+    def solve(self, maze: Maze,
+              on_visit: OnStep = None,
+              on_path: OnStep = None,
+              on_delta: OnDelta = None) -> Maze:
+        """
+        Résout de (0,1) à (H-1, W-2). Les callbacks sont optionnels : s'ils sont
+        fournis, les marques sont rejouées case par case (chemin lent).
+        on_delta reçoit seulement chaque case marquée (r, c, '*'/'o').
+        """
+        H, W = maze.ascii_height, maze.ascii_width
+        start: Coord = (0, 1)
+        goal:  Coord = (H - 1, W - 2)
+        result = bidir_search(maze.cells, start, goal)
+        return mark_solution(maze, result, on_visit=on_visit, on_path=on_path, on_delta=on_delta)
+
+    def solve_walls(self, walls: WallSet) -> List[Coord]:
+        """
+        BFS bidirectionnel directement sur un WallSet.
+        Retourne le chemin en cellules logiques de (0,0) à (n-1,n-1), [] si aucun.
+        Par cellule : visitée (1 bit), côté sortie (1 bit), direction parent (2 bits).
+        """
+        n = walls.n
+        start, goal = 0, n * n - 1
+        if start == goal:
+            return [(0, 0)]
+        came = parent_table(n)
+        seen = seen_table(n)
+        side = seen_table(n)  # bit à 1 : atteinte depuis la sortie
+        for i in (start, goal):
+            seen[i >> 3] |= 1 << (i & 7)
+        side[goal >> 3] |= 1 << (goal & 7)
+        fronts = {0: [start], 1: [goal]}
+        while fronts[0] and fronts[1]:
+            k = 0 if len(fronts[0]) <= len(fronts[1]) else 1
+            nxt: List[int] = []
+            for i in fronts[k]:
+                for j in walls.neighbors(i):
+                    if not seen[j >> 3] >> (j & 7) & 1:
+                        seen[j >> 3] |= 1 << (j & 7)
+                        side[j >> 3] |= k << (j & 7)
+                        came[j >> 2] |= parent_dir(i, j, n) << ((j & 3) << 1)
+                        nxt.append(j)
+                    elif side[j >> 3] >> (j & 7) & 1 != k:
+                        a, b = (i, j) if k == 0 else (j, i)
+                        return walls_path(came, n, a) + walls_path(came, n, b, root=goal)[::-1]
+            fronts[k] = nxt
+        return []
@@ -0,0 +1,253 @@
+# src/features/solve_kernel.py
+"""
+Noyau de résolution commun (DFS / A*) sur index plat.
+La grille est aplatie avec une bordure de murs : les voisins de p sont
+p + P, p - P, p + 1, p - 1 (P = largeur + 2), sans aucun test de bornes.
+visited/parent tiennent dans un bytearray (direction vers le parent), les
+piles et seaux (A*) ne contiennent que des int : aucun tuple alloué par étape.
+"""
+from __future__ import annotations
+from array import array
+from typing import Callable, List, Optional, Tuple
+import numpy as np
+from utils import Maze, PASSAGE, PATH, EXPLORED
+
+Coord = Tuple[int, int]
+OnStep = Optional[Callable[[List[List[str]]], None]]
+OnDelta = Optional[Callable[[int, int, str], None]]  # (ligne, colonne, nouveau caractère)
+# (trouvé, chemin but -> départ, cases explorées dans l'ordre), en index plats non paddés
+SearchResult = Tuple[bool, np.ndarray, np.ndarray]
+
+# codes de direction (came[q] = d : q atteint depuis q - offs[d]) ; 0 = non visité
+DOWN, UP, RIGHT, LEFT, ROOT = 1, 2, 3, 4, 5
+_INF = 2**31 - 1
+
+
+def padded_passable(cells: np.ndarray) -> Tuple[bytearray, int]:
+    """Cases '.' aplaties avec une bordure de murs, et la largeur paddée P."""
+    H, W = cells.shape
+    pad = np.zeros((H + 2, W + 2), dtype=np.uint8)
+    pad[1:-1, 1:-1] = cells == PASSAGE
+    return bytearray(pad.tobytes()), W + 2
+
+
+def unpad(idx: array, P: int, W: int) -> np.ndarray:
+    """Index paddés -> index plats de la grille d'origine (r * W + c)."""
+    a = np.frombuffer(idx, dtype=np.int32).astype(np.int64) if len(idx) else np.zeros(0, np.int64)
+    return (a // P - 1) * W + (a % P - 1)
+
+
+def trace_path(came: bytearray, offs: Tuple[int, ...], goal: int) -> array:
+    """Chemin en index paddés, de goal jusqu'à la case ROOT, en remontant came (voir DOWN..LEFT)."""
+    path = array("i")
+    p = goal
+    while came[p] != ROOT:
+        path.append(p)
+        p -= offs[came[p]]
+    path.append(p)
+    return path
+
+
+def is_lattice(cells: np.ndarray) -> bool:
+    """
+    Grille "treillis" (labyrinthes générés) : aucune case (pair, pair) n'est un couloir.
+    Toute case ouverte est alors un centre (impair, impair) ou un passage entre deux
+    centres, dont les seuls voisins possibles sont alignés avec lui.
+    """
+    return not (cells[0::2, 0::2] == PASSAGE).any()
+
+
+def dfs_search(cells: np.ndarray, start: Coord, goal: Coord) -> SearchResult:
+    """DFS itératif (même ordre d'exploration que la version grille : bas, haut, droite, gauche)."""
+    H, W = cells.shape
+    free, P = padded_passable(cells)  # 1 = couloir pas encore découvert
+    offs = (0, P, -P, 1, -1)
+    s = (start[0] + 1) * P + start[1] + 1
+    g = (goal[0] + 1) * P + goal[1] + 1
+
+    came = bytearray(len(free))
+    came[s] = ROOT
+    free[s] = 0
+    explored = array("i")
+    stack = [s]
+    pop, push, visit = stack.pop, stack.append, explored.append
+    found = False
+
+    if start[0] == 0 and is_lattice(cells):
+        # Treillis : la pile ne contient que des passages. Dépiler un passage ne peut
+        # découvrir que la case en face, qui serait dépilée juste après : on la traite
+        # directement (même ordre de visite, deux fois moins de tours de boucle).
+        while stack:
+            q = pop()
+            if q == g:
+                found = True
+                break
+            if q != s:
+                visit(q)
+            d = came[q] if q != s else DOWN  # l'entrée (ligne 0) ne s'ouvre que vers le bas
+            p = q + offs[d]
+            if not free[p]:
+                continue
+            free[p] = 0
+            came[p] = d
+            if p == g:
+                found = True
+                break
+            visit(p)
+            x = p + P
+            if free[x]:
+                free[x] = 0; came[x] = DOWN; push(x)
+            x = p - P
+            if free[x]:
+                free[x] = 0; came[x] = UP; push(x)
+            x = p + 1
+            if free[x]:
+                free[x] = 0; came[x] = RIGHT; push(x)
+            x = p - 1
+            if free[x]:
+                free[x] = 0; came[x] = LEFT; push(x)
+    else:
+        while stack:
+            p = pop()
+            if p == g:
+                found = True
+                break
+            if p != s:
+                visit(p)
+            x = p + P
+            if free[x]:
+                free[x] = 0; came[x] = DOWN; push(x)
+            x = p - P
+            if free[x]:
+                free[x] = 0; came[x] = UP; push(x)
+            x = p + 1
+            if free[x]:
+                free[x] = 0; came[x] = RIGHT; push(x)
+            x = p - 1
+            if free[x]:
+                free[x] = 0; came[x] = LEFT; push(x)
+
+    path = trace_path(came, offs, g) if found else array("i")
+    return found, unpad(path, P, W), unpad(explored, P, W)
+
+
+def astar_search(cells: np.ndarray, start: Coord, goal: Coord) -> SearchResult:
+    """
+    A* (Manhattan), ordre de développement (f, h, index) : à f égal, la plus
+    petite heuristique h sort en premier. Sans tas binaire :
+    - pas unitaires + heuristique cohérente : f d'un voisin vaut f (il se
+      rapproche du but, h - 1) ou f + 2 ; les f se traitent donc par seaux
+      croissants, chaque seau trié une fois (entiers h * N + p, tri natif) ;
+      dans le seau f + 2, h = f + 2 - g : ni abs() ni divmod par voisin ;
+    - un voisin de même f a une clé plus petite que tout ce qui reste : il
+      serait dépilé aussitôt, on l'empile sur une petite pile LIFO (plus
+      petit index au sommet) au lieu de passer par le seau.
+    Même ordre d'exploration qu'une file de priorité sur (f, h, index).
+    """
+    H, W = cells.shape
+    free, P = padded_passable(cells)  # 1 = couloir pas encore fermé
+    N = len(free)
+    s = (start[0] + 1) * P + start[1] + 1
+    g = (goal[0] + 1) * P + goal[1] + 1
+    gr, gc = divmod(g, P)
+    above, below = gr * P, (gr + 1) * P  # p < above : ligne au-dessus du but ; p >= below : en dessous
+
+    came = bytearray(N)
+    gscore = array("i", [_INF]) * N
+    came[s] = ROOT
+    gscore[s] = 0
+    sr, sc = divmod(s, P)
+    f = abs(sr - gr) + abs(sc - gc)
+    bucket = [f * N + s]  # seau courant : clés h * N + p de même f
+    explored = array("i")
+    visit = explored.append
+    found = False
+    while bucket and not found:
+        bucket.sort()
+        later: List[int] = []  # seau f + 2
+        push_later = later.append
+        for key in bucket:
+            stack = [key % N]
+            while stack:
+                p = stack.pop()
+                if not free[p]:
+                    continue
+                free[p] = 0
+                if p == g:
+                    found = True
+                    break
+                if p != s:
+                    visit(p)
+                gq = gscore[p] + 1
+                hk = (f + 2 - gq) * N  # clé h * N d'un voisin qui s'éloigne (seau f + 2)
+                pc = p % P
+                near = []  # voisins de même f (au plus deux), index croissants
+                q = p - P
+                if free[q] and gq < gscore[q]:
+                    gscore[q] = gq; came[q] = UP
+                    if p >= below: near.append(q)
+                    else: push_later(hk + q)
+                q = p - 1
+                if free[q] and gq < gscore[q]:
+                    gscore[q] = gq; came[q] = LEFT
+                    if pc > gc: near.append(q)
+                    else: push_later(hk + q)
+                q = p + 1
+                if free[q] and gq < gscore[q]:
+                    gscore[q] = gq; came[q] = RIGHT
+                    if pc < gc: near.append(q)
+                    else: push_later(hk + q)
+                q = p + P
+                if free[q] and gq < gscore[q]:
+                    gscore[q] = gq; came[q] = DOWN
+                    if p < above: near.append(q)
+                    else: push_later(hk + q)
+                if near:
+                    near.reverse()  # plus petit index au sommet
+                    stack.extend(near)
+            if found:
+                break
+        bucket = later
+        f += 2
+
+    path = trace_path(came, (0, P, -P, 1, -1), g) if found else array("i")
+    return found, unpad(path, P, W), unpad(explored, P, W)
+
+
+def mark_solution(maze: Maze, result: SearchResult,
+                  on_visit: OnStep = None, on_path: OnStep = None,
+                  on_delta: OnDelta = None) -> Maze:
+    """
+    Applique le résultat sur une copie du maze : '*' explorées, 'o' chemin.
+    Chemin rapide : deux affectations en bloc. Avec callbacks (opt-in, lent) :
+    rejoue les marques une à une sur une grille list[list[str]] comme avant.
+    on_delta reçoit chaque marque (r, c, '*' puis 'o') sans aucune grille.
+    """
+    found, path, explored = result
+    W = maze.ascii_width
+    if on_delta:
+        for p in explored.tolist():
+            on_delta(p // W, p % W, "*")
+        if found:
+            for p in path.tolist():
+                on_delta(p // W, p % W, "o")
+    if on_visit or on_path:
+        grid = [row[:] for row in maze.grid]
+        for p in explored.tolist():
+            r, c = divmod(p, W)
+            grid[r][c] = "*"
+            if on_visit: on_visit(grid)
+        if found:
+            for p in path.tolist():
+                r, c = divmod(p, W)
+                grid[r][c] = "o"
+                if on_path: on_path(grid)
+            if on_path: on_path(grid)
+        return Maze(grid)
+
+    solved = maze.copy()
+    flat = solved.cells.reshape(-1)
+    flat[explored] = EXPLORED
+    if found:
+        flat[path] = PATH
+    return solved
@@ -1,7 +1,172 @@
-try:
-    from .menu import run
-except Exception:
-    from menu import run
+# src/main.py
+"""
+Point d'entrée. Sans sous-commande : menu interactif. Avec sous-commande,
+exécution non interactive (scripts, traitements par lots) :
+
+    python src/main.py generate --algo kruskal -n 50 --seed 7 --out maze_50.maze
+    python src/main.py solve maze_50.maze --solver bidir --out solution_50.txt
+    python src/main.py export solution_50.txt --out maze_50.png --cell-size 4
+    python src/main.py bench --sizes 10 50 --repeats 3
+
+Démarrage rapide : chaque sous-commande n'importe que ce qu'elle utilise
+(un seul générateur / solveur, Pillow seulement pour les formats non PNG,
+jamais le menu). Sans --out, la grille ASCII est écrite sur la sortie standard.
+"""
+from __future__ import annotations
+import argparse
+import sys
+from pathlib import Path
+
+# nom -> (module, classe, options) : mêmes clés que features.gen_many.GENERATORS,
+# mais le module n'est importé qu'à l'exécution de la commande
+GENERATORS = {
+    "backtrack": ("features.gen_backtrack", "BacktrackingGenerator", {}),
+    "backtrack_fast": ("features.gen_backtrack", "BacktrackingGenerator", {"fast": True}),
+    "kruskal": ("features.gen_kruskal", "KruskalGenerator", {}),
+    "eller": ("features.gen_eller", "EllerGenerator", {}),
+    "binary_tree": ("features.gen_binary_tree", "BinaryTreeGenerator", {}),
+    "sidewinder": ("features.gen_sidewinder", "SidewinderGenerator", {}),
+}
+SOLVERS = {
+    "backtrack": ("features.solve_backtrack", "BacktrackingSolver"),
+    "astar": ("features.solve_astar", "AStarSolver"),
+    "bidir": ("features.solve_bidir", "BidirectionalSolver"),
+}
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts"
+
+
+def _load_class(module: str, name: str):
+    # __import__ plutôt qu'importlib.import_module : seul le premier apparaît dans -X importtime
+    return getattr(__import__(module, fromlist=[name]), name)
+
+
+def _load_source(src: str):
+    """Maze depuis un .txt / .maze (nom simple cherché dans data/outputs) ou un corpus 'f.amzc:algo:n:seed'."""
+    from utils import Maze, resolve_maze_file
+    if ".amzc:" in src:
+        from corpus import load_corpus_ref
+        try:
+            return load_corpus_ref(src)
+        except KeyError as e:
+            raise FileNotFoundError(e.args[0]) from None
+    path = resolve_maze_file(src)
+    if path is None:
+        raise FileNotFoundError(f"Fichier '{src}' introuvable.")
+    return Maze.load(path)
+
+
+def _write_maze(maze, out: str | None, **header) -> None:
+    """.maze -> binaire, sinon .txt ; sans --out : grille ASCII sur stdout."""
+    if out is None:
+        from utils import encode_txt
+        sys.stdout.buffer.write(encode_txt(maze.cells).tobytes())
+        sys.stdout.flush()
+        return
+    if Path(out).suffix.lower() == ".maze":
+        saved = maze.save_bin(out, **header)
+    else:
+        saved = maze.save_txt(out)
+    print(f"✅ Sauvegardé: {saved}")
+
+
+# ---------------- Sous-commandes ----------------
+def cmd_generate(args) -> int:
+    if args.tiles is not None:
+        from features.gen_tiled import TiledGenerator
+        gen = TiledGenerator(args.n, args.tiles, base=args.algo, seed=args.seed, jobs=args.jobs)
+    else:
+        module, name, options = GENERATORS[args.algo]
+        gen = _load_class(module, name)(args.n, seed=args.seed, **options)
+    _write_maze(gen.generate(), args.out, generator=args.algo, seed=args.seed)
+    return 0
+
+
+def cmd_solve(args) -> int:
+    maze = _load_source(args.src)
+    solver = _load_class(*SOLVERS[args.solver])()
+    if args.cache is not None:
+        from memo_cache import MemoCache
+        solved = MemoCache(disk_dir=args.cache).solve(solver, maze)
+    else:
+        solved = solver.solve(maze)
+    _write_maze(solved, args.out)
+    return 0
+
+
+def cmd_export(args) -> int:
+    from features.export_img import AsciiExporter
+    maze = _load_source(args.src)
+    exporter = AsciiExporter(cell_size=args.cell_size)
+    # PNG en flux : ni Pillow ni image entière en mémoire ; autres formats via Pillow
+    if Path(args.out).suffix.lower() in ("", ".png"):
+        saved = exporter.export_stream(maze, args.out)
+    else:
+        saved = exporter.export(maze, args.out)
+    print(f"✅ Image exportée: {saved}")
+    return 0
+
+
+def cmd_bench(args) -> int:
+    if str(SCRIPTS) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS))  # importable par nom : les workers du pool le réimportent
+    import internal_bench
+    return internal_bench.main(args.bench_args)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    from config import CACHE_DIR
+    p = argparse.ArgumentParser(description="amazing-mazes: interactive menu (no command) or batch commands")
+    sub = p.add_subparsers(dest="command", metavar="{generate,solve,export,bench}")
+
+    g = sub.add_parser("generate", help="Generate a maze")
+    g.add_argument("--algo", choices=list(GENERATORS), default="backtrack_fast", help="Generator (default backtrack_fast)")
+    g.add_argument("-n", type=int, default=5, help="Side in logical cells (default 5)")
+    g.add_argument("--seed", type=int, help="Seed (reproducible output)")
+    g.add_argument("--tiles", type=int, metavar="K", help="Tiled generation: K x K tiles of the chosen algo")
+    g.add_argument("--jobs", type=int, default=1, help="Worker processes for --tiles (default 1)")
+    g.add_argument("--out", help="Output .txt or .maze (default: ASCII on stdout)")
+    g.set_defaults(func=cmd_generate)
+
+    s = sub.add_parser("solve", help="Solve a maze (.txt, .maze or corpus.amzc:algo:n:seed)")
+    s.add_argument("src", help="Source maze")
+    s.add_argument("--solver", choices=list(SOLVERS), default="astar", help="Solver (default astar)")
+    s.add_argument("--cache", nargs="?", const=str(CACHE_DIR), metavar="DIR",
+                   help=f"Memoize the solution (memory + disk store, default {CACHE_DIR})")
+    s.add_argument("--out", help="Output .txt or .maze (default: ASCII on stdout)")
+    s.set_defaults(func=cmd_solve)
+
+    e = sub.add_parser("export", help="Export a maze to an image")
+    e.add_argument("src", help="Source maze (.txt, .maze or corpus.amzc:algo:n:seed)")
+    e.add_argument("--out", default="maze.png", help="Output image (default data/outputs/images/maze.png)")
+    e.add_argument("--cell-size", type=int, default=10, help="Cell size in pixels (default 10)")
+    e.set_defaults(func=cmd_export)
+
+    # options laissées à internal_bench (voir main : parse_known_args)
+    b = sub.add_parser("bench", help="Run scripts/internal_bench.py (options forwarded)", add_help=False)
+    b.set_defaults(func=cmd_bench)
+    return p
+
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args, rest = parser.parse_known_args(argv)
+    if args.command == "bench":
+        args.bench_args = rest
+    elif rest:
+        parser.error(f"unrecognized arguments: {' '.join(rest)}")
+    if args.command is None:
+        try:
+            from .menu import run
+        except ImportError:
+            from menu import run
+        run()
+        return 0
+    try:
+        return args.func(args)
+    except (ValueError, FileNotFoundError) as e:
+        print(f"⚠️ {e}", file=sys.stderr)
+        return 2
+
 
 if __name__ == "__main__":
-    run()
+    sys.exit(main())
@@ -0,0 +1,209 @@
+# src/memo_cache.py
+"""
+Cache de mémoïsation à deux niveaux pour labyrinthes et solutions.
+
+- Niveau 1 : LRU en mémoire borné en octets (taille des cellules uint8).
+- Niveau 2 : fichiers .maze sous data/outputs/cache (mazes/ et solutions/),
+  écrits de façon atomique (fichier temporaire + os.replace) : plusieurs
+  processus du benchmark peuvent partager le même dossier.
+
+Clés :
+- labyrinthe : (classe du générateur, VERSION, variante, n, seed) — seed obligatoire,
+  variante = cache_tag() du générateur s'il en a un (paramètres qui changent la sortie),
+  une génération sans seed n'est pas reproductible et n'est jamais mise en cache ;
+- solution   : (empreinte du contenu du maze, classe du solveur, VERSION).
+
+Invalidation : chaque générateur / solveur porte un attribut de classe VERSION,
+à incrémenter quand sa sortie change pour les mêmes entrées. La version fait
+partie de la clé : les anciennes entrées ne sont plus jamais servies, et
+prune() supprime celles dont la version n'est plus la courante.
+"""
+from __future__ import annotations
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Tuple
+import numpy as np
+from config import CACHE_DIR
+from utils import Maze, read_maze_header, save_maze_bin, MAZE_HEADER_SIZE
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+Key = Tuple[str, ...]
+
+
+def _class_tag(obj) -> str:
+    """
+    Nom de classe + variante (ex. KruskalGenerator+fast, TiledGenerator+k4+eller_v1) :
+    la variante change la sortie. cache_tag() ne doit contenir ni '-' ni '.'.
+    """
+    name = type(obj).__name__
+    if hasattr(obj, "cache_tag"):
+        return f"{name}+{obj.cache_tag()}"
+    return name + "+fast" if getattr(obj, "fast", False) else name
+
+
+def maze_key(gen) -> Key | None:
+    """Clé d'un générateur configuré ; None s'il n'a pas de seed (non reproductible)."""
+    if gen.seed is None:
+        return None
+    return ("mazes", f"{_class_tag(gen)}-v{gen.VERSION}-n{gen.n}-s{gen.seed}")
+
+
+def solution_key(maze: Maze, solver) -> Key:
+    return ("solutions", f"{maze.fingerprint()}-{_class_tag(solver)}-v{solver.VERSION}")
+
+
+class MemoCache:
+    """
+    Cache labyrinthes / solutions. Les Maze rendus sont toujours des copies
+    modifiables : marquer un résultat n'altère pas le cache.
+    - max_bytes : budget du LRU mémoire (0 = pas de niveau mémoire)
+    - disk_dir  : dossier du niveau disque (None = pas de niveau disque)
+
+        cache = MemoCache()
+        maze = cache.maze(KruskalGenerator(200, seed=7))
+        solved = cache.solve(AStarSolver(), maze)
+        print(cache.stats())
+    """
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, disk_dir: str | Path | None = CACHE_DIR):
+        if max_bytes < 0:
+            raise ValueError("max_bytes doit être >= 0")
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir is not None else None
+        self._mem: OrderedDict[Key, np.ndarray] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ------------------------------------------------------------------
+    # Niveau mémoire
+    # ------------------------------------------------------------------
+    def _remember(self, key: Key, cells: np.ndarray) -> None:
+        size = cells.nbytes
+        if size > self.max_bytes:
+            return  # plus gros que tout le budget : disque seulement
+        old = self._mem.pop(key, None)
+        if old is not None:
+            self.bytes -= old.nbytes
+        self._mem[key] = cells
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            _, evicted = self._mem.popitem(last=False)
+            self.bytes -= evicted.nbytes
+            self.evictions += 1
+
+    # ------------------------------------------------------------------
+    # Niveau disque
+    # ------------------------------------------------------------------
+    def _path(self, key: Key) -> Path | None:
+        return self.disk_dir.joinpath(*key).with_suffix(".maze") if self.disk_dir is not None else None
+
+    def _read_disk(self, key: Key) -> np.ndarray | None:
+        path = self._path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            header = read_maze_header(path)
+            cells = np.fromfile(path, dtype=np.uint8, offset=MAZE_HEADER_SIZE)
+            return cells.reshape(header["height"], header["width"])
+        except ValueError:
+            return None  # fichier tronqué ou illisible : recalculé puis réécrit
+
+    def _write_disk(self, key: Key, cells: np.ndarray) -> None:
+        path = self._path(key)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = save_maze_bin(cells, path.with_name(f"{path.stem}~{os.getpid()}.maze"))
+        os.replace(tmp, path)
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+    def get(self, key: Key) -> Maze | None:
+        """Mémoire, puis disque (remonté en mémoire) ; None si absent (compté comme miss)."""
+        cells = self._mem.get(key)
+        if cells is not None:
+            self._mem.move_to_end(key)
+            self.hits += 1
+            return Maze(cells.copy())
+        cells = self._read_disk(key)
+        if cells is not None:
+            self.disk_hits += 1
+            self._remember(key, cells)
+            return Maze(cells.copy())
+        self.misses += 1
+        return None
+
+    def put(self, key: Key, maze: Maze) -> None:
+        cells = np.array(maze.cells, dtype=np.uint8)  # copie : le Maze appelant reste libre
+        self._remember(key, cells)
+        self._write_disk(key, cells)
+
+    def maze(self, gen) -> Maze:
+        """gen.generate() mémoïsé par (générateur, VERSION, n, seed)."""
+        key = maze_key(gen)
+        if key is None:
+            return gen.generate()
+        maze = self.get(key)
+        if maze is None:
+            maze = gen.generate()
+            self.put(key, maze)
+        return maze
+
+    def solve(self, solver, maze: Maze) -> Maze:
+        """solver.solve(maze) mémoïsé par (empreinte du maze, solveur, VERSION)."""
+        key = solution_key(maze, solver)
+        solved = self.get(key)
+        if solved is None:
+            solved = solver.solve(maze)
+            self.put(key, solved)
+        return solved
+
+    def clear(self, disk: bool = False) -> None:
+        """Vide le niveau mémoire ; disk=True supprime aussi les fichiers du cache."""
+        self._mem.clear()
+        self.bytes = 0
+        if disk and self.disk_dir is not None:
+            for path in self.disk_dir.glob("*/*.maze"):
+                path.unlink()
+
+    @staticmethod
+    def _owner(key: Key) -> Tuple[str, str]:
+        """(classe, 'v<VERSION>') d'une clé : mazes/<Classe>-v<V>-n<n>-s<seed>, solutions/<empreinte>-<Classe>-v<V>."""
+        parts = key[1].split("-")
+        tag, version = (parts[0], parts[1]) if key[0] == "mazes" else (parts[1], parts[2])
+        return tag.split("+")[0], version
+
+    def prune(self, classes: Iterable[type]) -> int:
+        """
+        Supprime (mémoire et disque) les entrées des classes données dont la
+        VERSION n'est plus la courante. Renvoie le nombre de fichiers supprimés.
+        """
+        current = {cls.__name__: f"v{cls.VERSION}" for cls in classes}
+
+        def stale(key: Key) -> bool:
+            name, version = self._owner(key)
+            return name in current and version != current[name]
+
+        for key in [k for k in self._mem if stale(k)]:
+            self.bytes -= self._mem.pop(key).nbytes
+        if self.disk_dir is None:
+            return 0
+        removed = 0
+        for path in self.disk_dir.glob("*/*.maze"):
+            if stale((path.parent.name, path.stem)):
+                path.unlink()
+                removed += 1
+        return removed
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+            "evictions": self.evictions, "entries": len(self._mem), "bytes": self.bytes,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
@@ -1,6 +1,7 @@
 # src/menu.py
 from __future__ import annotations
 from pathlib import Path
+import os
 import sys
 
 # --- Imports projet (tous en haut) ---
@@ -8,11 +9,22 @@ from config import MAZES_DIR, SOLUTIONS_DIR, IMAGES_DIR
 from utils import Maze, resolve_maze_file, measure_perf
 from features.gen_backtrack import BacktrackingGenerator
 from features.gen_kruskal import KruskalGenerator
+from features.gen_eller import EllerGenerator
+from features.gen_binary_tree import BinaryTreeGenerator
+from features.gen_sidewinder import SidewinderGenerator
+from features.gen_tiled import TiledGenerator
 from features.solve_backtrack import BacktrackingSolver
 from features.solve_astar import AStarSolver
+from features.solve_bidir import BidirectionalSolver
 from features.export_img import AsciiExporter
+from features.export_anim import AnimExporter
+from corpus import parse_corpus_ref, load_corpus_ref
+from memo_cache import MemoCache
 from visualize import ConsoleAnimator
 
+STREAM_EXPORT_PIXELS = 50_000_000
+_MEMO: MemoCache | None = None
+
 # ---------------- Helpers ----------------
 def ask_input_int(prompt: str, default: int | None = None) -> int:
     raw = input(prompt).strip()
@@ -42,14 +54,35 @@ def normalize_output_path(name: str | Path | None, default_dir: Path, default_na
 
 def strip_solution_marks(maze: Maze) -> Maze:
     """Remet un maze 'solution' en état brut en remplaçant 'o'/'*' par '.' pour visualiser la résolution."""
-    g = [row[:] for row in maze.grid]
-    h = len(g)
-    w = len(g[0]) if h else 0
-    for r in range(h):
-        for c in range(w):
-            if g[r][c] in ("o", "*"):
-                g[r][c] = "."
-    return Maze(g)
+    clean = maze.copy()
+    clean.replace("o*", ".")
+    return clean
+
+def memo_cache() -> MemoCache:
+    """
+    Cache des solutions partagé par les résolutions du menu (re-résoudre le même
+    maze = lecture). Mémoire seulement : une session interactive ne laisse pas
+    de fichiers sous data/outputs/cache (niveau disque sans limite de taille).
+    """
+    global _MEMO
+    if _MEMO is None:
+        _MEMO = MemoCache(disk_dir=None)
+    return _MEMO
+
+def resolve_source(src: str) -> str | None:
+    """Référence de corpus 'fichier.amzc:algo:n:seed' telle quelle, sinon resolve_maze_file."""
+    if parse_corpus_ref(src) is not None:
+        return src
+    return resolve_maze_file(src)
+
+def load_source(src: str) -> Maze:
+    """Charge un labyrinthe depuis un fichier .txt/.maze ou depuis un corpus .amzc."""
+    if parse_corpus_ref(src) is None:
+        return Maze.load(src)
+    try:
+        return load_corpus_ref(src)
+    except KeyError as e:
+        raise FileNotFoundError(e.args[0]) from None
 
 # ---------------- Handlers ----------------
 def handle_generate():
@@ -65,24 +98,60 @@ def handle_generate():
     print("Algorithme de génération :")
     print("  1) Backtracking (DFS)  (par défaut)")
     print("  2) Kruskal")
-    algo = input("Votre choix ? [1/2] (ENTER=1) ").strip() or "1"
-
-    out_raw = input(f"Fichier de sortie (.txt) ? (ENTER pour data/outputs/mazes/maze_{n}.txt) ").strip()
-    out_path = normalize_output_path(out_raw, MAZES_DIR, f"maze_{n}.txt", force_ext=".txt")
+    print("  3) Eller (flux ligne par ligne, très grands labyrinthes)")
+    print("  4) Binary Tree (NumPy vectorisé)")
+    print("  5) Sidewinder (NumPy vectorisé)")
+    print("  6) Tuilé multi-cœurs (k x k tuiles Backtracking en parallèle, très grands labyrinthes)")
+    algo = input("Votre choix ? [1/2/3/4/5/6] (ENTER=1) ").strip() or "1"
+
+    out_raw = input(f"Fichier de sortie (.txt ou .maze binaire) ? (ENTER pour data/outputs/mazes/maze_{n}.txt) ").strip()
+    binary = out_raw.lower().endswith(".maze") and algo != "3"
+    out_path = normalize_output_path(out_raw, MAZES_DIR, f"maze_{n}.txt",
+                                     force_ext=".maze" if binary else ".txt")
+
+    if algo == "3":
+        # Eller écrit directement sur disque : le maze n'est jamais en mémoire
+        try:
+            with measure_perf("Génération (Eller, flux)"):
+                saved = EllerGenerator(n).stream_txt(str(out_path))
+        except Exception as e:
+            print(f"Erreur lors de la génération : {e}")
+            return
+        print(f"✅ Généré (Eller): {saved}")
+        return
 
     try:
         if algo == "2":
             with measure_perf("Génération (Kruskal)"):
                 maze = KruskalGenerator(n).generate()
             algo_name = "Kruskal"
+        elif algo == "4":
+            with measure_perf("Génération (Binary Tree)"):
+                maze = BinaryTreeGenerator(n).generate()
+            algo_name = "BinaryTree"
+        elif algo == "5":
+            with measure_perf("Génération (Sidewinder)"):
+                maze = SidewinderGenerator(n).generate()
+            algo_name = "Sidewinder"
+        elif algo == "6":
+            k = ask_input_int("Tuiles par côté k (doit diviser n) ? (ENTER=4) ", default=4)
+            jobs = ask_input_int(f"Processus (ENTER={os.cpu_count() or 1}) ? ", default=os.cpu_count() or 1)
+            with measure_perf(f"Génération (tuilée {k}x{k}, {jobs} processus)"):
+                maze = TiledGenerator(n, k, jobs=jobs).generate()
+            algo_name = "Tiled"
         else:
             with measure_perf("Génération (Backtracking)"):
-                maze = BacktrackingGenerator(n).generate()
+                maze = BacktrackingGenerator(n, fast=True).generate()
             algo_name = "Backtracking"
     except Exception as e:
         print(f"Erreur lors de la génération : {e}")
         return
 
+    if binary:
+        saved = maze.save_bin(str(out_path), generator=algo_name)
+        print(f"✅ Généré ({algo_name}): {saved}")
+        return
+
     try:
         saved = maze.save_txt(str(out_path))
     except TypeError:
@@ -91,13 +160,13 @@ def handle_generate():
     print(f"✅ Généré ({algo_name}): {saved}")
 
 def handle_solve_backtrack():
-    src_raw = input("Fichier labyrinthe source (.txt) ? (ENTER pour data/outputs/mazes/maze_5.txt) ").strip()
+    src_raw = input("Fichier labyrinthe source (.txt, .maze ou corpus.amzc:algo:n:seed) ? (ENTER pour data/outputs/mazes/maze_5.txt) ").strip()
     out_raw = input("Fichier solution (.txt) ? (ENTER pour data/outputs/solutions/solution_backtrack.txt) ").strip()
 
     if not src_raw:
         src_path = str(MAZES_DIR / "maze_5.txt")
     else:
-        resolved = resolve_maze_file(src_raw)
+        resolved = resolve_source(src_raw)
         if resolved is None:
             print(f"⚠️ Fichier '{src_raw}' non trouvé.")
             return
@@ -106,14 +175,14 @@ def handle_solve_backtrack():
     out_path = normalize_output_path(out_raw, SOLUTIONS_DIR, "solution_backtrack.txt", force_ext=".txt")
 
     try:
-        maze = Maze.load_txt(str(src_path))
+        maze = load_source(str(src_path))
     except FileNotFoundError as e:
         print(f"⚠️ {e}")
         return
 
     solver = BacktrackingSolver()
     with measure_perf("Résolution (Backtracking)"):
-        solved = solver.solve(maze)
+        solved = memo_cache().solve(solver, maze)
 
     try:
         saved = solved.save_txt(str(out_path))
@@ -123,13 +192,13 @@ def handle_solve_backtrack():
     print(f"✅ Solution Backtracking écrite: {saved}")
 
 def handle_solve_astar():
-    src_raw = input("Fichier labyrinthe source (.txt) ? (ENTER pour data/outputs/mazes/maze_5.txt) ").strip()
+    src_raw = input("Fichier labyrinthe source (.txt, .maze ou corpus.amzc:algo:n:seed) ? (ENTER pour data/outputs/mazes/maze_5.txt) ").strip()
     out_raw = input("Fichier solution (.txt) ? (ENTER pour data/outputs/solutions/solution_astar.txt) ").strip()
 
     if not src_raw:
         src_path = str(MAZES_DIR / "maze_5.txt")
     else:
-        resolved = resolve_maze_file(src_raw)
+        resolved = resolve_source(src_raw)
         if resolved is None:
             print(f"⚠️ Fichier '{src_raw}' non trouvé.")
             return
@@ -138,14 +207,14 @@ def handle_solve_astar():
     out_path = normalize_output_path(out_raw, SOLUTIONS_DIR, "solution_astar.txt", force_ext=".txt")
 
     try:
-        maze = Maze.load_txt(str(src_path))
+        maze = load_source(str(src_path))
     except FileNotFoundError as e:
         print(f"⚠️ {e}")
         return
 
     solver = AStarSolver()
     with measure_perf("Résolution (A*)"):
-        solved = solver.solve(maze)
+        solved = memo_cache().solve(solver, maze)
 
     try:
         saved = solved.save_txt(str(out_path))
@@ -154,15 +223,47 @@ def handle_solve_astar():
         saved = str(out_path)
     print(f"✅ Solution A* écrite: {saved}")
 
+def handle_solve_bidir():
+    src_raw = input("Fichier labyrinthe source (.txt, .maze ou corpus.amzc:algo:n:seed) ? (ENTER pour data/outputs/mazes/maze_5.txt) ").strip()
+    out_raw = input("Fichier solution (.txt) ? (ENTER pour data/outputs/solutions/solution_bidir.txt) ").strip()
+
+    if not src_raw:
+        src_path = str(MAZES_DIR / "maze_5.txt")
+    else:
+        resolved = resolve_source(src_raw)
+        if resolved is None:
+            print(f"⚠️ Fichier '{src_raw}' non trouvé.")
+            return
+        src_path = resolved
+
+    out_path = normalize_output_path(out_raw, SOLUTIONS_DIR, "solution_bidir.txt", force_ext=".txt")
+
+    try:
+        maze = load_source(str(src_path))
+    except FileNotFoundError as e:
+        print(f"⚠️ {e}")
+        return
+
+    solver = BidirectionalSolver()
+    with measure_perf("Résolution (Bidirectionnel)"):
+        solved = memo_cache().solve(solver, maze)
+
+    try:
+        saved = solved.save_txt(str(out_path))
+    except TypeError:
+        solved.save_txt(str(out_path))
+        saved = str(out_path)
+    print(f"✅ Solution bidirectionnelle écrite: {saved}")
+
 def handle_export_image():
-    src_raw = input(f"Fichier labyrinthe source (.txt) ? (ENTER pour data/outputs/mazes/maze_5.txt) ").strip()
+    src_raw = input(f"Fichier labyrinthe source (.txt, .maze ou corpus.amzc:algo:n:seed) ? (ENTER pour data/outputs/mazes/maze_5.txt) ").strip()
     out_raw = input("Fichier image sortie (.png) ? (ENTER pour data/outputs/images/maze.png) ").strip()
     cell_size_raw = input("Taille cellule en pixels (ENTER=10) ? ").strip()
 
     if not src_raw:
         src_path = str(MAZES_DIR / "maze_5.txt")
     else:
-        resolved = resolve_maze_file(src_raw)
+        resolved = resolve_source(src_raw)
         if resolved is None:
             print(f"⚠️ Fichier '{src_raw}' non trouvé dans {MAZES_DIR} ni dans {SOLUTIONS_DIR}.")
             print("    → Vérifie le nom, ou génère/solve d'abord le labyrinthe.")
@@ -177,26 +278,70 @@ def handle_export_image():
         cell_size = 10
 
     try:
-        maze = Maze.load_txt(str(src_path))
+        maze = load_source(str(src_path))
     except FileNotFoundError as e:
         print(f"⚠️ {e}")
         return
 
     exporter = AsciiExporter(cell_size=cell_size)
+    # au-delà de STREAM_EXPORT_PIXELS, export PNG bande par bande (mémoire bornée)
+    pixels = maze.ascii_height * maze.ascii_width * cell_size ** 2
     try:
-        saved = exporter.export(maze, str(out_path))
+        if pixels > STREAM_EXPORT_PIXELS and out_path.suffix.lower() in ("", ".png"):
+            saved = exporter.export_stream(maze, str(out_path))
+        else:
+            saved = exporter.export(maze, str(out_path))
     except Exception as e:
         print(f"Erreur lors de l'export image: {e}")
         return
     print(f"✅ Image exportée: {saved}")
 
+def handle_export_anim():
+    """Animation GIF/APNG d'une génération ou d'une résolution (événements delta, frames par rectangle modifié)."""
+    print("Animation : 1) Génération  2) Résolution")
+    mode = (input("Votre choix ? (ENTER=1) ").strip() or "1")
+    out_raw = input("Fichier animation (.gif ou .png APNG) ? (ENTER pour data/outputs/images/maze_anim.gif) ").strip()
+    try:
+        stride = ask_input_int("Étapes par frame (ENTER=100) ? ", default=100)
+        cell_size = ask_input_int("Taille cellule en pixels (ENTER=4) ? ", default=4)
+    except Exception:
+        print("⚠️ Entrée invalide."); return
+    out_path = normalize_output_path(out_raw, IMAGES_DIR, "maze_anim.gif")
+    exporter = AnimExporter(cell_size=cell_size, stride=max(1, stride))
+
+    try:
+        if mode == "2":
+            src = input("Fichier labyrinthe source (.txt/.maze/corpus.amzc:algo:n:seed) ? ").strip()
+            resolved = resolve_source(src)
+            if not resolved:
+                print("⚠️ Fichier introuvable.")
+                return
+            maze = strip_solution_marks(load_source(resolved))
+            print("Algo résolution : 1) Backtracking  2) A*  3) Bidirectionnel")
+            algo = (input("Votre choix ? (ENTER=1) ").strip() or "1")
+            solver = {"2": AStarSolver, "3": BidirectionalSolver}.get(algo, BacktrackingSolver)()
+            with measure_perf("Export animation (résolution)"), exporter.open(maze, out_path) as anim:
+                solver.solve(maze, on_delta=anim)
+        else:
+            n = ask_input_int("Taille du labyrinthe (ENTER=20) ? ", default=20)
+            print("Algo génération : 1) Backtracking  2) Kruskal  3) Eller  4) Binary Tree  5) Sidewinder")
+            algo = (input("Votre choix ? (ENTER=1) ").strip() or "1")
+            gen = {"2": KruskalGenerator, "3": EllerGenerator, "4": BinaryTreeGenerator,
+                   "5": SidewinderGenerator}.get(algo, BacktrackingGenerator)(n)
+            with measure_perf("Export animation (génération)"), exporter.open(Maze.empty_from_n(n), out_path) as anim:
+                gen.generate(on_delta=anim)
+    except Exception as e:
+        print(f"Erreur lors de l'export animation: {e}")
+        return
+    print(f"✅ Animation exportée ({anim.writer.frames} frames): {anim.path}")
+
 def handle_visual_generate():
     try:
         n = ask_input_int("Taille du labyrinthe (ENTER=20) ? ", default=20)
     except Exception:
         print("Entrée invalide."); return
 
-    print("Algo génération : 1) Backtracking  2) Kruskal")
+    print("Algo génération : 1) Backtracking  2) Kruskal  3) Eller  4) Binary Tree  5) Sidewinder")
     algo = (input("Votre choix ? (ENTER=1) ").strip() or "1")
     speed = input("Vitesse (ms par frame, ENTER=25) ? ").strip()
     delay = int(speed) if speed else 25
@@ -204,39 +349,54 @@ def handle_visual_generate():
 
     if algo == "2":
         KruskalGenerator(n).generate(on_step=anim)
+    elif algo == "3":
+        EllerGenerator(n).generate(on_step=anim)
+    elif algo == "4":
+        BinaryTreeGenerator(n).generate(on_step=anim)
+    elif algo == "5":
+        SidewinderGenerator(n).generate(on_step=anim)
     else:
         BacktrackingGenerator(n).generate(on_step=anim)
+    anim.close()
 
     print("\n✅ Terminé. (Appuie ENTER pour revenir au menu)")
     input()
 
 def handle_visual_solve():
-    src = input("Fichier labyrinthe source (.txt, mazes/ ou solutions/) ? ").strip()
-    resolved = resolve_maze_file(src)
+    src = input("Fichier labyrinthe source (.txt/.maze/corpus.amzc:algo:n:seed, mazes/ ou solutions/) ? ").strip()
+    resolved = resolve_source(src)
     if not resolved:
         print("⚠️ Fichier introuvable.")
         return
-    maze = Maze.load_txt(resolved)
+    try:
+        maze = load_source(resolved)
+    except FileNotFoundError as e:
+        print(f"⚠️ {e}")
+        return
 
     # Nettoyage facultatif si c'est déjà une solution
-    has_marks = any(ch in ("o", "*") for row in maze.grid for ch in row)
+    has_marks = maze.count("o") + maze.count("*") > 0
     if has_marks:
         ans = input("Le fichier semble déjà résolu (contient 'o' ou '*'). Nettoyer pour visualiser ? [Y/n] ").strip().lower()
         if ans in ("", "y", "yes", "o", "oui"):
             maze = strip_solution_marks(maze)
 
-    print("Algo résolution : 1) Backtracking  2) A*")
+    print("Algo résolution : 1) Backtracking  2) A*  3) Bidirectionnel")
     algo = (input("Votre choix ? (ENTER=1) ").strip() or "1")
     speed = input("Vitesse (ms par frame, ENTER=15) ? ").strip()
     delay = int(speed) if speed else 15
 
     visit_anim = ConsoleAnimator(delay_ms=delay, title="Résolution - Exploration (*)")
-    path_anim  = ConsoleAnimator(delay_ms=delay, title="Résolution - Chemin (o)")
+    # même rendu (même écran) pour les deux phases
+    path_anim  = ConsoleAnimator(delay_ms=delay, title="Résolution - Chemin (o)", renderer=visit_anim.renderer)
 
     if algo == "2":
         AStarSolver().solve(maze, on_visit=visit_anim, on_path=path_anim)
+    elif algo == "3":
+        BidirectionalSolver().solve(maze, on_visit=visit_anim, on_path=path_anim)
     else:
         BacktrackingSolver().solve(maze, on_visit=visit_anim, on_path=path_anim)
+    path_anim.close()
 
     print("\n✅ Terminé. (Appuie ENTER pour revenir au menu)")
     input()
@@ -247,14 +407,16 @@ def run():
     try:
         while True:
             print("\n=== Amazing Mazes (POO) ===")
-            print("1) Générer un labyrinthe (Backtracking / Kruskal)")
+            print("1) Générer un labyrinthe (Backtracking / Kruskal / Eller / Binary Tree / Sidewinder)")
             print("2) Résoudre un labyrinthe (Backtracking)")
             print("3) Résoudre un labyrinthe (A*)")
             print("4) Exporter ASCII -> PNG")
-            print("5) [Visuel] Générer un labyrinthe (Backtracking / Kruskal)")
-            print("6) [Visuel] Résoudre un labyrinthe (Backtracking / A*)")
+            print("5) [Visuel] Générer un labyrinthe (Backtracking / Kruskal / Eller / Binary Tree / Sidewinder)")
+            print("6) [Visuel] Résoudre un labyrinthe (Backtracking / A* / Bidirectionnel)")
+            print("7) Résoudre un labyrinthe (Bidirectionnel)")
+            print("8) Exporter une animation (GIF / APNG)")
             print("q) Quitter")
-            choice = input("Votre choix ? [1/2/3/4/5/6/q] ").strip().lower()
+            choice = input("Votre choix ? [1/2/3/4/5/6/7/8/q] ").strip().lower()
 
             if choice == "1": handle_generate()
             elif choice == "2": handle_solve_backtrack()
@@ -262,6 +424,8 @@ def run():
             elif choice == "4": handle_export_image()
             elif choice == "5": handle_visual_generate()
             elif choice == "6": handle_visual_solve()
+            elif choice == "7": handle_solve_bidir()
+            elif choice == "8": handle_export_anim()
             elif choice == "q":
                 print("Au revoir 👋")
                 break
@@ -0,0 +1,436 @@
+# src/service.py
+"""
+Service local asyncio : génération, résolution et export via un protocole
+JSON ligne à ligne sur TCP (ou socket Unix).
+
+Requête (une ligne JSON) :
+    {"id": 1, "op": "generate", "algo": "kruskal", "n": 50, "seed": 7}
+    {"id": 2, "op": "solve", "solver": "astar", "spec": ["kruskal", 50, 7]}
+    {"id": 3, "op": "solve", "solver": "bidir", "maze": ["#.###", ...]}
+    {"id": 4, "op": "export", "spec": ["eller", 200, 1], "cell_size": 4}
+    {"id": 5, "op": "stats"}
+
+Réponse : une ligne d'en-tête {"id", "ok": true, "status": 200, ..., "chunks": k}
+suivie de k lignes {"id", "chunk": i, "rows": [...]} (grille ASCII) ou
+{"id", "chunk": i, "data": "<base64>"} (PNG). En erreur : {"id", "ok": false,
+"status": 400 | 408 | 429 | 500, "error": "..."}.
+
+- Le travail CPU part dans un ProcessPoolExecutor borné (`workers`).
+- Contre-pression : au-delà de workers + queue_size requêtes en cours, la
+  requête est rejetée tout de suite (429) au lieu d'attendre en file.
+- Délai par requête (408) : le résultat est abandonné, le worker termine sa tâche.
+- Les requêtes d'une même connexion sont traitées en parallèle (réponses
+  dans l'ordre de fin, à associer par "id").
+- Pas de gros résultat en mémoire : le worker écrit la grille (ou le PNG)
+  bande par bande dans un fichier temporaire et ne renvoie que son chemin ;
+  la boucle le relit morceau par morceau, drain() entre chaque (contrôle de
+  flux TCP), puis le supprime.
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import base64
+import itertools
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Tuple
+
+DEFAULT_PORT = 8765
+MAX_N = 4000
+CHUNK_BYTES = 48 * 1024  # taille visée d'une ligne de morceau (sous la limite par défaut d'asyncio, 64 Ko)
+MAX_LINE = 64 * 1024 * 1024
+STRIP_ROWS = 32  # rangées de cellules écrites à la fois par un worker
+
+
+class ServiceError(Exception):
+    """Erreur renvoyée au client avec un statut HTTP-like."""
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# ----------------------------------------------------------------------
+# Travail CPU (fonctions de module : exécutées dans les workers)
+# ----------------------------------------------------------------------
+def _solvers() -> Dict[str, Any]:
+    from features.solve_backtrack import BacktrackingSolver
+    from features.solve_astar import AStarSolver
+    from features.solve_bidir import BidirectionalSolver
+    return {"backtrack": BacktrackingSolver, "astar": AStarSolver, "bidir": BidirectionalSolver}
+
+
+def _source_maze(spec, rows):
+    from utils import Maze
+    from features.gen_many import build_maze
+    if rows is not None:
+        return Maze(rows)
+    return build_maze(tuple(spec))
+
+
+def _spool(suffix: str):
+    """Fichier temporaire de résultat : écrit par le worker, lu puis supprimé par la boucle."""
+    fd, path = tempfile.mkstemp(prefix="maze-service-", suffix=suffix)
+    return os.fdopen(fd, "wb"), path
+
+
+def _spool_grid(maze, **extra) -> dict:
+    """Grille ASCII écrite bande par bande (une ligne + LF par rangée) : pas de copie texte entière."""
+    from utils import encode_txt
+    h, w = maze.cells.shape
+    f, path = _spool(".txt")
+    with f:
+        for r in range(0, h, STRIP_ROWS):
+            encode_txt(maze.cells[r:r + STRIP_ROWS]).tofile(f)
+    return {"height": h, "width": w, "path": path, **extra}
+
+
+def work_generate(algo: str, n: int, seed: int | None) -> dict:
+    from features.gen_many import build_maze
+    return _spool_grid(build_maze((algo, n, seed)))
+
+
+def work_solve(solver: str, spec, rows) -> dict:
+    maze = _source_maze(spec, rows)
+    solved = _solvers()[solver]().solve(maze)
+    return _spool_grid(solved, path_length=solved.count("o"))
+
+
+def work_export(spec, rows, cell_size: int) -> dict:
+    from features.export_img import AsciiExporter
+    maze = _source_maze(spec, rows)
+    f, path = _spool(".png")
+    f.close()
+    AsciiExporter(cell_size=cell_size).export_stream(maze, path, strip_rows=STRIP_ROWS)  # PNG en flux
+    return {"bytes": os.path.getsize(path), "path": path}
+
+
+def _discard(job) -> None:
+    """Callback d'un résultat abandonné (délai dépassé) : supprime son fichier temporaire."""
+    if not job.cancelled() and job.exception() is None:
+        result = job.result()
+        if isinstance(result, dict) and "path" in result:
+            _unlink(result["path"])
+
+
+def _unlink(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+# ----------------------------------------------------------------------
+# Validation des requêtes (dans la boucle, avant tout envoi au pool)
+# ----------------------------------------------------------------------
+def _is_int(x) -> bool:
+    return isinstance(x, int) and not isinstance(x, bool)
+
+
+def _check_n(n) -> int:
+    if not _is_int(n) or not 1 <= n <= MAX_N:
+        raise ServiceError(400, f"n doit être un entier entre 1 et {MAX_N}")
+    return n
+
+
+def _check_seed(seed) -> int | None:
+    if seed is not None and not _is_int(seed):
+        raise ServiceError(400, f"seed doit être un entier ou null: {seed!r}")
+    return seed
+
+
+def _check_source(req: dict) -> Tuple[Any, Any]:
+    from features.gen_many import GENERATORS
+    spec, rows = req.get("spec"), req.get("maze")
+    if (spec is None) == (rows is None):
+        raise ServiceError(400, "fournir exactement un de 'spec' [algo, n, seed] ou 'maze' [lignes]")
+    if spec is not None:
+        if (not isinstance(spec, list) or len(spec) != 3 or not isinstance(spec[0], str)
+                or spec[0] not in GENERATORS):
+            raise ServiceError(400, f"spec invalide: {spec!r} (algo parmi {', '.join(GENERATORS)})")
+        _check_n(spec[1])
+        _check_seed(spec[2])
+        return spec, None
+    if (not isinstance(rows, list) or not rows or not all(isinstance(r, str) and r.isascii() for r in rows)
+            or len({len(r) for r in rows}) != 1):
+        raise ServiceError(400, "maze doit être une liste non vide de lignes ASCII de même largeur")
+    side = 2 * MAX_N + 1  # même borne que n <= MAX_N pour un 'spec'
+    if len(rows) > side or len(rows[0]) > side:
+        raise ServiceError(400, f"maze trop grand: {len(rows)}x{len(rows[0])} (au plus {side}x{side})")
+    return None, rows
+
+
+class MazeService:
+    """
+    Serveur JSON ligne à ligne.
+    - workers    : processus du pool CPU
+    - queue_size : requêtes admises en attente au-delà des workers (0 = aucune)
+    - timeout    : délai max d'une requête en secondes
+
+        service = MazeService(port=0, workers=2)
+        await service.start()          # service.port = port réel
+        await service.serve_forever()
+    """
+    def __init__(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT, unix_path: str | None = None,
+                 workers: int = 2, queue_size: int = 16, timeout: float = 30.0):
+        if workers < 1 or queue_size < 0 or timeout <= 0:
+            raise ValueError("workers >= 1, queue_size >= 0 et timeout > 0 attendus")
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self.workers = workers
+        self.limit = workers + queue_size
+        self.timeout = timeout
+        self.in_flight = 0
+        self.counters = {"served": 0, "rejected": 0, "timeout": 0, "error": 0}
+        self._pool: ProcessPoolExecutor | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._handlers: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    # ------------------------------------------------------------------
+    # Cycle de vie
+    # ------------------------------------------------------------------
+    async def start(self) -> None:
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        # workers lancés avant toute connexion : avec fork, un worker créé plus tard
+        # hériterait des sockets clients et un close() n'enverrait plus la fin de flux
+        await asyncio.wrap_future(self._pool.submit(os.getpid))
+        if self.unix_path:
+            self._server = await asyncio.start_unix_server(self._client, self.unix_path, limit=MAX_LINE)
+        else:
+            self._server = await asyncio.start_server(self._client, self.host, self.port, limit=MAX_LINE)
+            self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            # connexions encore ouvertes : fermées, puis leurs gestionnaires attendus
+            for writer in self._handlers.values():
+                writer.close()
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            await self._server.wait_closed()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Connexions
+    # ------------------------------------------------------------------
+    async def _client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        lock = asyncio.Lock()
+        tasks = set()
+        me = asyncio.current_task()
+        self._handlers[me] = writer
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    head = {"id": None, "ok": False, "status": 400, "error": "ligne trop longue"}
+                    await self._send(writer, lock, head)
+                    break
+                if not line:
+                    break
+                task = asyncio.create_task(self._request(line, writer, lock))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except ConnectionError:
+            pass
+        finally:
+            del self._handlers[me]
+            writer.close()
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, lock: asyncio.Lock, head: dict,
+                    chunks: Iterator[dict] | None = None) -> None:
+        """
+        Écrit l'en-tête puis les morceaux sans entrelacement, drain() après chaque
+        ligne : un morceau n'est lu dans le fichier résultat que lorsque le
+        précédent est parti (contrôle de flux TCP, mémoire bornée par un morceau).
+        """
+        async with lock:
+            for msg in itertools.chain([head], chunks or ()):
+                msg["id"] = head["id"]
+                writer.write(json.dumps(msg, separators=(",", ":")).encode() + b"\n")
+                await writer.drain()
+
+    async def _request(self, line: bytes, writer: asyncio.StreamWriter, lock: asyncio.Lock) -> None:
+        rid = None
+        chunks = path = None
+        t0 = time.perf_counter()
+        try:
+            try:
+                req = json.loads(line)
+            except ValueError:
+                raise ServiceError(400, "JSON invalide") from None
+            if not isinstance(req, dict):
+                raise ServiceError(400, "la requête doit être un objet JSON")
+            rid = req.get("id")
+            head, chunks, path = await self._dispatch(req)
+            self.counters["served"] += 1
+        except ServiceError as e:
+            self.counters["rejected" if e.status == 429 else "timeout" if e.status == 408 else "error"] += 1
+            head = {"ok": False, "status": e.status, "error": str(e)}
+        except Exception as e:  # bug côté worker : la connexion reste utilisable
+            self.counters["error"] += 1
+            head = {"ok": False, "status": 500, "error": f"{type(e).__name__}: {e}"}
+        head["id"] = rid
+        head["elapsed_ms"] = round((time.perf_counter() - t0) * 1000, 3)
+        try:
+            await self._send(writer, lock, head, chunks)
+        except Exception:
+            # en-tête déjà parti : le client attend des morceaux qui ne viendront pas
+            self.counters["error"] += 1
+            writer.close()
+        finally:
+            if path is not None:
+                _unlink(path)
+
+    def _release(self, _future) -> None:
+        self.in_flight -= 1
+
+    def _release_from_pool(self, loop: asyncio.AbstractEventLoop, future) -> None:
+        """Callback du thread du pool : repasse par la boucle (ignoré si elle est déjà fermée)."""
+        try:
+            loop.call_soon_threadsafe(self._release, future)
+        except RuntimeError:
+            pass
+
+    async def _run(self, fn, *args):
+        """
+        Soumet au pool avec contre-pression (429) et délai (408). Une tâche
+        expirée occupe toujours un worker : elle reste comptée dans in_flight
+        jusqu'à sa fin réelle, la contre-pression voit donc la charge vraie.
+        """
+        if self.in_flight >= self.limit:
+            raise ServiceError(429, f"file pleine ({self.in_flight} requêtes en cours)")
+        loop = asyncio.get_running_loop()
+        self.in_flight += 1
+        job = self._pool.submit(fn, *args)
+        job.add_done_callback(lambda f: self._release_from_pool(loop, f))
+        try:
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(job)), self.timeout)
+        except asyncio.TimeoutError:
+            job.add_done_callback(_discard)  # résultat jamais lu : son fichier est supprimé à la fin
+            raise ServiceError(408, f"délai dépassé ({self.timeout}s)") from None
+        except ValueError as e:  # entrée refusée par un générateur / solveur
+            raise ServiceError(400, str(e)) from None
+
+    async def _dispatch(self, req: dict) -> Tuple[dict, Iterator[dict] | None, str | None]:
+        """(en-tête, morceaux lus à la demande dans le fichier résultat, chemin de ce fichier)."""
+        op = req.get("op")
+        if op == "generate":
+            from features.gen_many import GENERATORS
+            algo = req.get("algo", "backtrack")
+            if not isinstance(algo, str) or algo not in GENERATORS:
+                raise ServiceError(400, f"algo inconnu: {algo!r} (attendu: {', '.join(GENERATORS)})")
+            res = await self._run(work_generate, algo, _check_n(req.get("n")), _check_seed(req.get("seed")))
+            return self._grid_response({"op": op}, res)
+        if op == "solve":
+            solver = req.get("solver", "astar")
+            if solver not in ("backtrack", "astar", "bidir"):
+                raise ServiceError(400, f"solver inconnu: {solver!r} (attendu: backtrack, astar, bidir)")
+            spec, rows = _check_source(req)
+            res = await self._run(work_solve, solver, spec, rows)
+            return self._grid_response({"op": op, "path_length": res["path_length"]}, res)
+        if op == "export":
+            spec, rows = _check_source(req)
+            cell_size = req.get("cell_size", 4)
+            if not _is_int(cell_size) or not 1 <= cell_size <= 32:
+                raise ServiceError(400, "cell_size doit être un entier entre 1 et 32")
+            res = await self._run(work_export, spec, rows, cell_size)
+            raw = CHUNK_BYTES // 4 * 3  # octets bruts -> CHUNK_BYTES en base64
+            head = {"ok": True, "status": 200, "op": op, "format": "png", "bytes": res["bytes"],
+                    "chunks": -(-res["bytes"] // raw)}
+            return head, _png_chunks(res["path"], raw), res["path"]
+        if op == "stats":
+            return {"ok": True, "status": 200, "op": op, "in_flight": self.in_flight,
+                    "limit": self.limit, "workers": self.workers, **self.counters}, None, None
+        raise ServiceError(400, f"op inconnue: {op!r} (attendu: generate, solve, export, stats)")
+
+    @staticmethod
+    def _grid_response(head: dict, res: dict) -> Tuple[dict, Iterator[dict], str]:
+        h, w = res["height"], res["width"]
+        step = max(1, CHUNK_BYTES // (w + 3))  # ~CHUNK_BYTES par ligne JSON
+        head = {"ok": True, "status": 200, **head, "height": h, "width": w, "chunks": -(-h // step)}
+        return head, _grid_chunks(res["path"], w, step), res["path"]
+
+
+def _grid_chunks(path: str, width: int, step: int) -> Iterator[dict]:
+    """Morceaux de `step` rangées lus au fur et à mesure dans le fichier de la grille."""
+    with open(path, "rb") as f:
+        for i in itertools.count():
+            data = f.read(step * (width + 1))
+            if not data:
+                return
+            yield {"chunk": i, "rows": data.decode("ascii").splitlines()}
+
+
+def _png_chunks(path: str, raw: int) -> Iterator[dict]:
+    with open(path, "rb") as f:
+        for i in itertools.count():
+            data = f.read(raw)
+            if not data:
+                return
+            yield {"chunk": i, "data": base64.b64encode(data).decode("ascii")}
+
+
+# ----------------------------------------------------------------------
+# Client minimal (tests, load_test.py)
+# ----------------------------------------------------------------------
+async def connect(host: str = "127.0.0.1", port: int = DEFAULT_PORT, unix_path: str | None = None):
+    """(reader, writer) vers le service."""
+    if unix_path:
+        return await asyncio.open_unix_connection(unix_path, limit=MAX_LINE)
+    return await asyncio.open_connection(host, port, limit=MAX_LINE)
+
+
+async def request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, req: dict) -> Tuple[dict, List[dict]]:
+    """Envoie une requête et lit sa réponse complète."""
+    writer.write(json.dumps(req).encode() + b"\n")
+    await writer.drain()
+    return await read_response(reader)
+
+
+async def read_response(reader: asyncio.StreamReader) -> Tuple[dict, List[dict]]:
+    """Lit une réponse complète : (en-tête, morceaux). Suppose une requête à la fois sur la connexion."""
+    head = json.loads(await reader.readline())
+    chunks = [json.loads(await reader.readline()) for _ in range(head.get("chunks", 0))]
+    return head, chunks
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Local maze service (line-delimited JSON over TCP/Unix socket)")
+    p.add_argument("--host", default="127.0.0.1", help="Bind address (default 127.0.0.1)")
+    p.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"TCP port (default {DEFAULT_PORT})")
+    p.add_argument("--unix", metavar="PATH", help="Listen on a Unix socket instead of TCP")
+    p.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    p.add_argument("--queue", type=int, default=16, help="Admitted requests beyond workers before 429")
+    p.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    return p.parse_args()
+
+async def _serve(args) -> None:
+    service = MazeService(args.host, args.port, args.unix, args.workers, args.queue, args.timeout)
+    await service.start()
+    where = args.unix or f"{args.host}:{service.port}"
+    print(f"Service prêt sur {where} ({args.workers} workers, file {args.queue}, délai {args.timeout}s)")
+    try:
+        await service.serve_forever()
+    finally:
+        await service.close()
+
+def main():
+    try:
+        asyncio.run(_serve(parse_args()))
+    except KeyboardInterrupt:
+        print("\nArrêt du service.")
+
+if __name__ == "__main__":
+    main()
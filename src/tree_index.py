@@ -0,0 +1,214 @@
+# src/tree_index.py
+from __future__ import annotations
+from array import array
+from pathlib import Path
+from typing import Iterable, List, Tuple
+import numpy as np
+from utils import Maze, resolve_maze_file
+from wallset import WallSet, EAST, SOUTH
+
+Cell = Tuple[int, int]
+
+INDEX_SUFFIX = ".tree.npz"
+
+
+def index_path(maze_file: str | Path) -> Path:
+    """Fichier d'index à côté du labyrinthe : maze_5.txt -> maze_5.tree.npz."""
+    return Path(maze_file).with_suffix(INDEX_SUFFIX)
+
+
+class MazeTreeIndex:
+    """
+    Index de requêtes de chemin pour un labyrinthe parfait (arbre couvrant
+    des n x n cellules logiques). Construit une fois en O(n²) : arbre enraciné
+    en (0,0), tableaux parent/profondeur (int32) et table de binary lifting
+    up[k][i] = 2^k-ième ancêtre de i.
+    - distance(a, b) : O(log n²) via le plus proche ancêtre commun (LCA)
+    - path(a, b)     : O(longueur du chemin), sans explorer le reste du maze
+    """
+
+    def __init__(self, n: int, parent: np.ndarray, depth: np.ndarray, fingerprint: str):
+        self.n = n
+        self.parent = np.ascontiguousarray(parent, dtype=np.int32)
+        self.depth = np.ascontiguousarray(depth, dtype=np.int32)
+        self.fingerprint = fingerprint
+        # table de lifting : K = nombre de bits de la profondeur max
+        K = max(1, int(self.depth.max()).bit_length())
+        up = np.empty((K, n * n), dtype=np.int32)
+        up[0] = self.parent
+        for k in range(1, K):
+            up[k] = up[k - 1][up[k - 1]]
+        self.up = up
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_walls(cls, walls: WallSet) -> "MazeTreeIndex":
+        """
+        BFS unique depuis (0,0) sur les murs ouverts. Lève ValueError si le
+        labyrinthe n'est pas un arbre couvrant (boucle ou cellule isolée).
+        """
+        n = walls.n
+        N = n * n
+        flags = walls._flags().ravel()
+        east = bytearray((flags & EAST).astype(bool).tobytes())
+        south = bytearray((flags & SOUTH).astype(bool).tobytes())
+        if sum(east) + sum(south) != N - 1:
+            raise ValueError(f"Labyrinthe non parfait : {sum(east) + sum(south)} passages "
+                             f"pour {N} cellules (attendu {N - 1}).")
+
+        parent = array("i", [-1]) * N
+        depth = array("i", [0]) * N
+        parent[0] = 0
+        queue = array("i", [0])
+        push = queue.append
+        pos = 0
+        while pos < len(queue):
+            i = queue[pos]
+            pos += 1
+            d = depth[i] + 1
+            # south/east ne sont jamais ouverts vers l'extérieur de la grille
+            if south[i] and parent[i + n] < 0:
+                parent[i + n] = i; depth[i + n] = d; push(i + n)
+            if i >= n and south[i - n] and parent[i - n] < 0:
+                parent[i - n] = i; depth[i - n] = d; push(i - n)
+            if east[i] and parent[i + 1] < 0:
+                parent[i + 1] = i; depth[i + 1] = d; push(i + 1)
+            if i % n and east[i - 1] and parent[i - 1] < 0:
+                parent[i - 1] = i; depth[i - 1] = d; push(i - 1)
+        if len(queue) != N:
+            raise ValueError(f"Labyrinthe non connexe : {len(queue)}/{N} cellules atteintes.")
+        return cls(n, np.frombuffer(parent, dtype=np.int32), np.frombuffer(depth, dtype=np.int32),
+                   walls.fingerprint())
+
+    @classmethod
+    def from_maze(cls, maze: Maze) -> "MazeTreeIndex":
+        return cls.from_walls(WallSet.from_maze(maze))
+
+    # ------------------------------------------------------------------
+    # Requêtes
+    # ------------------------------------------------------------------
+    def _index(self, cell: Cell) -> int:
+        r, c = cell
+        if not (0 <= r < self.n and 0 <= c < self.n):
+            raise ValueError(f"Cellule hors grille {self.n}x{self.n}: {cell}")
+        return r * self.n + c
+
+    def _lca(self, a: int, b: int) -> int:
+        depth, up = self.depth, self.up
+        if depth[a] < depth[b]:
+            a, b = b, a
+        diff = int(depth[a] - depth[b])
+        k = 0
+        while diff:
+            if diff & 1:
+                a = int(up[k, a])
+            diff >>= 1
+            k += 1
+        if a == b:
+            return a
+        for k in range(len(up) - 1, -1, -1):
+            if up[k, a] != up[k, b]:
+                a, b = int(up[k, a]), int(up[k, b])
+        return int(up[0, a])
+
+    def lca(self, a: Cell, b: Cell) -> Cell:
+        """Plus proche ancêtre commun de a et b (racine = (0,0))."""
+        return divmod(self._lca(self._index(a), self._index(b)), self.n)
+
+    def distance(self, a: Cell, b: Cell) -> int:
+        """Nombre de pas entre deux cellules logiques."""
+        i, j = self._index(a), self._index(b)
+        return int(self.depth[i] + self.depth[j] - 2 * self.depth[self._lca(i, j)])
+
+    def distances(self, pairs: Iterable[Tuple[Cell, Cell]]) -> np.ndarray:
+        """distance() pour une suite de paires, LCA vectorisé (numpy) sur toutes les paires."""
+        q = np.asarray(list(pairs), dtype=np.int64).reshape(-1, 4)
+        n = self.n
+        if ((q < 0) | (q >= n)).any():
+            raise ValueError(f"Cellule hors grille {n}x{n} dans les paires.")
+        a = q[:, 0] * n + q[:, 1]
+        b = q[:, 2] * n + q[:, 3]
+        depth, up = self.depth, self.up
+        da, db = depth[a].astype(np.int64), depth[b].astype(np.int64)
+        swap = da < db
+        a, b = np.where(swap, b, a), np.where(swap, a, b)
+        diff = np.abs(da - db)
+        x = a.copy()
+        for k in range(len(up)):
+            sel = ((diff >> k) & 1) == 1
+            x[sel] = up[k][x[sel]]
+        y = b.copy()
+        for k in range(len(up) - 1, -1, -1):
+            ux, uy = up[k][x], up[k][y]
+            sel = ux != uy
+            x[sel], y[sel] = ux[sel], uy[sel]
+        lca = np.where(x == y, x, up[0][x])
+        return da + db - 2 * depth[lca].astype(np.int64)
+
+    def path(self, a: Cell, b: Cell) -> List[Cell]:
+        """Chemin unique de a à b (inclus), en cellules logiques."""
+        i, j = self._index(a), self._index(b)
+        top = self._lca(i, j)
+        parent = self.parent
+        left: List[int] = []
+        while i != top:
+            left.append(i)
+            i = int(parent[i])
+        right: List[int] = []
+        while j != top:
+            right.append(j)
+            j = int(parent[j])
+        left.append(top)
+        left.extend(reversed(right))
+        return [divmod(p, self.n) for p in left]
+
+    def ascii_path(self, a: Cell, b: Cell) -> List[Cell]:
+        """path() en coordonnées ASCII (centres + passages), à passer à Maze.mark(..., 'o')."""
+        cells = self.path(a, b)
+        out = [(2 * cells[0][0] + 1, 2 * cells[0][1] + 1)]
+        for (r1, c1), (r2, c2) in zip(cells, cells[1:]):
+            out.append((r1 + r2 + 1, c1 + c2 + 1))
+            out.append((2 * r2 + 1, 2 * c2 + 1))
+        return out
+
+    # ------------------------------------------------------------------
+    # Persistance (.tree.npz à côté du labyrinthe)
+    # ------------------------------------------------------------------
+    def save(self, filename: str | Path) -> str:
+        """Écrit n, l'empreinte des murs, parent et profondeur (la table up est recalculée au chargement)."""
+        path = Path(filename)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez(f, n=np.int64(self.n), parent=self.parent, depth=self.depth,
+                     fingerprint=np.frombuffer(bytes.fromhex(self.fingerprint), dtype=np.uint8))
+        return str(path)
+
+    @classmethod
+    def load(cls, filename: str | Path, walls: WallSet | None = None) -> "MazeTreeIndex":
+        """Recharge un index ; avec `walls`, vérifie qu'il correspond bien à ce labyrinthe."""
+        with np.load(filename) as data:
+            index = cls(int(data["n"]), data["parent"], data["depth"],
+                        data["fingerprint"].tobytes().hex())
+        if walls is not None and (walls.n != index.n or walls.fingerprint() != index.fingerprint):
+            raise ValueError(f"Index périmé (labyrinthe modifié depuis): {filename}")
+        return index
+
+    @classmethod
+    def for_maze_file(cls, maze_file: str | Path) -> "MazeTreeIndex":
+        """
+        Index du labyrinthe `maze_file` : relu depuis le .tree.npz voisin s'il est
+        à jour, sinon reconstruit puis sauvegardé à côté du fichier.
+        """
+        real = resolve_maze_file(str(maze_file)) or str(maze_file)
+        walls = WallSet.from_maze(Maze.load(real))
+        path = index_path(real)
+        if path.exists():
+            try:
+                return cls.load(path, walls)
+            except ValueError:
+                pass
+        index = cls.from_walls(walls)
+        index.save(path)
+        return index
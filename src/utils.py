@@ -1,18 +1,137 @@
 from __future__ import annotations
-from typing import List
+from typing import Iterable, Sequence
 from pathlib import Path
 from config import MAZES_DIR, SOLUTIONS_DIR
-import time, tracemalloc
+import os, mmap, time, tracemalloc, struct, hashlib
 from contextlib import contextmanager
+import numpy as np
+
+# ----------------------------------------------------------------------
+# Table fixe des codes de cellules (uint8 = octet ASCII du caractère)
+# ----------------------------------------------------------------------
+WALL = ord("#")      # mur
+PASSAGE = ord(".")   # couloir
+PATH = ord("o")      # chemin final
+EXPLORED = ord("*")  # case explorée
+CELL_CODES = {"#": WALL, ".": PASSAGE, "o": PATH, "*": EXPLORED}
+
+
+def _encode_char(ch: str) -> int:
+    """Code uint8 d'un caractère de grille (un seul octet latin-1)."""
+    data = ch.encode("latin-1")
+    if len(data) != 1:
+        raise ValueError(f"Caractère de grille invalide: {ch!r}")
+    return data[0]
+
+
+def _encode_rows(rows: Iterable[Sequence[str]]) -> np.ndarray:
+    """Convertit des lignes (str ou list[str]) en matrice uint8 (H, W)."""
+    lines = ["".join(row) for row in rows]
+    if not lines:
+        return np.zeros((0, 0), dtype=np.uint8)
+    w = len(lines[0])
+    for i, line in enumerate(lines):
+        if len(line) != w:
+            raise ValueError(
+                f"Grille irrégulière: ligne {i} de largeur {len(line)} (attendu {w})."
+            )
+    buf = bytearray("".join(lines).encode("latin-1"))
+    return np.frombuffer(buf, dtype=np.uint8).reshape(len(lines), w)
+
+
+class _GridRow:
+    """Vue d'une ligne de `Maze.cells` qui se comporte comme une list[str]."""
+    __slots__ = ("_cells",)
+
+    def __init__(self, cells: np.ndarray):
+        self._cells = cells
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def __getitem__(self, c):
+        if isinstance(c, slice):
+            return list(self._cells[c].tobytes().decode("latin-1"))
+        return chr(self._cells[c])
+
+    def __setitem__(self, c, ch) -> None:
+        if isinstance(c, slice):
+            self._cells[c] = [_encode_char(x) for x in ch]
+        else:
+            self._cells[c] = _encode_char(ch)
+
+    def __iter__(self):
+        return iter(self._cells.tobytes().decode("latin-1"))
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class _GridView:
+    """
+    Vue de compatibilité `grid[r][c]` (lecture/écriture de caractères)
+    sur le tableau uint8 de `Maze`. Aucune copie : les écritures modifient le maze.
+    Les vues de lignes sont créées une fois (grid[r][c] ne fabrique plus d'objet).
+    """
+    __slots__ = ("_cells", "_rows")
+
+    def __init__(self, cells: np.ndarray):
+        self._cells = cells
+        self._rows = [_GridRow(row) for row in cells]
+
+    def __len__(self) -> int:
+        return self._cells.shape[0]
+
+    def __getitem__(self, r):
+        return self._rows[r]  # slice : list de vues, comme avant
+
+    def __setitem__(self, r, row) -> None:
+        self._cells[r] = [_encode_char(ch) for ch in row]
+
+    def __iter__(self):
+        return iter(self._rows)
+
+
+def grid_cells(grid) -> np.ndarray:
+    """Instantané uint8 (H, W) d'une grille : vue Maze.grid (copie directe) ou list[list[str]]."""
+    if isinstance(grid, _GridView):
+        return np.array(grid._cells)
+    return _encode_rows(grid)
+
 
 class Maze:
     """
     Représentation ASCII d’un labyrinthe.
-    Chaque cellule est un caractère dans une matrice (list[list[str]]).
+    Les cellules sont stockées dans une matrice NumPy uint8 (`cells`, un octet
+    ASCII par case : '#', '.', 'o', '*'). `grid` reste disponible comme vue
+    list[list[str]] pour les générateurs, solveurs et callbacks existants.
     """
 
-    def __init__(self, grid: List[List[str]]):
-        self.grid = grid
+    def __init__(self, grid: np.ndarray | Iterable[Sequence[str]]):
+        if isinstance(grid, np.ndarray):
+            if grid.dtype != np.uint8 or grid.ndim != 2:
+                raise ValueError("La grille NumPy doit être une matrice uint8 2D.")
+            self.cells = grid
+        else:
+            self.cells = _encode_rows(grid)
+
+    @property
+    def grid(self) -> _GridView:
+        view = self.__dict__.get("_grid_view")
+        if view is None or view._cells is not self.cells:  # cells réaffecté : nouvelle vue
+            view = self._grid_view = _GridView(self.cells)
+        return view
+
+    @grid.setter
+    def grid(self, grid: Iterable[Sequence[str]]) -> None:
+        self.cells = _encode_rows(grid)
+
+    def __getstate__(self) -> dict:
+        # la vue grid en cache n'est pas transférée (pools de processus) : recréée à la demande
+        return {"cells": self.cells}
 
     @classmethod
     def empty_from_n(cls, n: int) -> "Maze":
@@ -21,22 +140,53 @@ class Maze:
         et avec des cellules '.' aux positions impaires.
         """
         H = W = 2 * n + 1
-        grid = [["#" for _ in range(W)] for _ in range(H)]
-        for r in range(1, H, 2):
-            for c in range(1, W, 2):
-                grid[r][c] = "."
-        return cls(grid)
+        cells = np.full((H, W), WALL, dtype=np.uint8)
+        cells[1::2, 1::2] = PASSAGE
+        return cls(cells)
 
     @property
     def ascii_height(self) -> int:
-        return len(self.grid)
+        return self.cells.shape[0]
 
     @property
     def ascii_width(self) -> int:
-        return len(self.grid[0]) if self.grid else 0
+        return self.cells.shape[1]
 
     def copy(self) -> "Maze":
-        return Maze([row[:] for row in self.grid])
+        # np.array : copie en ndarray simple, y compris depuis un memmap
+        return Maze(np.array(self.cells))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Maze):
+            return NotImplemented
+        return np.array_equal(self.cells, other.cells)
+
+    __hash__ = None
+
+    def fingerprint(self) -> str:
+        """Empreinte hexadécimale (blake2b, 16 octets) des dimensions et des cases."""
+        h = hashlib.blake2b(struct.pack("<II", *self.cells.shape), digest_size=16)
+        h.update(np.ascontiguousarray(self.cells).data)
+        return h.hexdigest()
+
+    def count(self, ch: str) -> int:
+        """Nombre de cases contenant le caractère `ch`."""
+        return int(np.count_nonzero(self.cells == _encode_char(ch)))
+
+    def counts(self) -> dict[str, int]:
+        """Histogramme {caractère: nombre} des cases présentes dans la grille."""
+        hist = np.bincount(self.cells.ravel(), minlength=256)
+        return {chr(code): int(hist[code]) for code in np.flatnonzero(hist)}
+
+    def mark(self, coords, ch: str) -> None:
+        """Marque en bloc les cases `coords` (suite de (r, c) ou tableau (k, 2)) avec `ch`."""
+        idx = np.asarray(coords, dtype=np.intp).reshape(-1, 2)
+        self.cells[idx[:, 0], idx[:, 1]] = _encode_char(ch)
+
+    def replace(self, old: str, new: str) -> None:
+        """Remplace (sur place) chaque caractère de `old` par `new`."""
+        codes = [_encode_char(ch) for ch in old]
+        self.cells[np.isin(self.cells, codes)] = _encode_char(new)
 
     def save_txt(self, filename: str | None = None) -> str:
         """
@@ -45,22 +195,48 @@ class Maze:
         - Si filename est juste un nom (sans dossier), on le place dans data/outputs/mazes
         Retourne le chemin complet du fichier sauvegardé.
         """
-        if not filename:
-            filename = MAZES_DIR / "maze_auto.txt"
-        else:
-            filename = Path(filename)
-            if filename.parent == Path("."):
-                filename = MAZES_DIR / filename.name
+        path = output_path(filename, ".txt")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            encode_txt(self.cells).tofile(f)
+        return str(path)
+
+    def save_bin(self, filename: str | None = None,
+                 generator: str | None = None, seed: int | None = None) -> str:
+        """
+        Sauvegarde au format binaire .maze (en-tête + cellules uint8 brutes),
+        mêmes règles de chemin que save_txt. Retourne le chemin complet.
+        """
+        return save_maze_bin(self.cells, filename, generator=generator, seed=seed)
 
-        # forcer extension .txt si absente
-        if filename.suffix.lower() != ".txt":
-            filename = filename.with_suffix(".txt")
+    @classmethod
+    def open_mmap(cls, filename: str) -> "Maze":
+        """
+        Ouvre un .maze en lecture seule via numpy.memmap : aucun parsing ni copie,
+        les pages sont chargées à la demande. Écrire dans la grille lève ValueError ;
+        utiliser copy() pour obtenir un maze modifiable.
+        """
+        real = resolve_maze_file(filename)
+        if real is None:
+            raise FileNotFoundError(
+                f"Fichier introuvable: {filename}. "
+                f"Cherché dans {MAZES_DIR} et {SOLUTIONS_DIR}."
+            )
+        header = read_maze_header(real)
+        h, w = header["height"], header["width"]
+        if h * w == 0:
+            return cls(np.zeros((h, w), dtype=np.uint8))
+        cells = np.memmap(real, dtype=np.uint8, mode="r",
+                          offset=MAZE_HEADER_SIZE, shape=(h, w))
+        return cls(cells)
 
-        filename.parent.mkdir(parents=True, exist_ok=True)
-        with open(filename, "w", encoding="utf-8") as f:
-            for row in self.grid:
-                f.write("".join(row) + "\n")
-        return str(filename)
+    @classmethod
+    def load(cls, filename: str) -> "Maze":
+        """Charge un labyrinthe .txt ou .maze (mmap) selon l'extension du fichier trouvé."""
+        real = resolve_maze_file(filename) or filename
+        if Path(real).suffix.lower() == ".maze":
+            return cls.open_mmap(real)
+        return cls.load_txt(real)
 
     @classmethod
     def load_txt(cls, filename: str) -> "Maze":
@@ -111,9 +287,180 @@ class Maze:
                 )
             real = found
 
-        with open(real, "r", encoding="utf-8") as f:
-            lines = [list(line.rstrip("\n")) for line in f]
-        return cls(lines)
+        # lecture en bloc via mmap : les octets viennent du cache de pages, une seule copie
+        with open(real, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return cls(np.zeros((0, 0), dtype=np.uint8))
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return cls(decode_txt(data, str(real)))
+
+
+# ----------------------------------------------------------------------
+# Codec texte en bloc (une seule lecture / écriture, pas de travail par ligne)
+# ----------------------------------------------------------------------
+def decode_txt(data: bytes | mmap.mmap, source: str = "<bytes>") -> np.ndarray:
+    """
+    Convertit le contenu brut d'un .txt en matrice uint8 (H, W) en une opération :
+    largeur déduite de la 1re ligne, fins de ligne LF ou CRLF, dernière fin
+    de ligne facultative. Lève ValueError si les lignes n'ont pas toutes la même largeur.
+    """
+    if not len(data):
+        return np.zeros((0, 0), dtype=np.uint8)
+    first = data.find(b"\n")
+    if first < 0:
+        first = len(data)
+    nl = b"\r\n" if data[first - 1:first] == b"\r" else b"\n"
+    w = first - (len(nl) - 1)
+    if data[-1:] != b"\n":
+        data = bytes(data) + nl
+    stride = w + len(nl)
+    if len(data) % stride == 0:
+        rows = np.frombuffer(data, dtype=np.uint8).reshape(-1, stride)
+        ok = bool((rows[:, w:] == np.frombuffer(nl, dtype=np.uint8)).all())
+        cells = rows[:, :w].copy() if ok else None
+        del rows  # libère la vue sur `data` (un mmap ne peut pas être fermé sinon)
+        if cells is not None:
+            return cells
+    # grille irrégulière : localiser la première ligne fautive pour le message
+    for i, line in enumerate(bytes(data).split(b"\n")[:-1]):
+        width = len(line.rstrip(b"\r"))
+        if width != w:
+            raise ValueError(
+                f"Grille irrégulière dans {source}: ligne {i} de largeur {width} (attendu {w})."
+            )
+    raise ValueError(f"Fins de ligne incohérentes dans {source}.")
+
+
+def encode_txt(cells: np.ndarray) -> np.ndarray:
+    """
+    Contenu .txt (une ligne par rangée terminée par LF) construit en un seul
+    buffer (H, W+1), prêt pour un unique `tofile`/`write`.
+    """
+    h, w = cells.shape
+    out = np.empty((h, w + 1), dtype=np.uint8)
+    out[:, :w] = cells
+    out[:, w] = ord("\n")
+    return out
+
+
+# ----------------------------------------------------------------------
+# Écriture .txt en flux (lignes produites au fil de l'eau)
+# ----------------------------------------------------------------------
+def output_path(filename: str | Path | None, suffix: str = ".txt") -> Path:
+    """
+    Normalise un chemin de sortie (mêmes règles que Maze.save_txt) :
+    - None/vide -> data/outputs/mazes/maze_auto<suffix>
+    - nom simple -> data/outputs/mazes/<nom>
+    - extension forcée en <suffix>
+    """
+    if not filename:
+        path = MAZES_DIR / f"maze_auto{suffix}"
+    else:
+        path = Path(filename)
+        if path.parent == Path("."):
+            path = MAZES_DIR / path.name
+
+    # forcer l'extension si absente
+    if path.suffix.lower() != suffix:
+        path = path.with_suffix(suffix)
+    return path
+
+
+def save_rows_txt(rows: Iterable[str], filename: str | Path | None = None) -> str:
+    """
+    Écrit des lignes ASCII une par une dans un .txt relisible par Maze.load_txt.
+    Seule la ligne courante est en mémoire : adapté aux générateurs en flux.
+    Retourne le chemin complet du fichier sauvegardé.
+    """
+    path = output_path(filename, ".txt")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(row)
+            f.write("\n")
+    return str(path)
+
+
+# ----------------------------------------------------------------------
+# Format binaire .maze : en-tête fixe + cellules uint8 brutes (mmap)
+# ----------------------------------------------------------------------
+MAZE_MAGIC = b"AMZ1"
+MAZE_VERSION = 1
+ENCODING_ASCII = 0  # un octet ASCII par case (même table que Maze.cells)
+# magic, version, encodage, flags (bit0 = seed présente), H, W, seed, générateur, padding
+_MAZE_HEADER = struct.Struct("<4sHBBIIq32s8x")
+MAZE_HEADER_SIZE = _MAZE_HEADER.size  # 64 octets
+
+
+def _pack_header(height: int, width: int, generator: str | None, seed: int | None) -> bytes:
+    name = (generator or "").encode("ascii")[:32]
+    return _MAZE_HEADER.pack(MAZE_MAGIC, MAZE_VERSION, ENCODING_ASCII,
+                             int(seed is not None), height, width, seed or 0, name)
+
+
+def read_maze_header(filename: str | Path) -> dict:
+    """Lit l'en-tête d'un fichier .maze : height, width, encoding, generator, seed."""
+    with open(filename, "rb") as f:
+        raw = f.read(MAZE_HEADER_SIZE)
+    if len(raw) < MAZE_HEADER_SIZE:
+        raise ValueError(f"Fichier .maze tronqué: {filename}")
+    magic, version, encoding, flags, h, w, seed, name = _MAZE_HEADER.unpack(raw)
+    if magic != MAZE_MAGIC:
+        raise ValueError(f"Pas un fichier .maze: {filename}")
+    if version != MAZE_VERSION or encoding != ENCODING_ASCII:
+        raise ValueError(f"Version/encodage .maze non supporté: v{version}, encodage {encoding}")
+    return {
+        "height": h,
+        "width": w,
+        "encoding": "ascii",
+        "generator": name.rstrip(b"\0").decode("ascii") or None,
+        "seed": seed if flags & 1 else None,
+    }
+
+
+def save_maze_bin(cells: np.ndarray, filename: str | Path | None = None,
+                  generator: str | None = None, seed: int | None = None) -> str:
+    """Écrit l'en-tête puis les cellules uint8 brutes. Retourne le chemin complet."""
+    path = output_path(filename, ".maze")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    h, w = cells.shape
+    with open(path, "wb") as f:
+        f.write(_pack_header(h, w, generator, seed))
+        np.ascontiguousarray(cells, dtype=np.uint8).tofile(f)
+    return str(path)
+
+
+def txt_to_bin(src: str | Path, dst: str | Path | None = None,
+               generator: str | None = None, seed: int | None = None) -> str:
+    """
+    Convertit un .txt en .maze ligne par ligne (mémoire O(largeur)).
+    Par défaut le .maze est écrit à côté du .txt.
+    """
+    src = Path(src)
+    path = output_path(dst if dst else src.with_suffix(".maze"), ".maze")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    h, w = 0, None
+    with open(src, "rb") as fin, open(path, "wb") as fout:
+        fout.write(b"\0" * MAZE_HEADER_SIZE)  # en-tête réécrit à la fin (H connu)
+        for line in fin:
+            line = line.rstrip(b"\r\n")
+            if w is None:
+                w = len(line)
+            elif len(line) != w:
+                raise ValueError(f"Grille irrégulière: ligne {h} de largeur {len(line)} (attendu {w}).")
+            fout.write(line)
+            h += 1
+        fout.seek(0)
+        fout.write(_pack_header(h, w or 0, generator, seed))
+    return str(path)
+
+
+def bin_to_txt(src: str | Path, dst: str | Path | None = None) -> str:
+    """Convertit un .maze en .txt ligne par ligne, via mmap (aucune copie complète)."""
+    src = Path(src)
+    maze = Maze.open_mmap(str(src))
+    rows = (row.tobytes().decode("latin-1") for row in maze.cells)
+    return save_rows_txt(rows, dst if dst else src.with_suffix(".txt"))
 
 
 # ----------------------------------------------------------------------
@@ -122,7 +469,8 @@ class Maze:
 def resolve_maze_file(name: str | None) -> str | None:
     """
     Résout un nom de fichier donné en recherchant dans MAZES_DIR puis SOLUTIONS_DIR.
-    - accepte 'maze_30' ou 'maze_30.txt' ou un chemin absolu/relatif.
+    - accepte 'maze_30', 'maze_30.txt', 'maze_30.maze' ou un chemin absolu/relatif.
+    - sans extension, essaie .txt puis .maze (binaire).
     - accepte aussi fichiers sans extension physiquement présents (ex: 'maze_30_s').
     - retourne le chemin complet (string) si trouvé, sinon None.
     """
@@ -135,9 +483,16 @@ def resolve_maze_file(name: str | None) -> str | None:
     if p.exists():
         return str(p)
 
+    # chemin sans extension : essayer .txt puis .maze au même endroit
+    if not p.suffix:
+        for ext in (".txt", ".maze"):
+            if p.with_suffix(ext).exists():
+                return str(p.with_suffix(ext))
+
     # variantes de noms
     names_to_try = [p.name] if p.suffix else [
         p.with_suffix(".txt").name,
+        p.with_suffix(".maze").name,
         p.name,
     ]
 
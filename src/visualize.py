@@ -1,7 +1,9 @@
 # src/visualize.py
 from __future__ import annotations
-import os, time
-from typing import List
+import os, sys, time
+from typing import List, TextIO
+import numpy as np
+from utils import grid_cells
 
 def clear():
     os.system("cls" if os.name == "nt" else "clear")
@@ -16,11 +18,111 @@ def show(grid: List[List[str]], delay_ms: int = 25, title: str = ""):
     print(grid_to_str(grid))
     time.sleep(max(0, delay_ms) / 1000.0)
 
+
+# séquences ANSI
+_CLEAR = "\x1b[2J\x1b[H"
+_CLEAR_LINE = "\x1b[2K"
+_MERGE_GAP = 8  # deux changements séparés de moins de 8 cases : une seule écriture (≈ coût d'un saut)
+
+
+def _goto(row: int, col: int) -> str:
+    """Déplacement curseur (row, col en base 0)."""
+    return f"\x1b[{row + 1};{col + 1}H"
+
+
+class AnsiRenderer:
+    """
+    Rendu console incrémental : garde la dernière frame affichée et n'écrit que
+    les cases modifiées (sauts de curseur ANSI), en une seule écriture par frame.
+    Les appels plus rapprochés que 1/max_fps sont ignorés (la grille est gardée
+    en attente) : pas de sleep, pas de sous-processus. flush()/close() affichent
+    le dernier état en attente.
+    """
+    def __init__(self, out: TextIO | None = None, max_fps: float = 30.0):
+        self.out = out or sys.stdout
+        self.interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        self._prev: np.ndarray | None = None
+        self._title: str | None = None
+        self._last = float("-inf")
+        self._pending = None
+        self._pending_title = ""
+        self.frames = 0
+        self.skipped = 0
+        if os.name == "nt":
+            os.system("")  # active le mode VT (séquences ANSI) de la console Windows
+
+    def draw(self, grid, title: str = "", force: bool = False) -> bool:
+        """Affiche `grid` si le budget de frames le permet ; renvoie True si dessiné."""
+        now = time.perf_counter()
+        if not force and now - self._last < self.interval:
+            self._pending, self._pending_title = grid, title
+            self.skipped += 1
+            return False
+        self._pending = None
+        self._last = now
+        self._render(grid_cells(grid), title)
+        return True
+
+    def flush(self) -> None:
+        """Dessine la dernière grille en attente (ignorée par le limiteur de FPS)."""
+        if self._pending is not None:
+            self.draw(self._pending, self._pending_title, force=True)
+
+    def close(self) -> None:
+        """flush() puis replace le curseur sous la grille."""
+        self.flush()
+        if self._prev is not None:
+            self.out.write(_goto(self._prev.shape[0] + 1, 0))
+            self.out.flush()
+
+    def _render(self, cur: np.ndarray, title: str) -> None:
+        parts: List[str] = []
+        prev = self._prev
+        H, W = cur.shape
+        if prev is None or prev.shape[1] != W or prev.shape[0] > H:
+            # première frame (ou changement de forme) : redessin complet
+            parts.append(_CLEAR + title + "\n")
+            parts.append(cur.tobytes().decode("latin-1") if W == 0 else
+                         "\n".join(row.tobytes().decode("latin-1") for row in cur))
+        else:
+            if title != self._title:
+                parts.append(_goto(0, 0) + _CLEAR_LINE + title)
+            if prev.shape[0] < H:  # grille qui grandit (Eller) : nouvelles lignes = tout change
+                grown = np.zeros((H, W), dtype=np.uint8)
+                grown[: prev.shape[0]] = prev
+                prev = grown
+            diff = cur != prev
+            for r in np.flatnonzero(diff.any(axis=1)):
+                cols = np.flatnonzero(diff[r])
+                cut = np.flatnonzero(np.diff(cols) > _MERGE_GAP)
+                starts = cols[np.r_[0, cut + 1]]
+                ends = cols[np.r_[cut, len(cols) - 1]]
+                line = cur[r]
+                for a, b in zip(starts.tolist(), ends.tolist()):
+                    parts.append(_goto(r + 1, a) + line[a:b + 1].tobytes().decode("latin-1"))
+        self._prev = cur
+        self._title = title
+        self.frames += 1
+        if parts:
+            self.out.write("".join(parts))
+            self.out.flush()
+
+
 class ConsoleAnimator:
-    """Petit helper pour passer comme callback à nos algos."""
-    def __init__(self, delay_ms: int = 25, title: str = ""):
+    """
+    Petit helper pour passer comme callback à nos algos.
+    delay_ms = intervalle minimal entre deux frames affichées (les étapes
+    intermédiaires sont fusionnées, jamais attendues). Plusieurs animateurs
+    peuvent partager le même `renderer` (ex. exploration puis chemin).
+    Appeler close() à la fin pour afficher l'état final.
+    """
+    def __init__(self, delay_ms: int = 25, title: str = "", renderer: AnsiRenderer | None = None):
         self.delay_ms = delay_ms
         self.title = title
+        self.renderer = renderer or AnsiRenderer(max_fps=1000.0 / delay_ms if delay_ms > 0 else 0)
 
     def __call__(self, grid: List[List[str]]):
-        show(grid, self.delay_ms, self.title)
+        self.renderer.draw(grid, self.title)
+
+    def close(self) -> None:
+        self.renderer.close()
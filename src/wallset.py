@@ -0,0 +1,189 @@
+# src/wallset.py
+from __future__ import annotations
+from typing import List, Tuple
+import hashlib
+import numpy as np
+from utils import Maze, WALL, PASSAGE
+
+Cell = Tuple[int, int]
+
+EAST = 1   # bit 0 : passage ouvert vers la cellule de droite
+SOUTH = 2  # bit 1 : passage ouvert vers la cellule du dessous
+
+# direction vers le parent, 2 bits par cellule (table packée, 4 cellules par
+# octet) ; l'état « visité » est tenu à part, 1 bit par cellule
+_UP, _DOWN, _LEFT, _RIGHT = 0, 1, 2, 3
+
+
+def parent_table(n: int) -> bytearray:
+    """Table des directions parent (2 bits par cellule) pour n x n cellules."""
+    return bytearray((n * n + 3) // 4)
+
+
+def seen_table(n: int) -> bytearray:
+    """Masque de cellules (1 bit par cellule) pour n x n cellules."""
+    return bytearray((n * n + 7) // 8)
+
+
+def walls_path(came: bytearray, n: int, goal: int, root: int = 0) -> List[Cell]:
+    """Reconstruit le chemin (cellules logiques) de root à goal depuis la table des directions parent."""
+    step = (-n, n, -1, 1)
+    path: List[Cell] = []
+    i = goal
+    while i != root:
+        path.append(divmod(i, n))
+        i += step[came[i >> 2] >> ((i & 3) << 1) & 3]
+    path.append(divmod(i, n))
+    path.reverse()
+    return path
+
+
+def parent_dir(i: int, j: int, n: int) -> int:
+    """Code de direction pour revenir de j vers son parent i (voisins logiques)."""
+    if j == i + n: return _UP
+    if j == i - n: return _DOWN
+    if j == i + 1: return _LEFT
+    return _RIGHT
+
+
+class WallSet:
+    """
+    Labyrinthe parfait compact sur la grille logique n x n.
+    Seuls les murs "est" et "sud" de chaque cellule portent de l'information :
+    on les stocke sur 2 bits par cellule (4 cellules par octet, bytearray).
+    Les murs du treillis, les centres de cellules et l'entrée (0,1) / sortie
+    (H-1, W-2) sont implicites. n=10 000 tient ainsi dans ~25 Mo.
+    """
+
+    def __init__(self, n: int, bits: bytearray | None = None):
+        if n < 1:
+            raise ValueError("n doit être >= 1")
+        size = (n * n + 3) // 4
+        if bits is None:
+            bits = bytearray(size)
+        elif len(bits) != size:
+            raise ValueError(f"Taille de bits invalide: {len(bits)} (attendu {size}).")
+        self.n = n
+        self.bits = bits
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.bits)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, WallSet):
+            return NotImplemented
+        return self.n == other.n and self.bits == other.bits
+
+    __hash__ = None
+
+    def fingerprint(self) -> str:
+        """Empreinte hexadécimale (blake2b, 16 octets) de n et des murs."""
+        h = hashlib.blake2b(self.n.to_bytes(8, "little"), digest_size=16)
+        h.update(self.bits)
+        return h.hexdigest()
+
+    # ------------------------------------------------------------------
+    # Accès bit à bit (cellules en index plat i = r * n + c)
+    # ------------------------------------------------------------------
+    def _get(self, i: int, flag: int) -> bool:
+        return bool((self.bits[i >> 2] >> ((i & 3) << 1)) & flag)
+
+    def _set(self, i: int, flag: int) -> None:
+        self.bits[i >> 2] |= flag << ((i & 3) << 1)
+
+    def carve(self, a: Cell, b: Cell) -> None:
+        """Ouvre le mur entre deux cellules logiques adjacentes."""
+        (ar, ac), (br, bc) = sorted((a, b))
+        if ar == br and bc == ac + 1:
+            self._set(ar * self.n + ac, EAST)
+        elif ac == bc and br == ar + 1:
+            self._set(ar * self.n + ac, SOUTH)
+        else:
+            raise ValueError(f"Cellules non adjacentes: {a} et {b}")
+
+    def has_east(self, r: int, c: int) -> bool:
+        return self._get(r * self.n + c, EAST)
+
+    def has_south(self, r: int, c: int) -> bool:
+        return self._get(r * self.n + c, SOUTH)
+
+    def neighbors(self, i: int) -> List[int]:
+        """Cellules accessibles depuis i (ordre : sud, nord, est, ouest comme les solveurs)."""
+        n = self.n
+        out = []
+        if self._get(i, SOUTH):
+            out.append(i + n)
+        if i >= n and self._get(i - n, SOUTH):
+            out.append(i - n)
+        if self._get(i, EAST):
+            out.append(i + 1)
+        if i % n and self._get(i - 1, EAST):
+            out.append(i - 1)
+        return out
+
+    # ------------------------------------------------------------------
+    # Conversions Maze <-> WallSet (vectorisées)
+    # ------------------------------------------------------------------
+    def _flags(self) -> np.ndarray:
+        """Codes 2 bits (n, n) : EAST | SOUTH."""
+        n = self.n
+        packed = np.frombuffer(self.bits, dtype=np.uint8)
+        flags = (packed[:, None] >> np.array([0, 2, 4, 6], dtype=np.uint8)) & 3
+        return flags.ravel()[: n * n].reshape(n, n)
+
+    def to_maze(self) -> Maze:
+        """Construit la grille ASCII (2n+1)x(2n+1) équivalente."""
+        n = self.n
+        flags = self._flags()
+        maze = Maze.empty_from_n(n)
+        cells = maze.cells
+        cells[1::2, 2:2 * n:2][(flags[:, : n - 1] & EAST) != 0] = PASSAGE
+        cells[2:2 * n:2, 1::2][(flags[: n - 1, :] & SOUTH) != 0] = PASSAGE
+        cells[0, 1] = PASSAGE
+        cells[2 * n, 2 * n - 1] = PASSAGE
+        return maze
+
+    def passages(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Coordonnées ASCII (lignes, colonnes) des murs ouverts, dans l'ordre de lecture (hors entrée/sortie)."""
+        n = self.n
+        flags = self._flags()
+        open_ = np.zeros((2 * n + 1, 2 * n + 1), dtype=bool)
+        open_[1::2, 2:2 * n:2] = (flags[:, : n - 1] & EAST) != 0
+        open_[2:2 * n:2, 1::2] = (flags[: n - 1, :] & SOUTH) != 0
+        return np.nonzero(open_)
+
+    @classmethod
+    def from_maze(cls, maze: Maze) -> "WallSet":
+        """
+        Extrait les murs d'un Maze (2n+1)x(2n+1). Toute case non '#' compte
+        comme ouverte, ce qui accepte aussi les grilles marquées 'o'/'*'.
+        """
+        H, W = maze.ascii_height, maze.ascii_width
+        if H != W or H < 3 or H % 2 == 0:
+            raise ValueError(f"Grille {H}x{W} incompatible avec un WallSet (2n+1)x(2n+1).")
+        n = (H - 1) // 2
+        cells = maze.cells
+        east = np.zeros((n, n), dtype=bool)
+        south = np.zeros((n, n), dtype=bool)
+        east[:, : n - 1] = cells[1::2, 2:2 * n:2] != WALL
+        south[: n - 1, :] = cells[2:2 * n:2, 1::2] != WALL
+        return cls.from_flags(east, south)
+
+    @classmethod
+    def from_flags(cls, east: np.ndarray, south: np.ndarray) -> "WallSet":
+        """
+        WallSet depuis deux masques booléens (n, n) : passage vers l'est / vers
+        le sud de chaque cellule (dernière colonne / dernière ligne ignorées).
+        """
+        n = east.shape[0]
+        if east.shape != (n, n) or south.shape != (n, n):
+            raise ValueError(f"Masques {east.shape} / {south.shape} : attendu ({n}, {n}).")
+        flags = np.zeros((n, n), dtype=np.uint8)
+        flags[:, : n - 1] |= east[:, : n - 1].astype(np.uint8) * EAST
+        flags[: n - 1, :] |= south[: n - 1, :].astype(np.uint8) * SOUTH
+        flat = np.zeros(((n * n + 3) // 4) * 4, dtype=np.uint8)
+        flat[: n * n] = flags.ravel()
+        quads = flat.reshape(-1, 4)
+        packed = quads[:, 0] | (quads[:, 1] << 2) | (quads[:, 2] << 4) | (quads[:, 3] << 6)
+        return cls(n, bytearray(packed.tobytes()))
@@ -0,0 +1,79 @@
+# Sous-ensemble rapide du benchmark interne (scripts/internal_bench.py).
+# Gate de régression opt-in : MAZES_BENCH_BASELINE=<nom ou chemin .json> pytest tests/test_bench.py
+import os
+import sys
+from pathlib import Path
+import pytest
+
+_SCRIPTS = str(Path(__file__).resolve().parents[1] / "scripts")
+if _SCRIPTS not in sys.path:
+    sys.path.insert(0, _SCRIPTS)  # importable par nom : les workers du pool le réimportent
+import internal_bench as bench
+
+FAST_SIZES = (5, 10)
+FAST_GENERATORS = ["backtrack", "kruskal"]
+
+def _metrics(rows):
+    skip = {"time_ns", "tracemalloc_peak_bytes", "rss_delta_bytes"}
+    return [{k: v for k, v in r.items() if k not in skip} for r in rows]
+
+@pytest.fixture(scope="module")
+def fast_rows():
+    rows = []
+    for n in FAST_SIZES:
+        rows.extend(bench.run_one(n, seed=1, repeats=3, generators=FAST_GENERATORS))
+    return rows
+
+def test_bench_fast_subset(fast_rows, tmp_path):
+    assert all(r["ok"] == 1 for r in fast_rows)
+    stats = bench.summarize(fast_rows)
+    for n in FAST_SIZES:
+        for key in (f"{n}|generator|Backtracking|Backtracking", f"{n}|generator|Kruskal|Kruskal",
+                    f"{n}|solver|Backtracking|Kruskal", f"{n}|solver|AStar|Backtracking"):
+            assert stats[key]["n"] == 3
+    path = bench.save_baseline(str(tmp_path / "fast.json"), stats, {"sizes": list(FAST_SIZES)})
+    assert bench.compare_stats(stats, bench.load_baseline(str(path))["stats"]) == []
+
+    name = os.environ.get("MAZES_BENCH_BASELINE")
+    if name:
+        threshold = float(os.environ.get("MAZES_BENCH_THRESHOLD", bench.DEFAULT_THRESHOLD_PCT))
+        regressions = bench.compare_stats(stats, bench.load_baseline(name)["stats"], threshold)
+        assert regressions == []
+
+def test_compare_flags_regressions_beyond_noise():
+    base = {"k": {"median_ns": 1000, "iqr_ns": 50, "n": 5}}
+    assert bench.compare_stats({"k": {"median_ns": 1080, "iqr_ns": 10, "n": 5}}, base, 10) == []
+    # +30 % mais noyé dans le bruit (IQR 400)
+    assert bench.compare_stats({"k": {"median_ns": 1300, "iqr_ns": 400, "n": 5}}, base, 10) == []
+    [reg] = bench.compare_stats({"k": {"median_ns": 1300, "iqr_ns": 20, "n": 5}}, base, 10)
+    assert reg["key"] == "k" and reg["pct"] == 30.0
+
+def test_compare_flags_missing_and_failing_groups(tmp_path, capsys):
+    row = {"size": 3, "role": "generator", "algo": "Eller", "gen_source": "Eller", "time_ns": 0}
+    stats = bench.summarize([{**row, "ok": 0}, {**row, "ok": 0}])
+    assert stats["3|generator|Eller|Eller"] == {"median_ns": None, "iqr_ns": 0, "n": 0, "fail": 2}
+    base = {"3|generator|Eller|Eller": {"median_ns": 1000, "iqr_ns": 50, "n": 5},
+            "gone": {"median_ns": 1000, "iqr_ns": 50, "n": 5}}
+    assert [(r["key"], r["reason"]) for r in bench.compare_stats(stats, base)] == [
+        ("3|generator|Eller|Eller", "failing"), ("gone", "missing")]
+
+    common = ["--repeats", "1", "--generators", "kruskal", "--out", str(tmp_path / "b.csv")]
+    baseline = str(tmp_path / "n3.json")
+    assert bench.main(common + ["--sizes", "3", "--save-baseline", baseline]) == 0
+    assert bench.main(common + ["--sizes", "4", "--compare", baseline]) == 1
+    out = capsys.readouterr().out
+    assert "missing from this run" in out and "no group in common" in out
+
+def test_parallel_rows_match_sequential(fast_rows):
+    rows = bench.run_parallel(list(FAST_SIZES), seed=1, repeats=3, jobs=2,
+                              generators=FAST_GENERATORS)
+    assert _metrics(rows) == _metrics(fast_rows)
+
+def test_cached_rows_are_tagged_and_not_compared(tmp_path, capsys):
+    rows = bench.run_one(5, seed=1, repeats=1, generators=["kruskal"], cache=str(tmp_path / "cache"))
+    assert {r["role"] for r in rows} == {"cache", "cache_solver"}
+    common = ["--sizes", "3", "--repeats", "1", "--generators", "kruskal", "--out", str(tmp_path / "b.csv")]
+    baseline = str(tmp_path / "plain.json")
+    assert bench.main(common + ["--save-baseline", baseline]) == 0
+    assert bench.main(common + ["--cache", str(tmp_path / "cache"), "--compare", baseline]) == 2
+    assert "Compare refused" in capsys.readouterr().out
@@ -0,0 +1,47 @@
+import subprocess
+import sys
+from pathlib import Path
+from features.gen_kruskal import KruskalGenerator
+from utils import Maze
+from main import main
+
+MAIN = Path(__file__).resolve().parents[1] / "src" / "main.py"
+
+def imported_modules(*argv, cwd):
+    """Modules importés par `python -X importtime src/main.py argv...` (lus sur stderr)."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", str(MAIN), *argv],
+                          cwd=cwd, capture_output=True, text=True, check=True)
+    # lignes "import time: self [us] | cumulative | imported package"
+    return {line.rsplit("|", 1)[1].strip() for line in proc.stderr.splitlines()
+            if line.startswith("import time:") and line.count("|") == 2}
+
+def test_subcommands_import_only_what_they_use(tmp_path):
+    mods = imported_modules("generate", "--algo", "kruskal", "-n", "5", "--seed", "1",
+                            "--out", str(tmp_path / "m.maze"), cwd=tmp_path)
+    assert "features.gen_kruskal" in mods
+    for heavy in ("PIL", "menu", "visualize", "features.gen_backtrack", "features.solve_astar"):
+        assert heavy not in mods
+
+    mods = imported_modules("solve", str(tmp_path / "m.maze"), "--solver", "bidir", cwd=tmp_path)
+    assert "features.solve_bidir" in mods and "features.solve_astar" not in mods
+    assert "PIL" not in mods and "features.gen_kruskal" not in mods
+
+    mods = imported_modules("export", str(tmp_path / "m.maze"), "--out", str(tmp_path / "m.png"), cwd=tmp_path)
+    assert "features.export_img" in mods and "PIL" not in mods  # PNG en flux
+
+def test_generate_solve_export_round_trip(tmp_path, capsys):
+    maze_path, sol_path, png_path = tmp_path / "m.maze", tmp_path / "s.txt", tmp_path / "m.png"
+    assert main(["generate", "--algo", "kruskal", "-n", "9", "--seed", "4", "--out", str(maze_path)]) == 0
+    assert Maze.load(str(maze_path)) == KruskalGenerator(9, seed=4).generate()
+    assert main(["solve", str(maze_path), "--solver", "astar", "--out", str(sol_path)]) == 0
+    assert Maze.load(str(sol_path)).count("o") > 0
+    assert main(["export", str(sol_path), "--out", str(png_path), "--cell-size", "2"]) == 0
+    assert png_path.read_bytes().startswith(b"\x89PNG")
+
+    capsys.readouterr()
+    assert main(["generate", "--algo", "kruskal", "-n", "3", "--seed", "4"]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "".join(row) for row in KruskalGenerator(3, seed=4).generate().grid]
+    assert main(["solve", str(tmp_path / "absent.txt")]) == 2
+    assert main(["generate", "-n", "4", "--tiles", "0", "--out", str(tmp_path / "t.maze")]) == 2
+    assert not (tmp_path / "t.maze").exists()
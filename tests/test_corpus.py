@@ -0,0 +1,96 @@
+import sys
+from pathlib import Path
+import pytest
+from corpus import MazeCorpus, build_block, parse_corpus_ref, load_corpus_ref
+from features.gen_many import build_maze
+
+_SCRIPTS = str(Path(__file__).resolve().parents[1] / "scripts")
+if _SCRIPTS not in sys.path:
+    sys.path.insert(0, _SCRIPTS)
+import build_corpus
+import internal_bench as bench
+
+SPECS = [(algo, n, seed) for algo in ("backtrack", "kruskal", "eller")
+         for n in (1, 4, 9) for seed in (1, 2)]
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma"])
+def test_corpus_roundtrip_and_append(tmp_path, codec):
+    path = tmp_path / "c.amzc"
+    with MazeCorpus(path, "a", codec=codec) as corpus:
+        for spec in SPECS[:9]:
+            corpus.add_block(*build_block(*spec, codec=codec))
+    with MazeCorpus(path, "a", codec="zlib") as corpus:  # codec d'origine conservé
+        assert corpus.codec == codec
+        for spec in SPECS[9:]:
+            corpus.add(spec[0], spec[2], build_maze(spec))
+        with pytest.raises(ValueError):
+            corpus.add_block(*build_block(*SPECS[0], codec=codec))
+    with MazeCorpus(path) as corpus:
+        assert len(corpus) == len(SPECS)
+        for spec in reversed(SPECS):
+            assert corpus.get(*spec) == build_maze(spec)
+        with pytest.raises(KeyError):
+            corpus.get("kruskal", 4, 99)
+        with pytest.raises(ValueError):
+            corpus.add_block(*build_block(*SPECS[0]))
+
+def test_corpus_rejects_bad_file(tmp_path):
+    bad = tmp_path / "bad.amzc"
+    bad.write_bytes(b"not a corpus at all")
+    with pytest.raises(ValueError):
+        MazeCorpus(bad)
+
+def test_corpus_ref(tmp_path):
+    path = tmp_path / "refs.amzc"
+    with MazeCorpus(path, "a") as corpus:
+        corpus.add_block(*build_block("kruskal", 6, 3))
+    ref = f"{path}:kruskal:6:3"
+    assert parse_corpus_ref(ref) == (path, ("kruskal", 6, 3))
+    assert parse_corpus_ref("maze_5.txt") is None
+    assert load_corpus_ref(ref) == build_maze(("kruskal", 6, 3))
+
+def test_fill_corpus_parallel_and_bench(tmp_path):
+    path = tmp_path / "bench.amzc"
+    specs = [(algo, n, seed) for algo in ("backtrack", "kruskal") for n in (5, 8) for seed in (1, 2)]
+    assert build_corpus.fill_corpus(path, specs, jobs=2) == len(specs)
+    assert build_corpus.fill_corpus(path, specs) == 0  # déjà présents
+    rows = bench.run_one(5, seed=1, repeats=2, generators=["backtrack", "kruskal"], corpus=str(path))
+    generated = bench.run_one(5, seed=1, repeats=2, generators=["backtrack", "kruskal"])
+    assert all(r["ok"] == 1 for r in rows)
+    assert {r["role"] for r in rows} == {"corpus", "solver"}
+    skip = {"time_ns", "tracemalloc_peak_bytes", "rss_delta_bytes", "role"}
+    assert ([{k: v for k, v in r.items() if k not in skip} for r in rows]
+            == [{k: v for k, v in r.items() if k not in skip} for r in generated])
+
+def test_interrupted_append_keeps_last_index(tmp_path):
+    path = tmp_path / "crash.amzc"
+    specs = [("kruskal", 4, seed) for seed in range(6)]
+    with MazeCorpus(path, "a") as corpus:
+        for spec in specs[:4]:
+            corpus.add_block(*build_block(*spec))
+    corpus = MazeCorpus(path, "a")
+    corpus.add_block(*build_block(*specs[4]))
+    corpus._f.close()  # arrêt brutal : blocs écrits, index jamais réécrit
+    with MazeCorpus(path) as reader:
+        assert sorted(reader.keys()) == specs[:4]
+        assert all(reader.get(*s) == build_maze(s) for s in specs[:4])
+    with MazeCorpus(path, "a") as corpus:  # la fin orpheline est réécrite
+        for spec in specs[4:]:
+            corpus.add_block(*build_block(*spec))
+        corpus.flush()
+        corpus.add_block(*build_block("eller", 3, 1))
+    with MazeCorpus(path) as reader:
+        assert len(reader) == 7 and all(reader.get(*s) == build_maze(s) for s in specs)
+
+def test_corrupt_index_raises_value_error(tmp_path):
+    path = tmp_path / "bad_index.amzc"
+    with MazeCorpus(path, "a") as corpus:
+        corpus.add_block(*build_block("kruskal", 4, 1))
+    data = bytearray(path.read_bytes())
+    data[-16 - 40] = 0xFF  # premier octet du nom d'algo de l'unique entrée
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError):
+        MazeCorpus(path)
+    path.write_bytes(b"AMZ")  # en-tête tronqué
+    with pytest.raises(ValueError):
+        MazeCorpus(path)
@@ -0,0 +1,18 @@
+# tests/test_eller.py
+from features.gen_eller import EllerGenerator
+from features.solve_astar import AStarSolver
+from utils import Maze
+
+def test_eller_perfect_maze():
+    for n in (1, 2, 9):
+        maze = EllerGenerator(n, seed=4).generate()
+        assert maze.ascii_height == maze.ascii_width == 2 * n + 1
+        assert maze.grid[0][1] == "." and maze.grid[2 * n][2 * n - 1] == "."
+        # arbre couvrant : n² cellules + (n² - 1) murs ouverts + entrée/sortie
+        assert maze.count(".") == n * n + (n * n - 1) + 2
+        assert AStarSolver().solve(maze).grid[2 * n][2 * n - 1] == "o"
+
+def test_eller_stream_matches_generate(tmp_path):
+    gen = EllerGenerator(12, seed=8)
+    saved = gen.stream_txt(str(tmp_path / "eller.txt"))
+    assert Maze.load_txt(saved) == EllerGenerator(12, seed=8).generate()
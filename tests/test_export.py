@@ -0,0 +1,48 @@
+# tests/test_export.py
+import numpy as np
+from PIL import Image
+from features.export_img import AsciiExporter, COLOR_MAP
+from features.gen_backtrack import BacktrackingGenerator
+from features.solve_astar import AStarSolver
+from utils import Maze
+
+def _legacy_pixels(grid, cell_size, background):
+    # rendu de référence : l'ancienne boucle pixel par pixel
+    h, w = len(grid), len(grid[0])
+    out = np.zeros((h * cell_size, w * cell_size, 3), dtype=np.uint8)
+    for r in range(h):
+        for c in range(w):
+            color = COLOR_MAP.get(grid[r][c], background)
+            out[r * cell_size:(r + 1) * cell_size, c * cell_size:(c + 1) * cell_size] = color
+    return out
+
+def test_export_matches_legacy_rendering(tmp_path):
+    maze = AStarSolver().solve(BacktrackingGenerator(4, seed=1).generate())
+    maze.grid[1][1] = "?"  # caractère inconnu -> couleur de fond
+    expected = _legacy_pixels([list(r) for r in maze.grid], 3, (255, 0, 255))
+    for palette, mode in ((True, "P"), (False, "RGB")):
+        saved = AsciiExporter(cell_size=3, palette=palette).export(maze, tmp_path / f"m_{mode}")
+        with Image.open(saved) as img:
+            assert img.mode == mode
+            assert np.array_equal(np.asarray(img.convert("RGB")), expected)
+
+def test_export_jpeg_falls_back_to_rgb(tmp_path):
+    saved = AsciiExporter(cell_size=2).export(Maze.empty_from_n(2), tmp_path / "m.jpg")
+    with Image.open(saved) as img:
+        assert img.mode == "RGB"
+
+def test_export_stream_matches_export(tmp_path):
+    from features.gen_eller import EllerGenerator
+    maze = AStarSolver().solve(BacktrackingGenerator(5, seed=2).generate())
+    exporter = AsciiExporter(cell_size=2)
+    with Image.open(exporter.export(maze, tmp_path / "full.png")) as img:
+        expected = np.asarray(img.convert("RGB"))
+    mmap_maze = Maze.open_mmap(maze.save_bin(str(tmp_path / "m.maze")))
+    rows = ("".join(row) for row in maze.grid)  # itérateur de lignes, hauteur inconnue
+    for i, source in enumerate((maze, mmap_maze, rows)):
+        saved = exporter.export_stream(source, tmp_path / f"s{i}.png", strip_rows=3)
+        with Image.open(saved) as img:
+            assert np.array_equal(np.asarray(img.convert("RGB")), expected)
+    saved = exporter.export_stream(EllerGenerator(6, seed=1).iter_rows(), tmp_path / "e.png")
+    with Image.open(saved) as img:
+        assert img.size == (26, 26)
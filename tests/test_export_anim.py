@@ -0,0 +1,46 @@
+import numpy as np
+from PIL import Image
+from delta_trace import TraceRecorder, TraceReplayer
+from features.export_anim import AnimExporter
+from features.export_img import AsciiExporter
+from features.gen_backtrack import BacktrackingGenerator
+from features.solve_astar import AStarSolver
+from utils import Maze
+
+def _expected_states(initial, events, stride):
+    m = initial.copy()
+    states = [m.copy()]
+    for i, (r, c, ch) in enumerate(events, 1):
+        m.grid[r][c] = ch
+        if i % stride == 0 or i == len(events):
+            states.append(m.copy())
+    return states
+
+def _check_frames(path, states, cs):
+    ae = AsciiExporter(cell_size=cs)
+    with Image.open(path) as im:
+        assert im.n_frames == len(states)
+        for i, state in enumerate(states):
+            im.seek(i)
+            got = np.array(im.convert("RGB"))
+            assert (got == ae.colors[ae.render_indices(state.cells)]).all(), i
+
+def test_anim_export_gif_and_apng(tmp_path):
+    n, stride, cs = 12, 7, 2
+    events = []
+    BacktrackingGenerator(n, seed=1).generate(on_delta=lambda *e: events.append(e))
+    states = _expected_states(Maze.empty_from_n(n), events, stride)
+    for name in ("gen.gif", "gen.png"):
+        exporter = AnimExporter(cell_size=cs, stride=stride)
+        with exporter.open(Maze.empty_from_n(n), tmp_path / name) as anim:
+            BacktrackingGenerator(n, seed=1).generate(on_delta=anim)
+        _check_frames(tmp_path / name, states, cs)
+
+def test_anim_export_from_trace(tmp_path):
+    maze = BacktrackingGenerator(10, seed=4).generate()
+    events = []
+    with TraceRecorder(tmp_path / "s.mtrace", maze) as rec:
+        AStarSolver().solve(maze, on_delta=lambda *e: (rec(*e), events.append(e)))
+    out = AnimExporter(cell_size=1, stride=25).export_trace(TraceReplayer(tmp_path / "s.mtrace"),
+                                                            tmp_path / "s.gif")
+    _check_frames(out, _expected_states(maze, events, 25), 1)
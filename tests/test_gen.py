@@ -1,5 +1,6 @@
 # Tests unitaires pour les générateurs
 from features.gen_backtrack import BacktrackingGenerator
+from utils import Maze
 
 def test_ascii_size_and_cells():
     n = 5
@@ -14,3 +15,17 @@ def test_ascii_size_and_cells():
     assert maze.grid[0][1] == "."
     assert maze.grid[2*n][2*n-1] == "."
 
+
+def test_backtracking_fast_mode():
+    from tree_index import MazeTreeIndex
+    for n in (1, 2, 13):
+        maze = BacktrackingGenerator(n, seed=3, fast=True).generate()
+        assert maze == BacktrackingGenerator(n, seed=3, fast=True).generate()
+        # arbre couvrant : n² cellules + (n² - 1) murs ouverts + entrée/sortie
+        assert maze.count(".") == n * n + (n * n - 1) + 2
+        MazeTreeIndex.from_maze(maze)
+        assert BacktrackingGenerator(n, seed=3, fast=True).generate_walls().to_maze() == maze
+    rebuilt = Maze.empty_from_n(13)
+    def on_delta(r, c, ch):
+        rebuilt.cells[r, c] = ord(ch)
+    assert BacktrackingGenerator(13, seed=3, fast=True).generate(on_delta=on_delta) == maze == rebuilt
@@ -0,0 +1,25 @@
+import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import pytest
+from features.gen_backtrack import BacktrackingGenerator
+from features.gen_many import generate_many
+
+SPECS = [(algo, n, seed) for algo in ("backtrack", "kruskal", "eller")
+         for n in (3, 8) for seed in (1, 2, 3)]
+
+def test_generators_ignore_global_random():
+    a = BacktrackingGenerator(10, seed=5).generate()
+    random.seed(123)
+    random.random()
+    assert BacktrackingGenerator(10, seed=5).generate() == a
+
+def test_generate_many_deterministic_across_executors():
+    expected = generate_many(SPECS)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        assert generate_many(SPECS * 3, executor=pool) == expected * 3
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        assert generate_many(SPECS, executor=pool) == expected
+
+def test_generate_many_rejects_unknown_algo():
+    with pytest.raises(ValueError):
+        generate_many([("prim", 5, 1)])
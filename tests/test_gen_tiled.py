@@ -0,0 +1,31 @@
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+from features.gen_tiled import TiledGenerator
+from tree_index import MazeTreeIndex
+from utils import Maze
+
+@pytest.mark.parametrize("base", ["backtrack", "kruskal", "eller", "sidewinder", "backtrack_fast"])
+def test_tiled_is_perfect_maze(base):
+    for n, k in ((1, 1), (6, 2), (12, 3), (10, 5)):
+        maze = TiledGenerator(n, k, base=base, seed=4).generate()
+        assert maze.ascii_height == maze.ascii_width == 2 * n + 1
+        assert maze.grid[0][1] == "." and maze.grid[2 * n][2 * n - 1] == "."
+        # arbre couvrant : n² cellules + (n² - 1) murs ouverts + entrée/sortie
+        assert maze.count(".") == n * n + (n * n - 1) + 2
+        MazeTreeIndex.from_maze(maze)  # lève ValueError si boucle ou cellule isolée
+
+def test_tiled_deterministic_across_pools():
+    expected = TiledGenerator(24, 4, seed=11).generate()
+    assert TiledGenerator(24, 4, seed=11, jobs=2).generate() == expected
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        assert TiledGenerator(24, 4, seed=11, executor=pool).generate() == expected
+    rebuilt = Maze.empty_from_n(24)
+    def on_delta(r, c, ch):
+        rebuilt.cells[r, c] = ord(ch)
+    assert TiledGenerator(24, 4, seed=11).generate(on_delta=on_delta) == expected == rebuilt
+
+def test_tiled_rejects_bad_tiling():
+    with pytest.raises(ValueError):
+        TiledGenerator(10, 3)
+    with pytest.raises(ValueError):
+        TiledGenerator(10, 2, base="prim")
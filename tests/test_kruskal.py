@@ -16,3 +16,12 @@ def test_kruskal_basic():
         for c in range(n):
             ar, ac = 2*r + 1, 2*c + 1
             assert maze.grid[ar][ac] == "."
+
+def test_kruskal_fast_mode():
+    n = 12
+    maze = KruskalGenerator(n, seed=7, fast=True).generate()
+    assert maze == KruskalGenerator(n, seed=7, fast=True).generate()
+    # arbre couvrant : n² cellules + (n² - 1) murs ouverts + entrée/sortie
+    assert maze.count(".") == n * n + (n * n - 1) + 2
+    walls = KruskalGenerator(n, seed=7, fast=True).generate_walls()
+    assert walls.to_maze() == maze
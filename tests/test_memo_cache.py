@@ -0,0 +1,56 @@
+import pytest
+from features.gen_kruskal import KruskalGenerator
+from features.gen_backtrack import BacktrackingGenerator
+from features.solve_astar import AStarSolver
+from memo_cache import MemoCache, maze_key
+
+def test_maze_memo_two_levels(tmp_path):
+    cache = MemoCache(disk_dir=tmp_path)
+    expected = KruskalGenerator(12, seed=4).generate()
+    assert cache.maze(KruskalGenerator(12, seed=4)) == expected
+    got = cache.maze(KruskalGenerator(12, seed=4))
+    assert got == expected
+    got.mark([(1, 1)], "o")  # copie : le cache n'est pas touché
+    assert cache.maze(KruskalGenerator(12, seed=4)) == expected
+    assert (cache.hits, cache.disk_hits, cache.misses) == (2, 0, 1)
+    # variante fast : autre clé
+    assert maze_key(KruskalGenerator(12, seed=4, fast=True)) != maze_key(KruskalGenerator(12, seed=4))
+    # sans seed : jamais mis en cache
+    cache.maze(BacktrackingGenerator(5))
+    assert cache.misses == 1
+
+    cold = MemoCache(disk_dir=tmp_path)  # nouveau processus : niveau disque
+    assert cold.maze(KruskalGenerator(12, seed=4)) == expected
+    assert (cold.hits, cold.disk_hits, cold.misses) == (0, 1, 0)
+
+def test_solution_memo_and_byte_budget(tmp_path):
+    mazes = [KruskalGenerator(10, seed=s).generate() for s in range(4)]
+    size = mazes[0].cells.nbytes
+    cache = MemoCache(max_bytes=2 * size, disk_dir=None)
+    for m in mazes:
+        assert cache.solve(AStarSolver(), m) == AStarSolver().solve(m)
+    assert cache.evictions == 2 and cache.bytes == 2 * size
+    cache.solve(AStarSolver(), mazes[3])
+    assert cache.stats()["hits"] == 1
+
+def test_version_bump_invalidates(tmp_path, monkeypatch):
+    cache = MemoCache(disk_dir=tmp_path)
+    cache.maze(BacktrackingGenerator(6, seed=1))
+    monkeypatch.setattr(BacktrackingGenerator, "VERSION", BacktrackingGenerator.VERSION + 1)
+    cache.maze(BacktrackingGenerator(6, seed=1))
+    assert cache.misses == 2
+    assert cache.prune([BacktrackingGenerator]) == 1
+    assert len(list(tmp_path.glob("mazes/*.maze"))) == 1
+
+def test_rejects_negative_budget():
+    with pytest.raises(ValueError):
+        MemoCache(max_bytes=-1)
+
+def test_tiled_key_includes_tiles_and_base(tmp_path):
+    from features.gen_tiled import TiledGenerator
+    cache = MemoCache(disk_dir=tmp_path)
+    a = cache.maze(TiledGenerator(12, 4, base="kruskal", seed=1))
+    b = cache.maze(TiledGenerator(12, 2, base="eller", seed=1))
+    assert a != b and b == TiledGenerator(12, 2, base="eller", seed=1).generate()
+    assert cache.misses == 2
+    assert cache.prune([TiledGenerator]) == 0  # clé relue correctement par prune
@@ -0,0 +1,133 @@
+import asyncio
+import base64
+import json
+import multiprocessing
+from features.gen_kruskal import KruskalGenerator
+from utils import Maze
+from service import MazeService, connect, request
+
+def serve(coro_fn, **kw):
+    """Lance un service local (port libre), exécute coro_fn(service) puis l'arrête."""
+    async def main():
+        service = MazeService(port=0, **kw)
+        await service.start()
+        try:
+            return await coro_fn(service)
+        finally:
+            await service.close()
+    return asyncio.run(main())
+
+def test_generate_solve_export_round_trip():
+    async def scenario(service):
+        r, w = await connect(port=service.port)
+        gen = await request(r, w, {"id": 1, "op": "generate", "algo": "kruskal", "n": 8, "seed": 3})
+        sol = await request(r, w, {"id": 2, "op": "solve", "solver": "bidir", "spec": ["kruskal", 8, 3]})
+        png = await request(r, w, {"id": 3, "op": "export", "spec": ["eller", 20, 1], "cell_size": 2})
+        w.close()
+        return gen, sol, png
+
+    (head, chunks), (shead, schunks), (phead, pchunks) = serve(scenario, workers=1)
+    rows = [row for c in chunks for row in c["rows"]]
+    assert head["status"] == 200 and head["id"] == 1
+    assert Maze(rows) == KruskalGenerator(8, seed=3).generate()
+    assert shead["path_length"] > 0 and "o" in "".join(r for c in schunks for r in c["rows"])
+    data = b"".join(base64.b64decode(c["data"]) for c in pchunks)
+    assert data.startswith(b"\x89PNG") and len(data) == phead["bytes"]
+
+def blocked(scenario_fn, **kw):
+    """
+    Comme serve, mais l'unique worker reste occupé par une tâche qui attend un
+    événement pendant scenario_fn(service) : 429 / 408 sans course.
+    """
+    with multiprocessing.Manager() as manager:
+        gate = manager.Event()
+        async def scenario(service):
+            held = asyncio.get_running_loop().run_in_executor(service._pool, gate.wait, 30)
+            try:
+                return await scenario_fn(service)
+            finally:
+                gate.set()
+                await held
+        return serve(scenario, workers=1, **kw)
+
+def test_backpressure_rejects_with_429():
+    async def scenario(service):
+        (r1, w1), (r2, w2) = await connect(port=service.port), await connect(port=service.port)
+        w1.write(b'{"id": 1, "op": "generate", "n": 5}\n')  # admise, bloquée derrière le worker occupé
+        await w1.drain()
+        while service.in_flight == 0:
+            await asyncio.sleep(0.01)
+        busy = await request(r2, w2, {"id": 2, "op": "generate", "n": 5})
+        w1.close(); w2.close()
+        return busy
+
+    head, _ = blocked(scenario, queue_size=0)
+    assert head["status"] == 429 and not head["ok"]
+
+def test_timeout_and_bad_requests():
+    async def scenario(service):
+        r, w = await connect(port=service.port)
+        slow = await request(r, w, {"id": 1, "op": "generate", "n": 5})  # attend le worker occupé
+        bad_op = await request(r, w, {"id": 2, "op": "nope"})
+        bad_n = await request(r, w, {"id": 3, "op": "generate", "n": -1})
+        w.write(b"pas du json\n")
+        await w.drain()
+        bad_json = await request(r, w, {"id": 4, "op": "stats"})  # lit la réponse d'erreur
+        stats = await request(r, w, {"id": 5, "op": "stats"})
+        w.close()
+        return slow, bad_op, bad_n, bad_json, stats
+
+    slow, bad_op, bad_n, bad_json, stats = blocked(scenario, timeout=0.2)
+    assert slow[0]["status"] == 408
+    assert bad_op[0]["status"] == 400 and bad_n[0]["status"] == 400
+    assert bad_json[0]["status"] == 400 and bad_json[0]["id"] is None
+    assert stats[0]["timeout"] == 1 and stats[0]["error"] == 3
+
+def test_bad_seed_is_rejected_with_400():
+    async def scenario(service):
+        r, w = await connect(port=service.port)
+        gen = await request(r, w, {"id": 1, "op": "generate", "n": 3, "seed": [1]})
+        spec = await request(r, w, {"id": 2, "op": "solve", "spec": ["kruskal", 3, "x"]})
+        flag = await request(r, w, {"id": 3, "op": "generate", "n": True})
+        w.close()
+        return gen, spec, flag
+
+    for head, _ in serve(scenario, workers=1):
+        assert head["status"] == 400 and not head["ok"]
+
+def test_non_ascii_maze_is_rejected_and_chunk_failure_closes(monkeypatch):
+    import service
+
+    def broken_chunks(path, width, step):
+        raise OSError("lecture impossible")
+        yield
+
+    async def scenario(service_):
+        r, w = await connect(port=service_.port)
+        bad = await request(r, w, {"id": 1, "op": "solve", "maze": ["#é#", "#.#", "###"]})
+        monkeypatch.setattr(service, "_grid_chunks", broken_chunks)
+        w.write(b'{"id": 2, "op": "generate", "n": 3}\n')
+        await w.drain()
+        head = json.loads(await r.readline())
+        eof = await asyncio.wait_for(r.readline(), 5)
+        w.close()
+        return bad, head, eof
+
+    (bad, _), head, eof = serve(scenario, workers=1)
+    assert bad["status"] == 400
+    assert head["status"] == 200 and head["chunks"] == 1 and eof == b""
+
+def test_oversized_maze_is_rejected(monkeypatch):
+    import service
+    monkeypatch.setattr(service, "MAX_N", 2)  # côté 5 au plus
+
+    async def scenario(service_):
+        r, w = await connect(port=service_.port)
+        tall = await request(r, w, {"id": 1, "op": "solve", "maze": ["###"] * 6})
+        wide = await request(r, w, {"id": 2, "op": "export", "maze": ["#" * 6] * 3})
+        ok = await request(r, w, {"id": 3, "op": "solve", "maze": ["#####", "..#..", "#####"]})
+        w.close()
+        return tall, wide, ok
+
+    (tall, _), (wide, _), (ok, _) = serve(scenario, workers=1)
+    assert tall["status"] == 400 and wide["status"] == 400 and ok["status"] != 400
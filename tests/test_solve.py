@@ -12,3 +12,37 @@ def test_solver_marks_path():
     # Il doit exister au moins un 'o' entre les deux
     inner_o = sum(ch == "o" for row in solved.grid for ch in row)
     assert inner_o >= 2
+
+def test_solver_callbacks_match_fast_path():
+    from features.solve_astar import AStarSolver
+    maze = BacktrackingGenerator(8, seed=3).generate()
+    for solver in (BacktrackingSolver(), AStarSolver()):
+        steps = []
+        slow = solver.solve(maze, on_visit=lambda g: steps.append(1), on_path=lambda g: steps.append(1))
+        assert slow == solver.solve(maze)
+        assert len(steps) > 0
+    # labyrinthe parfait : chemin unique, DFS et A* marquent les mêmes cases 'o'
+    assert BacktrackingSolver().solve(maze).count("o") == AStarSolver().solve(maze).count("o")
+
+def test_solver_open_room():
+    from features.solve_astar import AStarSolver
+    from utils import Maze
+    # grille hors treillis (salle ouverte) : chemin générique du noyau
+    rows = ["#.###", "#...#", "#...#", "###.#"]
+    for solver in (BacktrackingSolver(), AStarSolver()):
+        solved = solver.solve(Maze([list(r) for r in rows]))
+        assert solved.grid[0][1] == "o" and solved.grid[3][3] == "o"
+    assert AStarSolver().solve(Maze([list(r) for r in rows])).count("o") == 6
+
+def test_bidirectional_solver_shortest_path():
+    from features.gen_kruskal import KruskalGenerator
+    from features.solve_astar import AStarSolver
+    from features.solve_bidir import BidirectionalSolver
+    from wallset import WallSet
+    for n in (1, 2, 9):
+        maze = KruskalGenerator(n, seed=n).generate()
+        solved = BidirectionalSolver().solve(maze)
+        assert solved.grid[0][1] == "o" and solved.grid[2*n][2*n-1] == "o"
+        assert solved.count("o") == AStarSolver().solve(maze).count("o")
+        walls = WallSet.from_maze(maze)
+        assert BidirectionalSolver().solve_walls(walls) == AStarSolver().solve_walls(walls)
@@ -0,0 +1,46 @@
+import numpy as np
+from features.gen_kruskal import KruskalGenerator
+from features.solve_batch import BatchSolver
+from features.solve_bidir import BidirectionalSolver
+from tree_index import MazeTreeIndex
+
+def test_batch_solver_matches_single_solve():
+    n = 10
+    maze = KruskalGenerator(n, seed=4).generate()
+    H, W = maze.ascii_height, maze.ascii_width
+    solver = BatchSolver()
+    [path] = solver.solve_many(maze, [((0, 1), (H - 1, W - 2))])
+    assert tuple(path[0]) == (0, 1) and tuple(path[-1]) == (H - 1, W - 2)
+    expected = np.argwhere(BidirectionalSolver().solve(maze).cells == ord("o"))
+    assert sorted(map(tuple, path.tolist())) == sorted(map(tuple, expected.tolist()))
+
+def test_batch_solver_groups_and_caches():
+    n = 10
+    maze = KruskalGenerator(n, seed=4).generate()
+    index = MazeTreeIndex.from_maze(maze)
+    hub = (1, 1)
+    targets = [(2 * r + 1, 2 * c + 1) for r in range(n) for c in range(0, n, 3)]
+    queries = [(t, hub) for t in targets]  # l'arrivée commune sert de source
+    solver = BatchSolver()
+    paths = solver.solve_many(maze, queries)
+    assert solver.misses == 1
+    for (a, b), p in zip(queries, paths):
+        assert tuple(p[0]) == a and tuple(p[-1]) == b
+        assert len(p) - 1 == 2 * index.distance((a[0] // 2, a[1] // 2), (0, 0))
+    assert list(solver.distances(maze, queries)) == [len(p) - 1 for p in paths]
+    assert solver.misses == 1 and solver.hits == 1
+    # mur : aucun chemin
+    assert len(solver.solve_many(maze, [((0, 0), hub)])[0]) == 0
+
+def test_batch_cache_bounded_in_bytes(monkeypatch):
+    maze = KruskalGenerator(10, seed=4).generate()
+    calls = []
+    monkeypatch.setattr(type(maze), "fingerprint", lambda self: calls.append(1) or "fp")
+    size = BatchSolver().field(maze, (1, 1), "x").nbytes
+    solver = BatchSolver(max_bytes=2 * size)
+    sources = [(1, 1), (1, 3), (3, 1)]
+    solver.solve_many(maze, [(s, (19, 19 - 4 * i - 2 * k)) for i, s in enumerate(sources) for k in range(2)])
+    assert len(calls) == 1  # empreinte calculée une fois par lot
+    assert solver.misses == 3 and solver.bytes == 2 * size
+    solver.distances(maze, [((1, 1), (19, 19)), ((1, 1), (19, 1))])  # la plus ancienne a été évincée
+    assert solver.misses == 4
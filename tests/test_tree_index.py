@@ -0,0 +1,48 @@
+import random
+import pytest
+from features.gen_backtrack import BacktrackingGenerator
+from features.gen_kruskal import KruskalGenerator
+from features.solve_astar import AStarSolver
+from tree_index import MazeTreeIndex, index_path
+from wallset import WallSet
+
+def test_tree_index_queries():
+    n = 12
+    maze = KruskalGenerator(n, seed=5).generate()
+    walls = WallSet.from_maze(maze)
+    index = MazeTreeIndex.from_maze(maze)
+    corner = index.path((0, 0), (n - 1, n - 1))
+    assert corner == AStarSolver().solve_walls(walls)
+    assert index.distance((0, 0), (n - 1, n - 1)) == len(corner) - 1
+
+    rng = random.Random(0)
+    pairs = [((rng.randrange(n), rng.randrange(n)), (rng.randrange(n), rng.randrange(n)))
+             for _ in range(200)]
+    dists = index.distances(pairs)
+    for (a, b), d in zip(pairs, dists):
+        p = index.path(a, b)
+        assert p[0] == a and p[-1] == b and len(p) - 1 == d == index.distance(a, b)
+        # pas consécutifs = voisins logiques reliés
+        assert all(b2 in [divmod(j, n) for j in walls.neighbors(a2[0] * n + a2[1])]
+                   for a2, b2 in zip(p, p[1:]))
+    # chemin ASCII : entièrement dans les couloirs
+    assert all(maze.grid[r][c] == "." for r, c in index.ascii_path((0, 0), (n - 1, n - 1)))
+
+def test_tree_index_rejects_loops():
+    maze = BacktrackingGenerator(4, seed=1).generate()
+    maze.cells[1:-1, 1:-1] = ord(".")
+    with pytest.raises(ValueError):
+        MazeTreeIndex.from_maze(maze)
+
+def test_tree_index_persistence(tmp_path):
+    maze_file = tmp_path / "m.txt"
+    maze = BacktrackingGenerator(8, seed=2).generate()
+    maze.save_txt(str(maze_file))
+    index = MazeTreeIndex.for_maze_file(maze_file)
+    assert index_path(maze_file).exists()
+    again = MazeTreeIndex.for_maze_file(maze_file)
+    assert again.fingerprint == index.fingerprint
+    assert again.path((0, 0), (7, 7)) == index.path((0, 0), (7, 7))
+    other = WallSet.from_maze(BacktrackingGenerator(8, seed=3).generate())
+    with pytest.raises(ValueError):
+        MazeTreeIndex.load(index_path(maze_file), other)
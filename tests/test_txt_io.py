@@ -0,0 +1,60 @@
+# tests/test_txt_io.py
+# Codec texte en bloc : compatibilité octet à octet + benchmark vs l'ancien chemin par ligne
+# (benchmark opt-in, chronométrage instable sur machine chargée : MAZES_BENCH=1 pytest tests/test_txt_io.py)
+import os
+import time
+from pathlib import Path
+import pytest
+from utils import Maze
+from features.gen_kruskal import KruskalGenerator
+from features.gen_binary_tree import BinaryTreeGenerator
+
+def _legacy_save(grid, filename):
+    with open(filename, "w", encoding="utf-8") as f:
+        for row in grid:
+            f.write("".join(row) + "\n")
+
+def _legacy_load(filename):
+    with open(filename, "r", encoding="utf-8") as f:
+        return [list(line.rstrip("\n")) for line in f]
+
+def _best_of(fn, repeats=5):
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+def test_txt_byte_compatible(tmp_path):
+    maze = KruskalGenerator(30, seed=1, fast=True).generate()
+    legacy = tmp_path / "legacy.txt"
+    _legacy_save([list(row) for row in maze.grid], legacy)
+    saved = maze.save_txt(str(tmp_path / "bulk.txt"))
+    assert Path(saved).read_bytes() == legacy.read_bytes()
+    assert Maze.load_txt(str(legacy)) == maze
+    # CRLF et dernière fin de ligne absente acceptées
+    crlf = tmp_path / "crlf.txt"
+    crlf.write_bytes(legacy.read_bytes().replace(b"\n", b"\r\n").rstrip(b"\r\n"))
+    assert Maze.load_txt(str(crlf)) == maze
+
+def test_txt_ragged_file_rejected(tmp_path):
+    bad = tmp_path / "bad.txt"
+    bad.write_text("###\n#.\n###\n")
+    with pytest.raises(ValueError, match="ligne 1"):
+        Maze.load_txt(str(bad))
+
+def test_txt_round_trip_n1000(tmp_path):
+    maze = BinaryTreeGenerator(1000, seed=2).generate()
+    path = maze.save_txt(str(tmp_path / "big.txt"))
+    assert Maze.load_txt(path) == maze
+
+@pytest.mark.skipif(not os.environ.get("MAZES_BENCH"), reason="benchmark opt-in (MAZES_BENCH=1)")
+def test_txt_bulk_speedup_n1000(tmp_path):
+    maze = Maze.empty_from_n(1000)
+    grid = [list(row) for row in maze.grid]
+    path = str(tmp_path / "big.txt")
+    legacy = _best_of(lambda: _legacy_save(grid, path)) + _best_of(lambda: _legacy_load(path))
+    bulk = _best_of(lambda: maze.save_txt(path)) + _best_of(lambda: Maze.load_txt(path))
+    assert Maze.load_txt(path) == maze
+    assert legacy / bulk >= 10, f"speed-up x{legacy / bulk:.1f} seulement"
@@ -1 +1,58 @@
 # Tests unitaires pour les fonctions utilitaires
+import numpy as np
+from utils import Maze
+from features.gen_backtrack import BacktrackingGenerator
+from features.solve_astar import AStarSolver
+
+def test_maze_numpy_backend():
+    maze = Maze.empty_from_n(3)
+    assert maze.cells.dtype == np.uint8
+    assert maze.cells.shape == (7, 7)
+    assert maze.count(".") == 9
+    assert maze.counts() == {"#": 40, ".": 9}
+
+def test_grid_view_compat():
+    maze = Maze.empty_from_n(2)
+    maze.grid[0][1] = "."
+    assert maze.grid[0][1] == "."
+    assert maze.grid[0][:3] == ["#", ".", "#"]
+    assert ["".join(row) for row in maze.grid][0] == "#.###"
+    assert Maze([list(r) for r in ["#.#", "###"]]).grid[1][2] == "#"
+
+def test_copy_eq_mark_replace():
+    maze = BacktrackingGenerator(4, seed=1).generate()
+    clone = maze.copy()
+    assert clone == maze and clone.cells is not maze.cells
+    clone.mark([(0, 1), (8, 7)], "o")
+    assert clone != maze
+    assert clone.count("o") == 2
+    solved = AStarSolver().solve(maze)
+    solved.replace("o*", ".")
+    assert solved == maze
+
+def test_binary_maze_mmap_roundtrip(tmp_path):
+    from utils import read_maze_header, resolve_maze_file, txt_to_bin, bin_to_txt
+    maze = BacktrackingGenerator(6, seed=2).generate()
+    saved = maze.save_bin(str(tmp_path / "m.maze"), generator="Backtracking", seed=2)
+    header = read_maze_header(saved)
+    assert (header["height"], header["width"], header["seed"]) == (13, 13, 2)
+    assert header["generator"] == "Backtracking"
+    mm = Maze.open_mmap(saved)
+    assert isinstance(mm.cells, np.memmap) and mm == maze
+    assert AStarSolver().solve(mm) == AStarSolver().solve(maze)
+    assert resolve_maze_file(str(tmp_path / "m")) == saved
+    # conversions .txt <-> .maze
+    txt = maze.save_txt(str(tmp_path / "t.txt"))
+    assert Maze.load(txt_to_bin(txt)) == maze
+    assert Maze.load_txt(bin_to_txt(saved, tmp_path / "back.txt")) == maze
+
+def test_grid_view_is_cached_and_follows_cells():
+    import pickle
+    m = Maze.empty_from_n(2)
+    view = m.grid
+    assert m.grid is view and m.grid[1] is view[1]
+    view[1][1] = "."
+    assert m.cells[1, 1] == ord(".")
+    m.grid = [["#", "."], [".", "#"]]  # cells réaffecté : nouvelle vue
+    assert m.grid is not view and m.grid[0][1] == "."
+    assert "_grid_view" not in pickle.loads(pickle.dumps(m)).__dict__
@@ -0,0 +1,29 @@
+# tests/test_vectorized_gen.py
+import pytest
+from features.gen_binary_tree import BinaryTreeGenerator
+from features.gen_sidewinder import SidewinderGenerator
+from features.solve_bidir import BidirectionalSolver
+from tree_index import MazeTreeIndex
+from utils import Maze
+
+@pytest.mark.parametrize("gen_cls", [BinaryTreeGenerator, SidewinderGenerator])
+def test_vectorized_perfect_maze(gen_cls):
+    for n in (1, 2, 3, 17):
+        maze = gen_cls(n, seed=5).generate()
+        assert maze.ascii_height == maze.ascii_width == 2 * n + 1
+        # arbre couvrant : n² cellules + (n² - 1) murs ouverts + entrée/sortie
+        assert maze.count(".") == n * n + (n * n - 1) + 2
+        MazeTreeIndex.from_maze(maze)  # lève ValueError si boucle ou cellule isolée
+        assert BidirectionalSolver().solve(maze).grid[2 * n][2 * n - 1] == "o"
+    assert gen_cls(17, seed=5).generate() == maze
+    assert gen_cls(17, seed=5).generate_walls().to_maze() == maze
+
+@pytest.mark.parametrize("gen_cls", [BinaryTreeGenerator, SidewinderGenerator])
+def test_vectorized_callbacks_replay(gen_cls):
+    n = 6
+    steps, rebuilt = [], Maze.empty_from_n(n)
+    def on_delta(r, c, ch):
+        rebuilt.cells[r, c] = ord(ch)
+    maze = gen_cls(n, seed=2).generate(on_step=lambda g: steps.append(1), on_delta=on_delta)
+    assert maze == rebuilt == gen_cls(n, seed=2).generate()
+    assert len(steps) == n * n - 1 + 2
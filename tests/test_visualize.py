@@ -0,0 +1,28 @@
+import io
+from features.gen_backtrack import BacktrackingGenerator
+from utils import Maze
+from visualize import AnsiRenderer, ConsoleAnimator
+
+def test_renderer_emits_only_changed_cells():
+    out = io.StringIO()
+    r = AnsiRenderer(out=out, max_fps=0)
+    grid = [list("#####"), list("#...#"), list("#####")]
+    assert r.draw(grid, "t")
+    first = out.getvalue()
+    assert first.startswith("\x1b[2J") and "#...#" in first
+    grid[1][2] = "*"
+    r.draw(grid, "t")
+    delta = out.getvalue()[len(first):]
+    assert delta == "\x1b[3;3H*"  # ligne 1 de la grille = ligne écran 3 (titre en 1)
+    r.draw(grid, "t")
+    assert out.getvalue()[len(first) + len(delta):] == ""  # rien n'a changé
+
+def test_renderer_throttles_and_flushes_final_frame():
+    out = io.StringIO()
+    anim = ConsoleAnimator(title="gen", renderer=AnsiRenderer(out=out, max_fps=1e-6))
+    maze = BacktrackingGenerator(6, seed=1).generate(on_step=anim)
+    r = anim.renderer
+    assert r.frames == 1 and r.skipped > 10
+    anim.close()
+    assert r.frames == 2
+    assert Maze(r._prev) == maze  # la dernière frame affichée = état final
@@ -0,0 +1,39 @@
+# tests/test_wallset.py
+from features.gen_backtrack import BacktrackingGenerator
+from features.gen_kruskal import KruskalGenerator
+from features.solve_backtrack import BacktrackingSolver
+from features.solve_astar import AStarSolver
+from wallset import WallSet
+
+def test_wallset_roundtrip_and_generators():
+    for gen in (BacktrackingGenerator(7, seed=3), KruskalGenerator(7, seed=3)):
+        walls = gen.generate_walls()
+        assert walls.nbytes == (7 * 7 + 3) // 4
+        assert walls.to_maze() == gen.generate()
+        assert WallSet.from_maze(walls.to_maze()) == walls
+
+def test_solvers_on_wallset():
+    n = 6
+    walls = KruskalGenerator(n, seed=5).generate_walls()
+    path = AStarSolver().solve_walls(walls)
+    assert path[0] == (0, 0) and path[-1] == (n - 1, n - 1)
+    # labyrinthe parfait : chemin unique, DFS et A* doivent coïncider
+    assert BacktrackingSolver().solve_walls(walls) == path
+    solved = AStarSolver().solve(walls.to_maze())
+    assert solved.count("o") == 2 * len(path) + 1
+
+def test_fast_generate_walls_compact():
+    import tracemalloc
+    from features.solve_bidir import BidirectionalSolver
+    n = 150
+    for gen in (BacktrackingGenerator(n, seed=2, fast=True), KruskalGenerator(n, seed=2, fast=True)):
+        assert gen.generate_walls().to_maze() == gen.generate()
+    # backtracking : murs + directions d'arrivée (2 bits) + visités (1 bit), ni pile ni grille ASCII
+    gen = BacktrackingGenerator(n, seed=2, fast=True)
+    tracemalloc.start()
+    walls = gen.generate_walls()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < 4 * walls.nbytes
+    path = AStarSolver().solve_walls(walls)
+    assert BacktrackingSolver().solve_walls(walls) == BidirectionalSolver().solve_walls(walls) == path